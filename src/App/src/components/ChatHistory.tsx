@@ -192,6 +192,7 @@ export const ChatHistory = React.memo(function ChatHistory({
               icon={<MoreHorizontal20Regular />}
               size="small"
               title="More options"
+              data-testid="chat-history-more"
               disabled={isGenerating}
               style={{ 
                 minWidth: '24px', 
@@ -438,6 +439,8 @@ const ConversationItem = React.memo(function ConversationItem({
   return (
     <>
       <div
+        data-testid="chat-history-item"
+        aria-current={isActive ? 'true' : undefined}
         onClick={disabled ? undefined : onSelect}
         style={{
           padding: '8px',
@@ -481,6 +484,7 @@ const ConversationItem = React.memo(function ConversationItem({
               appearance="subtle"
               icon={<MoreHorizontal20Regular />}
               size="small"
+              data-testid="chat-item-more"
               onClick={(e) => {
                 e.stopPropagation();
               }}
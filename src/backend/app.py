@@ -13,7 +13,9 @@ import uuid
 from datetime import datetime, timezone
 from typing import Dict, Any
 
+import orjson
 from quart import Quart, request, jsonify, Response
+from quart.json.provider import DefaultJSONProvider
 from quart_cors import cors
 from opentelemetry import trace
 
@@ -53,8 +55,47 @@ logging.info(
 
 logger = logging.getLogger(__name__)
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes with orjson, falling back to Quart's defaults for unknown types.
+
+    Non-ASCII text is written as UTF-8 rather than ``\\u`` escapes. Arguments
+    orjson cannot express (``ensure_ascii=True``, an indent other than 2,
+    custom separators or decoder hooks) are handed to the stdlib provider.
+    """
+
+    ensure_ascii = False
+
+    # Keyword arguments orjson can honour; any other one falls back to the stdlib
+    _ORJSON_DUMPS_KWARGS = frozenset({"default", "ensure_ascii", "indent", "separators", "sort_keys"})
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        indent = kwargs.get("indent")
+        if (
+            kwargs.get("ensure_ascii", self.ensure_ascii)
+            or indent not in (None, 2)
+            or kwargs.get("separators") not in (None, (",", ":"))
+            or not kwargs.keys() <= self._ORJSON_DUMPS_KWARGS
+        ):
+            return super().dumps(obj, **kwargs)
+
+        # Datetimes go through ``default`` so responses keep Quart's HTTP-date format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=kwargs.get("default", self.default), option=option).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
 # Create Quart app
 app = Quart(__name__)
+app.json = OrjsonProvider(app)
 app = cors(app, allow_origin="*")
 
 # Check if the Application Insights connection string is set in the environment variables
@@ -10,8 +10,9 @@ This module defines Pydantic models for:
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from typing import List, Optional, Tuple
+from pydantic import BaseModel, Field, PrivateAttr
+from pydantic.dataclasses import dataclass
 
 
 class ComplianceSeverity(str, Enum):
@@ -21,8 +22,15 @@ class ComplianceSeverity(str, Enum):
     INFO = "info"        # Style suggestion - optional
 
 
-class ComplianceViolation(BaseModel):
-    """A single compliance violation with severity and suggested fix."""
+@dataclass(slots=True, frozen=True)
+class ComplianceViolation:
+    """
+    A single compliance violation with severity and suggested fix.
+
+    A slotted Pydantic dataclass rather than a model, as a compliance pass can
+    emit many of these; fields are validated on direct construction too, so a
+    raw ``"error"`` severity becomes ``ComplianceSeverity.ERROR``.
+    """
     severity: ComplianceSeverity
     message: str
     suggestion: str
@@ -30,19 +38,55 @@ class ComplianceViolation(BaseModel):
 
 
 class ComplianceResult(BaseModel):
-    """Result of compliance validation on generated content."""
+    """
+    Result of compliance validation on generated content.
+
+    ``violations`` is an immutable tuple; error and warning counts are tallied
+    on first access and re-tallied whenever a different tuple is assigned.
+    """
     is_valid: bool = Field(description="True if no error-level violations")
-    violations: List[ComplianceViolation] = Field(default_factory=list)
+    violations: Tuple[ComplianceViolation, ...] = Field(default_factory=tuple)
+
+    # Private so the counts stay out of serialized responses; holds
+    # (violations, error_count, warning_count) for the tuple they were taken from
+    _counts: Optional[tuple] = PrivateAttr(default=None)
+
+    def _severity_counts(self) -> tuple:
+        counts = self._counts
+        if counts is None or counts[0] is not self.violations:
+            severities = [v.severity for v in self.violations]
+            counts = (
+                self.violations,
+                severities.count(ComplianceSeverity.ERROR),
+                severities.count(ComplianceSeverity.WARNING),
+            )
+            self._counts = counts
+        return counts
+
+    @property
+    def error_count(self) -> int:
+        """Number of error-level violations."""
+        return self._severity_counts()[1]
+
+    @property
+    def warning_count(self) -> int:
+        """Number of warning-level violations."""
+        return self._severity_counts()[2]
 
     @property
     def has_errors(self) -> bool:
         """Check if there are any error-level violations."""
-        return any(v.severity == ComplianceSeverity.ERROR for v in self.violations)
+        return self.error_count > 0
 
     @property
     def has_warnings(self) -> bool:
         """Check if there are any warning-level violations."""
-        return any(v.severity == ComplianceSeverity.WARNING for v in self.violations)
+        return self.warning_count > 0
+
+
+def needs_modification(compliance: Optional[ComplianceResult]) -> bool:
+    """Check if a compliance result has error-level violations requiring modification."""
+    return compliance is not None and compliance.error_count > 0
 
 
 class CreativeBrief(BaseModel):
@@ -125,9 +169,12 @@ class ContentGenerationResponse(BaseModel):
     @property
     def requires_modification(self) -> bool:
         """Check if content has error-level violations requiring modification."""
-        text_has_errors = self.text_content and self.text_content.compliance.has_errors
-        image_has_errors = self.image_content and self.image_content.compliance.has_errors
-        return text_has_errors or image_has_errors
+        text = self.text_content
+        image = self.image_content
+        return (
+            (text is not None and needs_modification(text.compliance))
+            or (image is not None and needs_modification(image.compliance))
+        )
 
 
 class ConversationMessage(BaseModel):
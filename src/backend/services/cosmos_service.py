@@ -7,11 +7,16 @@ Provides async operations for:
 - Creative brief storage
 """
 
+import asyncio
 import logging
+import re
+from collections import defaultdict
+from itertools import islice
 from typing import List, Optional
 from datetime import datetime, timezone
 
 from azure.cosmos.aio import CosmosClient, ContainerProxy
+from azure.cosmos.exceptions import CosmosBatchOperationError, CosmosResourceNotFoundError
 from azure.identity.aio import DefaultAzureCredential, ManagedIdentityCredential
 
 from settings import app_settings
@@ -19,6 +24,18 @@ from models import Product, CreativeBrief
 
 logger = logging.getLogger(__name__)
 
+# Cosmos DB transactional batches are limited to 100 operations per partition key
+_MAX_BATCH_OPERATIONS = 100
+# Upper bound on batches in flight at once when deleting across many partitions
+_MAX_CONCURRENT_BATCHES = 16
+
+_WORD_RE = re.compile(r"\S+")
+
+
+def _first_n_words(text: Optional[str], n: int = 4) -> str:
+    """Join the first ``n`` whitespace-separated words, scanning only that prefix of ``text``."""
+    return " ".join(m.group() for m in islice(_WORD_RE.finditer(text or ""), n))
+
 
 class CosmosDBService:
     """Service for interacting with Azure Cosmos DB."""
@@ -359,6 +376,7 @@ class CosmosDBService:
 
         item = {
             "id": conversation_id,
+            "type": "conversation",       # Document type discriminator
             "userId": user_id,            # Partition key field (matches container definition /userId)
             "user_id": user_id,           # Keep for backward compatibility
             "messages": messages,
@@ -393,14 +411,19 @@ class CosmosDBService:
         conversation = await self.get_conversation(conversation_id, user_id)
 
         if conversation:
-            # Ensure userId is set (for partition key) - migrate old documents
-            if not conversation.get("userId"):
-                conversation["userId"] = conversation.get("user_id") or user_id
-            conversation["generated_content"] = generated_content
-            conversation["updated_at"] = datetime.now(timezone.utc).isoformat()
+            # Build the updated document rather than mutating the one that was read
+            conversation = {
+                **conversation,
+                # Ensure userId (partition key) and type are set - migrate old documents
+                "userId": conversation.get("userId") or conversation.get("user_id") or user_id,
+                "type": conversation.get("type", "conversation"),
+                "generated_content": generated_content,
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }
         else:
             conversation = {
                 "id": conversation_id,
+                "type": "conversation",       # Document type discriminator
                 "userId": user_id,            # Partition key field
                 "user_id": user_id,           # Keep for backward compatibility
                 "messages": [],
@@ -434,20 +457,26 @@ class CosmosDBService:
         conversation = await self.get_conversation(conversation_id, user_id)
 
         if conversation:
-            # Ensure userId is set (for partition key) - migrate old documents
-            if not conversation.get("userId"):
-                conversation["userId"] = conversation.get("user_id") or user_id
-            conversation["metadata"] = conversation.get("metadata", {})
+            metadata = conversation.get("metadata") or {}
             if generated_title:
-                has_custom_title = bool(conversation["metadata"].get("custom_title"))
-                has_generated_title = bool(conversation["metadata"].get("generated_title"))
+                has_custom_title = bool(metadata.get("custom_title"))
+                has_generated_title = bool(metadata.get("generated_title"))
                 if not has_custom_title and not has_generated_title:
-                    conversation["metadata"]["generated_title"] = generated_title
-            conversation["messages"].append(message)
-            conversation["updated_at"] = datetime.now(timezone.utc).isoformat()
+                    metadata = {**metadata, "generated_title": generated_title}
+            # Build the updated document rather than mutating the one that was read
+            conversation = {
+                **conversation,
+                # Ensure userId (partition key) and type are set - migrate old documents
+                "userId": conversation.get("userId") or conversation.get("user_id") or user_id,
+                "type": conversation.get("type", "conversation"),
+                "metadata": metadata,
+                "messages": [*conversation.get("messages", []), message],
+                "updated_at": datetime.now(timezone.utc).isoformat()
+            }
         else:
             conversation = {
                 "id": conversation_id,
+                "type": "conversation",       # Document type discriminator
                 "userId": user_id,            # Partition key field
                 "user_id": user_id,          # Keep for backward compatibility
                 "messages": [message],
@@ -458,6 +487,22 @@ class CosmosDBService:
         result = await self._conversations_container.upsert_item(conversation)
         return result
 
+    @staticmethod
+    def _user_conversations_filter(user_id: str) -> str:
+        """
+        Build the WHERE clause matching a user's conversations (binds @user_id).
+
+        For anonymous users, also include conversations with empty/null/undefined user_id.
+        This handles legacy data before "anonymous" was used as the default.
+        """
+        if user_id == "anonymous":
+            return """WHERE c.userId = @user_id
+               OR c.user_id = @user_id
+               OR c.user_id = ""
+               OR c.user_id = null
+               OR NOT IS_DEFINED(c.user_id)"""
+        return "WHERE c.userId = @user_id OR c.user_id = @user_id"
+
     async def get_user_conversations(
         self,
         user_id: str,
@@ -475,75 +520,49 @@ class CosmosDBService:
         """
         await self.initialize()
 
-        # For anonymous users, also include conversations with empty/null/undefined user_id
-        # This handles legacy data before "anonymous" was used as the default
-        if user_id == "anonymous":
-            query = """
-                SELECT TOP @limit c.id, c.userId, c.user_id, c.updated_at, c.messages, c.brief, c.metadata
-                FROM c
-                WHERE c.userId = @user_id
-                   OR c.user_id = @user_id
-                   OR c.user_id = ""
-                   OR c.user_id = null
-                   OR NOT IS_DEFINED(c.user_id)
-                ORDER BY c.updated_at DESC
-            """
-            params = [
-                {"name": "@user_id", "value": user_id},
-                {"name": "@limit", "value": limit}
-            ]
-        else:
-            query = """
-                SELECT TOP @limit c.id, c.userId, c.user_id, c.updated_at, c.messages, c.brief, c.metadata
-                FROM c
-                WHERE c.userId = @user_id OR c.user_id = @user_id
-                ORDER BY c.updated_at DESC
-            """
-            params = [
-                {"name": "@user_id", "value": user_id},
-                {"name": "@limit", "value": limit}
-            ]
+        # Project only what the summary needs instead of every message body and the
+        # whole metadata/brief: the title candidates, the message count, the last
+        # message and the first user message's content
+        query = f"""
+            SELECT TOP @limit c.id, c.updated_at,
+                c.metadata.custom_title AS custom_title,
+                c.metadata.generated_title AS generated_title,
+                c.brief.overview AS overview,
+                ARRAY_LENGTH(c.messages) AS message_count,
+                ARRAY_SLICE(c.messages, -1) AS last_messages,
+                ARRAY_SLICE(ARRAY(SELECT VALUE m.content FROM m IN c.messages WHERE m.role = "user"), 0, 1)
+                    AS first_user_contents
+            FROM c
+            {self._user_conversations_filter(user_id)}
+            ORDER BY c.updated_at DESC
+        """
+        params = [
+            {"name": "@user_id", "value": user_id},
+            {"name": "@limit", "value": limit}
+        ]
 
+        # Title precedence: custom title, generated title, first words of the
+        # brief overview, first words of the first user message, default.
         conversations = []
         async for item in self._conversations_container.query_items(
             query=query,
             parameters=params
         ):
-            messages = item.get("messages", [])
-            brief = item.get("brief", {})
-            metadata = item.get("metadata", {})
-
-            custom_title = metadata.get("custom_title") if metadata else None
-            if custom_title:
-                title = custom_title
-            elif metadata and metadata.get("generated_title"):
-                title = metadata.get("generated_title")
-            elif brief and brief.get("overview"):
-                overview_words = brief["overview"].split()[:4]
-                title = " ".join(overview_words) if overview_words else "New Conversation"
-            elif messages:
-                title = "New Conversation"
-                for msg in messages:
-                    if msg.get("role") == "user":
-                        content = msg.get("content", "")
-                        words = content.split()[:4]
-                        title = " ".join(words) if words else "New Conversation"
-                        break
-            else:
-                title = "New Conversation"
-
-            # Get last message preview
-            last_message = ""
-            if messages:
-                last_msg = messages[-1]
-                last_message = last_msg.get("content", "")[:100]
+            first_user_contents = item.get("first_user_contents")
+            last_messages = item.get("last_messages")
 
             conversations.append({
                 "id": item["id"],
-                "title": title,
-                "lastMessage": last_message,
+                "title": (
+                    item.get("custom_title")
+                    or item.get("generated_title")
+                    or _first_n_words(item.get("overview"))
+                    or _first_n_words(first_user_contents[0] if first_user_contents else None)
+                    or "New Conversation"
+                ),
+                "lastMessage": last_messages[0].get("content", "")[:100] if last_messages else "",
                 "timestamp": item.get("updated_at", ""),
-                "messageCount": len(messages)
+                "messageCount": item.get("message_count", 0)
             })
 
         return conversations
@@ -608,11 +627,14 @@ class CosmosDBService:
         if not conversation:
             return None
 
-        conversation["metadata"] = conversation.get("metadata", {})
-        conversation["metadata"]["custom_title"] = new_title
-        # Ensure userId is set (for partition key) - migrate old documents
-        if not conversation.get("userId"):
-            conversation["userId"] = conversation.get("user_id") or user_id
+        # Build the updated document rather than mutating the one that was read
+        conversation = {
+            **conversation,
+            # Ensure userId (partition key) and type are set - migrate old documents
+            "userId": conversation.get("userId") or conversation.get("user_id") or user_id,
+            "type": conversation.get("type", "conversation"),
+            "metadata": {**(conversation.get("metadata") or {}), "custom_title": new_title}
+        }
         # Don't update updated_at - renaming shouldn't change sort order
 
         result = await self._conversations_container.upsert_item(conversation)
@@ -633,16 +655,92 @@ class CosmosDBService:
         """
         await self.initialize()
 
-        # First get all conversations for the user
-        conversations = await self.get_user_conversations(user_id, limit=1000)
+        # Find every conversation for the user along with its partition key value
+        query = f"""
+            SELECT TOP @limit c.id, c.userId, c.user_id
+            FROM c
+            {self._user_conversations_filter(user_id)}
+        """
+        params = [
+            {"name": "@user_id", "value": user_id},
+            {"name": "@limit", "value": 1000}
+        ]
 
-        deleted_count = 0
-        for conv in conversations:
+        # Batch only documents whose userId is their partition key; legacy
+        # documents without userId go through delete_conversation instead
+        ids_by_partition = defaultdict(list)
+        legacy_ids = []
+        async for item in self._conversations_container.query_items(
+            query=query,
+            parameters=params
+        ):
+            if item.get("userId"):
+                ids_by_partition[item["userId"]].append(item["id"])
+            else:
+                legacy_ids.append(item["id"])
+
+        # One transactional batch per partition key and 100 ids, sent concurrently
+        batches = [
+            (partition_key, ids[i:i + _MAX_BATCH_OPERATIONS])
+            for partition_key, ids in ids_by_partition.items()
+            for i in range(0, len(ids), _MAX_BATCH_OPERATIONS)
+        ]
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_BATCHES)
+
+        async def _delete_item(conversation_id, partition_key):
             try:
-                await self.delete_conversation(conv["id"], user_id)
-                deleted_count += 1
+                await self._conversations_container.delete_item(
+                    item=conversation_id,
+                    partition_key=partition_key
+                )
+            except CosmosResourceNotFoundError:
+                # Already gone, consider it deleted
+                pass
             except Exception as e:
-                logger.warning(f"Failed to delete conversation {conv['id']}: {e}")
+                logger.warning(f"Failed to delete conversation {conversation_id}: {e}")
+                return 0
+            return 1
+
+        async def _delete_batch(partition_key, ids):
+            async with semaphore:
+                try:
+                    await self._conversations_container.execute_item_batch(
+                        batch_operations=[("delete", (conversation_id,)) for conversation_id in ids],
+                        partition_key=partition_key
+                    )
+                    return len(ids)
+                except CosmosBatchOperationError as e:
+                    # The whole batch was rolled back (e.g. one id already deleted); retry one by one
+                    logger.warning(
+                        f"Batch delete of {len(ids)} conversations in partition {partition_key} "
+                        f"failed, retrying individually: {e}"
+                    )
+                deleted = 0
+                for conversation_id in ids:
+                    deleted += await _delete_item(conversation_id, partition_key)
+                return deleted
+
+        async def _delete_legacy(conversation_id):
+            async with semaphore:
+                try:
+                    await self.delete_conversation(conversation_id, user_id)
+                    return 1
+                except Exception as e:
+                    logger.warning(f"Failed to delete conversation {conversation_id}: {e}")
+                    return 0
+
+        results = await asyncio.gather(
+            *[_delete_batch(partition_key, ids) for partition_key, ids in batches],
+            *[_delete_legacy(conversation_id) for conversation_id in legacy_ids],
+            return_exceptions=True
+        )
+
+        deleted_count = 0
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to delete conversations for user {user_id}: {result}")
+            else:
+                deleted_count += result
 
         logger.info(f"Deleted {deleted_count} conversations for user {user_id}")
         return deleted_count
@@ -22,6 +22,9 @@ TITLE_INSTRUCTIONS = """Summarize the conversation so far into a 4-word or less
 Do not use any quotation marks or punctuation.
 Do not include any other commentary or description."""
 
+# Quotes and punctuation stripped from the agent's reply in a single pass
+_TITLE_STRIP_RE = re.compile(r"[\"'`.,!?;:]+")
+
 
 class TitleService:
     """Service for generating conversation titles using AI."""
@@ -111,18 +114,16 @@ class TitleService:
         try:
             response = await self._agent.run(prompt)
 
-            # Clean up the response
-            title = str(response).strip().splitlines()[0].strip()
-            title = re.sub(r"\s+", " ", title)
-            title = re.sub(r"[\"'`]+", "", title)
-            title = re.sub(r"[.,!?;:]+", "", title).strip()
+            # Clean up the response: first line only, no quotes or punctuation,
+            # whitespace collapsed by split()
+            lines = str(response).strip().splitlines()
+            words = _TITLE_STRIP_RE.sub("", lines[0]).split() if lines else []
 
-            if not title:
+            if not words:
                 logger.warning("Title generation: agent returned empty, using fallback")
                 return self._fallback_title(first_user_message)
 
-            final_title = " ".join(title.split()[:4])
-            return final_title
+            return " ".join(words[:4])
 
         except Exception as exc:
             logger.exception("Failed to generate conversation title: %s", exc)
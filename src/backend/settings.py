@@ -8,6 +8,8 @@ and compliance validation.
 
 import logging
 import os
+import re
+from functools import cached_property
 from typing import List, Literal, Optional
 
 from pydantic import AliasChoices, BaseModel, Field, field_validator, model_validator
@@ -19,10 +21,14 @@ DOTENV_PATH = os.environ.get(
 )
 
 
+# One comma-separated item with surrounding whitespace trimmed; blank items never match
+_COMMA_SEPARATED_ITEM_RE = re.compile(r"[^,\s](?:[^,]*[^,\s])?")
+
+
 def parse_comma_separated(value: str) -> List[str]:
     """Parse a comma-separated string into a list."""
-    if isinstance(value, str) and len(value) > 0:
-        return [item.strip() for item in value.split(",") if item.strip()]
+    if isinstance(value, str):
+        return _COMMA_SEPARATED_ITEM_RE.findall(value)
     return []
 
 
@@ -260,17 +266,47 @@ class _BrandGuidelinesSettings(BaseSettings):
     max_body_length: int = 500
     require_cta: bool = True
 
-    @property
+    @cached_property
     def prohibited_words(self) -> List[str]:
-        """Parse prohibited words from comma-separated string."""
+        """Parse prohibited words from comma-separated string (once per instance)."""
         return parse_comma_separated(self.prohibited_words_str)
 
-    @property
+    @cached_property
     def required_disclosures(self) -> List[str]:
-        """Parse required disclosures from comma-separated string."""
+        """Parse required disclosures from comma-separated string (once per instance)."""
         return parse_comma_separated(self.required_disclosures_str)
 
+    # Prompts are pure functions of the settings fields, so each is assembled
+    # once per instance and the get_*_prompt() accessors return the cached text.
+
+    @cached_property
+    def compliance_prompt(self) -> str:
+        """Compliance rules text for agent instructions."""
+        return self._build_compliance_prompt()
+
+    @cached_property
+    def text_generation_prompt(self) -> str:
+        """Brand guidelines for text content generation."""
+        return self._build_text_generation_prompt()
+
+    @cached_property
+    def image_generation_prompt(self) -> str:
+        """Brand guidelines for image content generation."""
+        return self._build_image_generation_prompt()
+
     def get_compliance_prompt(self) -> str:
+        """Return compliance rules text for agent instructions."""
+        return self.compliance_prompt
+
+    def get_text_generation_prompt(self) -> str:
+        """Return brand guidelines for text content generation."""
+        return self.text_generation_prompt
+
+    def get_image_generation_prompt(self) -> str:
+        """Return brand guidelines for image content generation."""
+        return self.image_generation_prompt
+
+    def _build_compliance_prompt(self) -> str:
         """Generate compliance rules text for agent instructions."""
         return f"""
 ## Brand Compliance Rules
@@ -360,7 +396,7 @@ The Compliance Agent MUST flag any content that violates these RAI principles as
 RAI violations are non-negotiable and content must be regenerated.
 """
 
-    def get_text_generation_prompt(self) -> str:
+    def _build_text_generation_prompt(self) -> str:
         """Generate brand guidelines for text content generation."""
         return f"""
 ## Brand Voice Guidelines
@@ -397,7 +433,7 @@ ALWAYS ensure:
 - Respectful portrayal of diverse communities
 """
 
-    def get_image_generation_prompt(self) -> str:
+    def _build_image_generation_prompt(self) -> str:
         """Generate brand guidelines for image content generation."""
         return f"""
 ## ⚠️ MANDATORY: ZERO TEXT IN IMAGE
@@ -331,7 +331,7 @@ async def test_load_sample_data_success(client, sample_product_dict):
         response = await client.post(
             "/api/admin/load-sample-data",
             json={
-                "products": [sample_product_dict]
+                "products": [dict(sample_product_dict)]
             }
         )
 
@@ -378,7 +378,7 @@ async def test_load_sample_data_clear_existing(client, sample_product_dict):
         response = await client.post(
             "/api/admin/load-sample-data",
             json={
-                "products": [sample_product_dict],
+                "products": [dict(sample_product_dict)],
                 "clear_existing": True
             }
         )
@@ -472,7 +472,7 @@ async def test_load_sample_data_internal_server_error(client, sample_product_dic
 
         response = await client.post(
             "/api/admin/load-sample-data",
-            json={"products": [sample_product_dict]}
+            json={"products": [dict(sample_product_dict)]}
         )
 
         assert response.status_code == 500
@@ -656,7 +656,7 @@ async def test_full_data_loading_workflow(client, sample_product_dict, fake_imag
 
         response2 = await client.post(
             "/api/admin/load-sample-data",
-            json={"products": [sample_product_dict]}
+            json={"products": [dict(sample_product_dict)]}
         )
 
         assert response2.status_code == 200
@@ -12,9 +12,10 @@ import gc
 import os
 import sys
 from datetime import datetime, timezone
-from typing import AsyncGenerator
+from types import MappingProxyType
 
 import pytest
+import pytest_asyncio
 from quart import Quart
 
 
@@ -27,11 +28,13 @@ def pytest_configure(config):
     # AZURE_OPENAI_ENDPOINT is required by _AzureOpenAISettings validator
     os.environ.setdefault("AZURE_OPENAI_ENDPOINT", "https://test.openai.azure.com/")
 
-    # Add the backend directory to the Python path
+    # Add the backend directory (and this one, for the shared helpers module)
+    # to the Python path
     tests_dir = os.path.dirname(os.path.abspath(__file__))
     backend_dir = os.path.join(os.path.dirname(tests_dir), 'backend')
-    if backend_dir not in sys.path:
-        sys.path.insert(0, backend_dir)
+    for path in (backend_dir, tests_dir):
+        if path not in sys.path:
+            sys.path.insert(0, path)
 
     # Set Windows event loop policy (fixes pytest-asyncio auto mode compatibility)
     if sys.platform == "win32":
@@ -110,27 +113,94 @@ def mock_environment(monkeypatch):
     yield
 
 
-@pytest.fixture
-async def app() -> AsyncGenerator[Quart, None]:
-    """Create a test Quart app instance."""
-    # Import here to ensure environment variables are set first
-    from app import app as quart_app
+@pytest.fixture(scope="session")
+def app_module():
+    """The backend ``app`` module, imported on first use.
+
+    Test modules reach ``startup``, ``shutdown`` and ``_generation_tasks``
+    through this fixture instead of importing ``app`` at module top, so
+    collection (serial, and repeated on every xdist worker) does not pay
+    for the Quart app and its service imports.
+    """
+    import app as _app
+    return _app
+
+
+@pytest.fixture(scope="session")
+def app(app_module) -> Quart:
+    """Create the test Quart app instance once per session.
+
+    Sharing it avoids re-resolving the module and re-applying test config
+    for every test.
+    """
+    quart_app = app_module.app
 
     quart_app.config["TESTING"] = True
 
-    yield quart_app
+    return quart_app
 
 
-@pytest.fixture
-async def client(app: Quart):
-    """Create a test client for the Quart app."""
+@pytest.fixture(scope="session")
+def client(app: Quart):
+    """Create a test client for the Quart app, shared across the session."""
     return app.test_client()
 
 
-@pytest.fixture
+@pytest_asyncio.fixture(scope="session")
+async def asgi_client(app: Quart):
+    """``httpx`` client that drives the app in-process over one ASGI transport.
+
+    Opened and closed on the session loop the tests run on. Unlike ``client``
+    it returns ``httpx`` responses (``response.json()``, ``response.content``);
+    modules opt in by overriding ``client`` with it.
+    """
+    from httpx import ASGITransport, AsyncClient
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://t") as http_client:
+        yield http_client
+
+
+@pytest.fixture(scope="session")
+def dispatch_request(app: Quart):
+    """Invoke a route in-process without going through the ASGI test client.
+
+    Builds a request context for ``path`` and runs Quart's full dispatch
+    (before/after-request hooks, error handlers) directly, skipping the
+    ASGI transport, header codec and cookie jar. Use for plain
+    request/response tests; streaming and multipart tests should keep
+    using ``client``.
+
+    Example:
+        response = await dispatch_request("/api/chat", "POST", json={...})
+    """
+    async def _dispatch(path, method="GET", **kwargs):
+        async with app.test_request_context(path, method=method, **kwargs) as ctx:
+            return await app.full_dispatch_request(ctx)
+
+    return _dispatch
+
+
+@pytest.fixture(autouse=True)
+def reset_generation_tasks():
+    """Clear the in-memory generation task registry after each test.
+
+    The app and client are session-scoped, so module-level state in ``app``
+    would otherwise leak between tests.
+    """
+    yield
+    app_module = sys.modules.get("app")
+    if app_module is not None:
+        app_module._generation_tasks.clear()
+
+
+@pytest.fixture(scope="session")
 def sample_product_dict():
-    """Sample product data as dictionary."""
-    return {
+    """Sample product data as a read-only mapping.
+
+    Session-scoped, so frozen; copy with ``dict(...)`` where a mutable dict or
+    a JSON body is needed.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    return MappingProxyType({
         "id": "CP-0001",
         "product_name": "Snow Veil",
         "description": "A soft, airy white with minimal undertones",
@@ -139,9 +209,9 @@ def sample_product_dict():
         "sku": "CP-0001",
         "image_url": "https://test.blob.core.windows.net/images/snow-veil.jpg",
         "category": "Paint",
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "updated_at": datetime.now(timezone.utc).isoformat()
-    }
+        "created_at": now,
+        "updated_at": now
+    })
 
 
 @pytest.fixture
@@ -151,10 +221,14 @@ def sample_product(sample_product_dict):
     return Product(**sample_product_dict)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_creative_brief_dict():
-    """Sample creative brief data as dictionary."""
-    return {
+    """Sample creative brief data as a read-only mapping.
+
+    Session-scoped, so frozen; copy with ``dict(...)`` where a mutable dict or
+    a JSON body is needed.
+    """
+    return MappingProxyType({
         "overview": "Spring campaign for eco-friendly paint line",
         "objectives": "Increase brand awareness and drive 20% sales growth",
         "target_audience": "Homeowners aged 30-50, environmentally conscious",
@@ -164,7 +238,7 @@ def sample_creative_brief_dict():
         "timelines": "Launch March 1, run for 6 weeks",
         "visual_guidelines": "Natural lighting, green spaces, happy families",
         "cta": "Shop Now - Free Shipping"
-    }
+    })
 
 
 @pytest.fixture
@@ -192,6 +266,63 @@ def admin_headers():
     }
 
 
+# =============================================================================
+# Patched Service Fixtures
+# =============================================================================
+# Each fixture routes the matching ``get_*`` accessor in ``app`` to a mock via
+# monkeypatch, so tests configure the returned mock instead of opening their
+# own ``patch("app.get_...")`` blocks.
+
+
+@pytest.fixture
+def mock_cosmos_service(monkeypatch):
+    """Route ``get_cosmos_service()`` calls in ``app`` to an AsyncMock."""
+    from unittest.mock import AsyncMock
+    service = AsyncMock()
+
+    async def _get_cosmos_service():
+        return service
+
+    monkeypatch.setattr("app.get_cosmos_service", _get_cosmos_service)
+    return service
+
+
+@pytest.fixture
+def mock_blob_service(monkeypatch):
+    """Route ``get_blob_service()`` calls in ``app`` to an AsyncMock."""
+    from unittest.mock import AsyncMock
+    service = AsyncMock()
+
+    async def _get_blob_service():
+        return service
+
+    monkeypatch.setattr("app.get_blob_service", _get_blob_service)
+    return service
+
+
+@pytest.fixture
+def mock_orchestrator(monkeypatch):
+    """Route ``get_orchestrator()`` calls in ``app`` to a spec'd AsyncMock.
+
+    The spec rejects reads of attributes the real orchestrator does not
+    define, so a misspelled method fails loudly instead of returning a mock.
+    """
+    from unittest.mock import AsyncMock
+    from orchestrator import ContentGenerationOrchestrator
+    orchestrator = AsyncMock(spec=ContentGenerationOrchestrator)
+    monkeypatch.setattr("app.get_orchestrator", lambda: orchestrator)
+    return orchestrator
+
+
+@pytest.fixture
+def mock_title_service(monkeypatch):
+    """Route ``get_title_service()`` calls in ``app`` to a MagicMock."""
+    from unittest.mock import MagicMock
+    title_service = MagicMock()
+    monkeypatch.setattr("app.get_title_service", lambda: title_service)
+    return title_service
+
+
 # =============================================================================
 # Shared Mock Service Fixtures
 # =============================================================================
@@ -256,7 +387,8 @@ def mock_orchestrator_instance():
     Returns a mock with common methods pre-configured.
     """
     from unittest.mock import AsyncMock
-    mock = AsyncMock()
+    from orchestrator import ContentGenerationOrchestrator
+    mock = AsyncMock(spec=ContentGenerationOrchestrator)
     mock.parse_brief = AsyncMock()
     mock.generate_content_stream = AsyncMock()
     mock.process_message = AsyncMock()
@@ -0,0 +1,66 @@
+"""
+Shared helpers for backend tests.
+
+Plain module (not a conftest) so test modules can import from it directly:
+- AsyncStub: lightweight awaitable stand-in for ``AsyncMock``
+- dumps_json / read_json: JSON request/response helpers backed by ``orjson``
+"""
+
+import orjson
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+_UNSET = object()
+
+
+class AsyncStub:
+    """Minimal awaitable stand-in for ``AsyncMock`` on hot test paths.
+
+    Returns ``ret`` (or raises ``exc``) when awaited. Unlike ``AsyncMock`` it
+    builds no child mocks and records no calls, so only use it where a test
+    does not assert on how the stub was called.
+
+    Example:
+        mock_cosmos_service.get_conversation = AsyncStub({"id": "conv-1"})
+        mock_cosmos_service.save_conversation = AsyncStub(exc=Exception("fail"))
+    """
+
+    __slots__ = ("ret", "exc")
+
+    def __init__(self, ret=None, exc=None):
+        self.ret = ret
+        self.exc = exc
+
+    async def __call__(self, *_args, **_kwargs):
+        if self.exc is not None:
+            raise self.exc
+        return self.ret
+
+
+def dumps_json(obj) -> bytes:
+    """Serialize a request payload to JSON bytes with ``orjson``.
+
+    Pre-serialize payloads that several tests send unchanged and post them
+    through the httpx client as ``content=..., headers=JSON_HEADERS`` (or
+    ``data=...`` with ``dispatch_request``) instead of ``json=...``.
+    """
+    return orjson.dumps(obj)
+
+
+async def read_json(response):
+    """Decode a test response body as JSON, caching the result on the response.
+
+    Mirrors ``response.get_json()`` (returns ``None`` for non-JSON responses)
+    but decodes the body at most once, using ``orjson``.
+    Accepts both Quart responses and ``httpx`` responses.
+    """
+    cached = getattr(response, "_cached_json", _UNSET)
+    if cached is _UNSET:
+        if hasattr(response, "get_data"):
+            is_json, body = response.is_json, await response.get_data()
+        else:
+            is_json = response.headers.get("content-type", "").startswith("application/json")
+            body = response.content
+        cached = orjson.loads(body) if is_json else None
+        response._cached_json = cached
+    return cached
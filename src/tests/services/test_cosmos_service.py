@@ -653,8 +653,10 @@ async def test_get_user_conversations_anonymous(mock_cosmos_service):
             "id": "conv-1",
             "userId": "anonymous",
             "user_id": "anonymous",
-            "messages": [{"role": "user", "content": "First message"}],
-            "brief": {"overview": "Test campaign"}
+            "overview": "Test campaign",
+            "message_count": 1,
+            "last_messages": [{"role": "user", "content": "First message"}],
+            "first_user_contents": ["First message"]
         }
     ]
 
@@ -680,8 +682,10 @@ async def test_get_user_conversations_with_custom_title(mock_cosmos_service):
             "id": "conv-1",
             "userId": "user-123",
             "user_id": "user-123",
-            "messages": [],
-            "metadata": {"custom_title": "My Custom Title"}
+            "message_count": 0,
+            "last_messages": [],
+            "first_user_contents": [],
+            "custom_title": "My Custom Title"
         }
     ]
 
@@ -705,9 +709,10 @@ async def test_get_user_conversations_no_title_fallback(mock_cosmos_service):
             "id": "conv-1",
             "userId": "user-123",
             "user_id": "user-123",
-            "messages": [],  # No messages
-            "brief": None,  # No brief
-            "metadata": None  # No metadata
+            "message_count": 0,  # No messages
+            "last_messages": [],
+            "first_user_contents": [],
+            "overview": None  # No brief or metadata titles
         }
     ]
 
@@ -731,12 +736,11 @@ async def test_get_user_conversations_title_from_first_user_message(mock_cosmos_
             "id": "conv-1",
             "userId": "user-123",
             "user_id": "user-123",
-            "messages": [
-                {"role": "user", "content": "Create a marketing campaign for summer"},
-                {"role": "assistant", "content": "I'd be happy to help..."}
-            ],
-            "brief": {},  # Empty brief (no overview)
-            "metadata": {}  # Empty metadata (no custom_title)
+            "message_count": 2,
+            "last_messages": [{"role": "assistant", "content": "I'd be happy to help..."}],
+            "first_user_contents": ["Create a marketing campaign for summer"],
+            # Empty brief and metadata: the projected overview and titles are
+            # undefined, so those keys are absent
         }
     ]
 
@@ -761,13 +765,11 @@ async def test_get_user_conversations_title_from_user_message_skips_assistant(mo
             "id": "conv-1",
             "userId": "user-123",
             "user_id": "user-123",
-            "messages": [
-                {"role": "assistant", "content": "Welcome! How can I help?"},
-                {"role": "user", "content": "Help with product launch"},
-                {"role": "assistant", "content": "Sure thing!"}
-            ],
-            "brief": None,
-            "metadata": None
+            "message_count": 3,
+            "last_messages": [{"role": "assistant", "content": "Sure thing!"}],
+            # The query keeps only the first USER message, skipping assistant messages
+            "first_user_contents": ["Help with product launch"],
+            "overview": None
         }
     ]
 
@@ -1,14 +1,174 @@
-import json
+import asyncio
+import logging
+from contextlib import ExitStack
 from datetime import datetime, timezone
+from types import MappingProxyType
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
-from app import _generation_tasks, get_authenticated_user, shutdown, startup
+from helpers import JSON_HEADERS, AsyncStub, dumps_json, read_json
 from models import CreativeBrief, Product
+from openai import RateLimitError
+
+# None of these tests assert on warnings or log output, so skip capturing them.
+# Every test also runs against the mocked cosmos service from conftest.
+pytestmark = [
+    pytest.mark.filterwarnings("ignore"),
+    pytest.mark.usefixtures("mock_cosmos_service"),
+]
+
+# Shared creative brief payload; copy with dict(_BRIEF) before sending as JSON.
+_BRIEF = MappingProxyType({
+    "overview": "Test",
+    "objectives": "Goals",
+    "target_audience": "Adults",
+    "key_message": "Message",
+    "tone_and_style": "Professional",
+    "deliverable": "Post",
+    "timelines": "Q2",
+    "visual_guidelines": "Clean",
+    "cta": "Buy"
+})
+
+# Request bodies sent unchanged by several tests, serialized once at import.
+_CHAT_HELLO_BODY = dumps_json({"message": "Hello", "user_id": "test"})
+_GENERATE_START_BODY = dumps_json({
+    "brief": dict(_BRIEF),
+    "conversation_id": "test_conv",
+    "user_id": "user1"
+})
+_RENAME_BODY = dumps_json({"title": "New Title"})
+_RENAME_BLANK_BODY = dumps_json({"title": "   "})
+
+# EasyAuth headers identifying a signed-in user, so conversation endpoints
+# resolve a real user id without patching get_authenticated_user.
+_AUTH_HEADERS = {
+    "X-Ms-Client-Principal-Id": "test-user",
+    "X-Ms-Client-Principal-Name": "Test User"
+}
+_AUTH_JSON_HEADERS = {**_AUTH_HEADERS, **JSON_HEADERS}
+
+# Timestamps for fixtures whose exact value does not matter.
+_TEST_NOW = datetime.now(timezone.utc)
+_TEST_NOW_ISO = _TEST_NOW.isoformat()
+
+# Endpoint paths shared across tests; status paths are _URL_STATUS + task_id.
+_URL_CHAT = "/api/chat"
+_URL_GENERATE_START = "/api/generate/start"
+_URL_STATUS = "/api/generate/status/"
+_URL_PRODUCTS = "/api/products"
+_URL_CONVERSATIONS = "/api/conversations"
+
+
+@pytest.fixture(scope="session")
+def client(asgi_client):
+    """Drive this module's endpoint tests through the shared httpx ASGI client."""
+    return asgi_client
+
+
+@pytest.fixture(autouse=True)
+def _silence_logs(caplog):
+    """Drop log records below CRITICAL so mocked requests skip formatting.
+
+    Quart's own request logger is switched off for the test and restored after.
+    """
+    caplog.set_level(logging.CRITICAL)
+    quart_logger = logging.getLogger("quart.app")
+    disabled = quart_logger.disabled
+    quart_logger.disabled = True
+    yield
+    quart_logger.disabled = disabled
+
+
+@pytest.fixture
+def patches():
+    """Apply ``patch(target, **kwargs)`` calls on one ExitStack, undone after the test."""
+    with ExitStack() as stack:
+        def add(target, **kwargs):
+            return stack.enter_context(patch(target, **kwargs))
+
+        yield add
+
+
+@pytest.fixture(scope="session")
+def conv_stub(sample_creative_brief_dict):
+    """Shared ``get_conversation`` stub for a conversation with a brief."""
+    return AsyncStub({
+        "id": "test_conv",
+        "user_id": "user1",
+        "brief": dict(sample_creative_brief_dict)
+    })
+
+
+@pytest.fixture(scope="session")
+def generated_conv_stub(sample_creative_brief_dict):
+    """Like ``conv_stub``, for a conversation that already has generated content."""
+    return AsyncStub({
+        "id": "test_conv",
+        "user_id": "user1",
+        "brief": dict(sample_creative_brief_dict),
+        "generated_content": {"image_url": "old.jpg"}
+    })
 
 
-@pytest.mark.asyncio
-async def test_get_authenticated_user_with_headers(app):
+@pytest.fixture(scope="session")
+def noop_stub():
+    """Awaitable that returns ``None``; stateless, so tests can share it."""
+    return AsyncStub()
+
+
+@pytest.fixture(scope="session")
+def image_blob_factory():
+    """Factory that wires a blob service mock's product and generated image containers.
+
+    Call it with the ``mock_blob_service`` fixture; only the download data,
+    download error and blob properties (or their error) vary between tests.
+    Both containers serve the same blob client, which is returned for further
+    per-test tweaks.
+    """
+    def make(blob_service, data=b"fake image data", download_error=None,
+             properties=None, properties_error=None):
+        blob_client = AsyncMock()
+        if download_error is not None:
+            blob_client.download_blob = AsyncStub(exc=download_error)
+        else:
+            download = MagicMock()
+            download.readall = AsyncStub(data)
+            blob_client.download_blob = AsyncStub(download)
+        if properties_error is not None:
+            blob_client.get_blob_properties = AsyncStub(exc=properties_error)
+        elif properties is not None:
+            blob_client.get_blob_properties = AsyncStub(properties)
+
+        container = MagicMock()
+        container.get_blob_client = MagicMock(return_value=blob_client)
+        blob_service._product_images_container = container
+        blob_service._generated_images_container = container
+        blob_service.initialize = AsyncStub()
+        return blob_client
+
+    return make
+
+
+@pytest.fixture
+def gen_task(app_module):
+    """Seed ``app._generation_tasks`` entries that are removed after the test.
+
+    Call it as ``gen_task(task_id, task)``; it returns ``task_id``.
+    """
+    keys = []
+
+    def add(task_id, task):
+        app_module._generation_tasks[task_id] = task
+        keys.append(task_id)
+        return task_id
+
+    yield add
+    for task_id in keys:
+        app_module._generation_tasks.pop(task_id, None)
+
+
+async def test_get_authenticated_user_with_headers(app_module, app):
     """Test authentication with EasyAuth headers."""
     headers = {
         "X-MS-CLIENT-PRINCIPAL-ID": "test-user-123",
@@ -17,7 +177,7 @@ async def test_get_authenticated_user_with_headers(app):
     }
 
     async with app.test_request_context("/", headers=headers):
-        user = get_authenticated_user()
+        user = app_module.get_authenticated_user()
 
         assert user["user_principal_id"] == "test-user-123"
         assert user["user_name"] == "test@example.com"
@@ -25,11 +185,10 @@ async def test_get_authenticated_user_with_headers(app):
         assert user["is_authenticated"] is True
 
 
-@pytest.mark.asyncio
-async def test_get_authenticated_user_anonymous(app):
+async def test_get_authenticated_user_anonymous(app_module, app):
     """Test authentication without headers (anonymous)."""
     async with app.test_request_context("/"):
-        user = get_authenticated_user()
+        user = app_module.get_authenticated_user()
 
         assert user["user_principal_id"] == "anonymous"
         assert user["user_name"] == ""
@@ -37,76 +196,69 @@ async def test_get_authenticated_user_anonymous(app):
         assert user["is_authenticated"] is False
 
 
-@pytest.mark.asyncio
-async def test_health_check_root(client):
+async def test_health_check_root(dispatch_request):
     """Test health check at /health."""
-    response = await client.get("/health")
+    response = await dispatch_request("/health")
 
     assert response.status_code == 200
 
-    data = await response.get_json()
+    data = await read_json(response)
     assert data["status"] == "healthy"
     assert "timestamp" in data
     assert "version" in data
 
 
-@pytest.mark.asyncio
-async def test_health_check_api(client):
+async def test_health_check_api(dispatch_request):
     """Test health check at /api/health."""
-    response = await client.get("/api/health")
+    response = await dispatch_request("/api/health")
 
     assert response.status_code == 200
 
-    data = await response.get_json()
+    data = await read_json(response)
     assert data["status"] == "healthy"
 
 
-@pytest.mark.asyncio
-async def test_chat_missing_message(client):
+async def test_chat_missing_message(dispatch_request):
     """Test chat endpoint rejects missing/empty message with 400."""
-    response = await client.post(
-        "/api/chat",
+    response = await dispatch_request(
+        _URL_CHAT,
+        "POST",
         json={"conversation_id": "test-conv"}
     )
 
     assert response.status_code == 400
-    data = await response.get_json()
+    data = await read_json(response)
     assert data["action_type"] == "error"
     assert "empty" in data["message"].lower()
 
 
-@pytest.mark.asyncio
 async def test_chat_empty_body(client):
     """Test chat endpoint rejects empty request body with 400."""
     response = await client.post(
-        "/api/chat",
-        data="",
-        headers={"Content-Type": "application/json"}
+        _URL_CHAT,
+        content="",
+        headers=JSON_HEADERS
     )
 
     assert response.status_code == 400
 
 
-@pytest.mark.asyncio
-async def test_chat_whitespace_message(client):
+async def test_chat_whitespace_message(dispatch_request):
     """Test chat endpoint rejects whitespace-only message with 400."""
-    response = await client.post(
-        "/api/chat",
+    response = await dispatch_request(
+        _URL_CHAT,
+        "POST",
         json={"conversation_id": "test-conv", "message": "   "}
     )
 
     assert response.status_code == 400
-    data = await response.get_json()
+    data = await read_json(response)
     assert data["action_type"] == "error"
 
 
-@pytest.mark.asyncio
-async def test_chat_empty_message_with_action_allowed(client):
+async def test_chat_empty_message_with_action_allowed(client, mock_cosmos_service, mock_orchestrator):
     """Test chat endpoint allows empty message when action is specified."""
-    with patch("app.get_routing_service") as mock_routing, \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_orchestrator") as mock_orch:
-
+    with patch("app.get_routing_service") as mock_routing:
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
         mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
@@ -116,17 +268,13 @@ async def test_chat_empty_message_with_action_allowed(client):
         mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
         mock_routing.return_value = mock_routing_service
 
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.add_message_to_conversation = AsyncStub()
 
-        mock_orchestrator = AsyncMock()
-        mock_orchestrator.parse_brief = AsyncMock(return_value=(MagicMock(model_dump=lambda: {}), None, False))
-        mock_orch.return_value = mock_orchestrator
+        mock_orchestrator.parse_brief = AsyncStub((MagicMock(model_dump=lambda: {}), None, False))
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={"conversation_id": "test-conv", "action": "confirm_brief", "message": ""}
         )
 
@@ -134,264 +282,227 @@ async def test_chat_empty_message_with_action_allowed(client):
         assert response.status_code in [200, 500]
 
 
-@pytest.mark.asyncio
-async def test_chat_with_message(client):
+async def test_chat_with_message(client, mock_cosmos_service, mock_orchestrator, patches):
     """Test chat endpoint with valid message returns JSON response."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.parse_brief = AsyncMock(return_value=(
+    mock_orchestrator.parse_brief = AsyncStub((
         MagicMock(model_dump=lambda: {"overview": "Test campaign"}),
         None,
         False
     ))
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing, \
-         patch("app.get_title_service") as mock_title:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos_service.save_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
-
-        # Mock routing service to classify as PARSE_BRIEF
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.PARSE_BRIEF,
-            confidence=0.9
-        ))
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
-        mock_routing.return_value = mock_routing_service
+    mock_routing = patches("app.get_routing_service")
+    mock_title = patches("app.get_title_service")
+    mock_cosmos_service.get_conversation = AsyncStub(None)
+    mock_cosmos_service.add_message_to_conversation = AsyncStub()
+    mock_cosmos_service.save_conversation = AsyncStub()
+
+    # Mock routing service to classify as PARSE_BRIEF
+    from services.routing_service import Intent, RoutingResult, ConversationState
+    mock_routing_service = MagicMock()
+    mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
+        intent=Intent.PARSE_BRIEF,
+        confidence=0.9
+    ))
+    mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
+    mock_routing.return_value = mock_routing_service
 
-        mock_title_service = MagicMock()
-        mock_title_service.generate_title = AsyncMock(return_value="Test Title")
-        mock_title.return_value = mock_title_service
+    mock_title_service = MagicMock()
+    mock_title_service.generate_title = AsyncStub("Test Title")
+    mock_title.return_value = mock_title_service
 
-        response = await client.post(
-            "/api/chat",
-            json={
-                "message": "Create a marketing campaign for paint products",
-                "conversation_id": "test-conv",
-                "user_id": "test-user"
-            }
-        )
+    response = await client.post(
+        _URL_CHAT,
+        json={
+            "message": "Create a marketing campaign for paint products",
+            "conversation_id": "test-conv",
+            "user_id": "test-user"
+        }
+    )
 
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert "action_type" in data
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert "action_type" in data
 
 
-@pytest.mark.asyncio
-async def test_chat_cosmos_failure(client):
+async def test_chat_cosmos_failure(client, mock_orchestrator, patches):
     """Test chat when CosmosDB is unavailable still returns response."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.parse_brief = AsyncMock(return_value=(
+    mock_orchestrator.parse_brief = AsyncStub((
         MagicMock(model_dump=lambda: {"overview": "Test"}),
         None,
         False
     ))
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing, \
-         patch("app.get_title_service") as mock_title:
-
-        # Make cosmos raise exception
-        mock_cosmos.side_effect = Exception("Cosmos unavailable")
-
-        # Mock routing service
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.PARSE_BRIEF,
-            confidence=0.9
-        ))
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
-        mock_routing.return_value = mock_routing_service
+    mock_cosmos = patches("app.get_cosmos_service")
+    mock_routing = patches("app.get_routing_service")
+    mock_title = patches("app.get_title_service")
+    # Make cosmos raise exception
+    mock_cosmos.side_effect = Exception("Cosmos unavailable")
+
+    # Mock routing service
+    from services.routing_service import Intent, RoutingResult, ConversationState
+    mock_routing_service = MagicMock()
+    mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
+        intent=Intent.PARSE_BRIEF,
+        confidence=0.9
+    ))
+    mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
+    mock_routing.return_value = mock_routing_service
 
-        mock_title_service = MagicMock()
-        mock_title_service.generate_title = AsyncMock(return_value="Title")
-        mock_title.return_value = mock_title_service
+    mock_title_service = MagicMock()
+    mock_title_service.generate_title = AsyncStub("Title")
+    mock_title.return_value = mock_title_service
 
-        response = await client.post(
-            "/api/chat",
-            json={"message": "Create campaign", "user_id": "test"}
-        )
+    response = await client.post(
+        _URL_CHAT,
+        json={"message": "Create campaign", "user_id": "test"}
+    )
 
-        # Should still work even if Cosmos fails (graceful degradation)
-        assert response.status_code == 200
+    # Should still work even if Cosmos fails (graceful degradation)
+    assert response.status_code == 200
 
 
-@pytest.mark.asyncio
-async def test_parse_brief_missing_text(client):
+async def test_parse_brief_missing_text(dispatch_request):
     """Test chat endpoint rejects missing message with 400."""
-    response = await client.post(
-        "/api/chat",
+    response = await dispatch_request(
+        _URL_CHAT,
+        "POST",
         json={"conversation_id": "test-conv"}
     )
 
     assert response.status_code == 400
-    data = await response.get_json()
+    data = await read_json(response)
     assert data["action_type"] == "error"
 
 
-@pytest.mark.asyncio
-async def test_parse_brief_success(client, sample_creative_brief):
+async def test_parse_brief_success(client, sample_creative_brief, mock_cosmos_service, mock_orchestrator, patches):
     """Test successful brief parsing via /api/chat."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.parse_brief = AsyncMock(
-        return_value=(sample_creative_brief, None, False)
+    mock_orchestrator.parse_brief = AsyncStub(
+        (sample_creative_brief, None, False)
     )
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing, \
-         patch("app.get_title_service") as mock_title:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos_service.save_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
-
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.PARSE_BRIEF,
-            confidence=0.9
-        ))
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
-        mock_routing.return_value = mock_routing_service
+    mock_routing = patches("app.get_routing_service")
+    mock_title = patches("app.get_title_service")
+    mock_cosmos_service.get_conversation = AsyncStub(None)
+    mock_cosmos_service.add_message_to_conversation = AsyncStub()
+    mock_cosmos_service.save_conversation = AsyncStub()
+
+    from services.routing_service import Intent, RoutingResult, ConversationState
+    mock_routing_service = MagicMock()
+    mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
+        intent=Intent.PARSE_BRIEF,
+        confidence=0.9
+    ))
+    mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
+    mock_routing.return_value = mock_routing_service
 
-        mock_title_service = MagicMock()
-        mock_title_service.generate_title = AsyncMock(return_value="Test Title")
-        mock_title.return_value = mock_title_service
+    mock_title_service = MagicMock()
+    mock_title_service.generate_title = AsyncStub("Test Title")
+    mock_title.return_value = mock_title_service
 
-        response = await client.post(
-            "/api/chat",
-            json={
-                "message": "Create a spring campaign for eco-friendly paints",
-                "user_id": "test-user"
-            }
-        )
+    response = await client.post(
+        _URL_CHAT,
+        json={
+            "message": "Create a spring campaign for eco-friendly paints",
+            "user_id": "test-user"
+        }
+    )
 
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert data["action_type"] == "brief_parsed"
-        assert "brief" in data["data"]
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert data["action_type"] == "brief_parsed"
+    assert "brief" in data["data"]
 
 
-@pytest.mark.asyncio
-async def test_parse_brief_needs_clarification(client, sample_creative_brief):
+async def test_parse_brief_needs_clarification(client, sample_creative_brief, mock_cosmos_service, mock_orchestrator, patches):
     """Test brief parsing when clarifying questions are needed via /api/chat."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.parse_brief = AsyncMock(
-        return_value=(
+    mock_orchestrator.parse_brief = AsyncStub(
+        (
             sample_creative_brief,
             "What is your target audience?",
             False
         )
     )
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing, \
-         patch("app.get_title_service") as mock_title:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos_service.save_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
-
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.PARSE_BRIEF,
-            confidence=0.9
-        ))
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
-        mock_routing.return_value = mock_routing_service
+    mock_routing = patches("app.get_routing_service")
+    mock_title = patches("app.get_title_service")
+    mock_cosmos_service.get_conversation = AsyncStub(None)
+    mock_cosmos_service.add_message_to_conversation = AsyncStub()
+    mock_cosmos_service.save_conversation = AsyncStub()
+
+    from services.routing_service import Intent, RoutingResult, ConversationState
+    mock_routing_service = MagicMock()
+    mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
+        intent=Intent.PARSE_BRIEF,
+        confidence=0.9
+    ))
+    mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
+    mock_routing.return_value = mock_routing_service
 
-        mock_title_service = MagicMock()
-        mock_title_service.generate_title = AsyncMock(return_value="Test Title")
-        mock_title.return_value = mock_title_service
+    mock_title_service = MagicMock()
+    mock_title_service.generate_title = AsyncStub("Test Title")
+    mock_title.return_value = mock_title_service
 
-        response = await client.post(
-            "/api/chat",
-            json={
-                "message": "Create a campaign",
-                "user_id": "test-user"
-            }
-        )
+    response = await client.post(
+        _URL_CHAT,
+        json={
+            "message": "Create a campaign",
+            "user_id": "test-user"
+        }
+    )
 
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert data["action_type"] == "clarification_needed"
-        assert "clarifying_questions" in data["data"]
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert data["action_type"] == "clarification_needed"
+    assert "clarifying_questions" in data["data"]
 
 
-@pytest.mark.asyncio
-async def test_parse_brief_rai_blocked(client):
+async def test_parse_brief_rai_blocked(client, mock_cosmos_service, mock_orchestrator, patches):
     """Test brief parsing blocked by content safety via /api/chat."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.parse_brief = AsyncMock(
-        return_value=(
+    mock_orchestrator.parse_brief = AsyncStub(
+        (
             None,
             "I cannot help with that request.",
             True  # RAI blocked
         )
     )
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing, \
-         patch("app.get_title_service") as mock_title:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_routing = patches("app.get_routing_service")
+    mock_title = patches("app.get_title_service")
+    mock_cosmos_service.get_conversation = AsyncStub(None)
+    mock_cosmos_service.add_message_to_conversation = AsyncStub()
 
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.PARSE_BRIEF,
-            confidence=0.9
-        ))
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
-        mock_routing.return_value = mock_routing_service
+    from services.routing_service import Intent, RoutingResult, ConversationState
+    mock_routing_service = MagicMock()
+    mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
+        intent=Intent.PARSE_BRIEF,
+        confidence=0.9
+    ))
+    mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
+    mock_routing.return_value = mock_routing_service
 
-        mock_title_service = MagicMock()
-        mock_title_service.generate_title = AsyncMock(return_value="Blocked")
-        mock_title.return_value = mock_title_service
+    mock_title_service = MagicMock()
+    mock_title_service.generate_title = AsyncStub("Blocked")
+    mock_title.return_value = mock_title_service
 
-        response = await client.post(
-            "/api/chat",
-            json={
-                "message": "Create harmful content",
-                "user_id": "test-user"
-            }
-        )
+    response = await client.post(
+        _URL_CHAT,
+        json={
+            "message": "Create harmful content",
+            "user_id": "test-user"
+        }
+    )
 
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert data["action_type"] == "rai_blocked"
-        assert data["data"]["rai_blocked"] is True
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert data["action_type"] == "rai_blocked"
+    assert data["data"]["rai_blocked"] is True
 
 
-@pytest.mark.asyncio
-async def test_confirm_brief_success(client, sample_creative_brief_dict):
+async def test_confirm_brief_success(client, sample_creative_brief_dict, mock_cosmos_service):
     """Test successful brief confirmation via /api/chat."""
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.save_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+    with patch("app.get_routing_service") as mock_routing:
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.save_conversation = AsyncStub()
 
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
@@ -403,30 +514,25 @@ async def test_confirm_brief_success(client, sample_creative_brief_dict):
         mock_routing.return_value = mock_routing_service
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={
                 "action": "confirm_brief",
-                "brief": sample_creative_brief_dict,
+                "brief": dict(sample_creative_brief_dict),
                 "conversation_id": "test-conv",
                 "user_id": "test-user"
             }
         )
 
         assert response.status_code == 200
-        data = await response.get_json()
+        data = await read_json(response)
         assert data["action_type"] == "brief_confirmed"
         assert "brief" in data["data"]
 
 
-@pytest.mark.asyncio
-async def test_confirm_brief_invalid_format(client):
+async def test_confirm_brief_invalid_format(client, mock_cosmos_service):
     """Test brief confirmation with invalid brief data via /api/chat."""
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos.return_value = mock_cosmos_service
+    with patch("app.get_routing_service") as mock_routing:
+        mock_cosmos_service.get_conversation = AsyncStub(None)
 
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
@@ -438,7 +544,7 @@ async def test_confirm_brief_invalid_format(client):
         mock_routing.return_value = mock_routing_service
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={
                 "action": "confirm_brief",
                 "brief": {"invalid": "data"},  # Missing required fields
@@ -447,46 +553,22 @@ async def test_confirm_brief_invalid_format(client):
         )
 
         assert response.status_code == 400
-        data = await response.get_json()
+        data = await read_json(response)
         assert "error" in data
 
 
-@pytest.mark.asyncio
-async def test_select_products_missing_request(client):
-    """Test product selection with missing message returns 400."""
-    response = await client.post(
-        "/api/chat",
-        json={
-            "action": "search_products",
-            "payload": {"current_products": []}
-            # Missing message
-        }
-    )
-
-    # message or action required - action is present so this should work
-    # but let's check if we need additional validation
-    assert response.status_code in [200, 400, 500]
-
-
-@pytest.mark.asyncio
-async def test_select_products_success(client, sample_product):
+async def test_select_products_success(client, sample_product, mock_cosmos_service, mock_orchestrator):
     """Test successful product selection via /api/chat."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.select_products = AsyncMock(return_value={
+    mock_orchestrator.select_products = AsyncStub({
         "products": [sample_product.model_dump()],
         "action": "add",
         "message": "Added Snow Veil to your selection"
     })
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos_service.get_all_products = AsyncMock(return_value=[sample_product])
-        mock_cosmos.return_value = mock_cosmos_service
+    with patch("app.get_routing_service") as mock_routing:
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.add_message_to_conversation = AsyncStub()
+        mock_cosmos_service.get_all_products = AsyncStub([sample_product])
 
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
@@ -498,7 +580,7 @@ async def test_select_products_success(client, sample_product):
         mock_routing.return_value = mock_routing_service
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={
                 "message": "Add Snow Veil",
                 "payload": {"current_products": []},
@@ -507,42 +589,32 @@ async def test_select_products_success(client, sample_product):
         )
 
         assert response.status_code == 200
-        data = await response.get_json()
+        data = await read_json(response)
         assert data["action_type"] == "products_found"  # Backend returns products_found
         assert "products" in data["data"]
 
 
-@pytest.mark.asyncio
 async def test_generate_content_missing_brief(client):
     """Test generation start with missing brief returns 400."""
     response = await client.post(
-        "/api/generate/start",
+        _URL_GENERATE_START,
         json={"products": []}
     )
 
     assert response.status_code == 400
-    data = await response.get_json()
+    data = await read_json(response)
     assert "error" in data
 
 
-@pytest.mark.asyncio
-async def test_generate_content_stream(client, sample_creative_brief_dict):
+async def test_generate_content_stream(client, sample_creative_brief_dict, mock_cosmos_service, mock_orchestrator):
     """Test content generation via /api/generate/start returns task_id."""
-    with patch("app.get_orchestrator") as mock_orch, \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.asyncio.create_task"):
-
-        mock_orchestrator = AsyncMock()
-        mock_orch.return_value = mock_orchestrator
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+    with patch("app.asyncio.create_task"):
+        mock_cosmos_service.add_message_to_conversation = AsyncStub()
 
         response = await client.post(
-            "/api/generate/start",
+            _URL_GENERATE_START,
             json={
-                "brief": sample_creative_brief_dict,
+                "brief": dict(sample_creative_brief_dict),
                 "products": [],
                 "generate_images": False,
                 "user_id": "test-user"
@@ -550,94 +622,105 @@ async def test_generate_content_stream(client, sample_creative_brief_dict):
         )
 
         assert response.status_code == 200
-        data = await response.get_json()
+        data = await read_json(response)
         assert "task_id" in data
         assert data["status"] == "pending"
 
 
-@pytest.mark.asyncio
-async def test_list_products(client, sample_product):
+async def test_list_products(client, sample_product, mock_cosmos_service):
     """Test listing products."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_all_products = AsyncMock(
-            return_value=[sample_product]
-        )
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.get_all_products = AsyncStub(
+        [sample_product]
+    )
 
-        response = await client.get("/api/products")
+    response = await client.get(_URL_PRODUCTS)
 
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert "products" in data
-        assert len(data["products"]) > 0
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert "products" in data
+    assert len(data["products"]) > 0
 
 
-@pytest.mark.asyncio
-async def test_get_product_by_sku(client, sample_product):
+async def test_get_product_by_sku(client, sample_product, mock_cosmos_service):
     """Test getting a specific product by SKU."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_product_by_sku = AsyncMock(
-            return_value=sample_product
-        )
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.get_product_by_sku = AsyncStub(
+        sample_product
+    )
 
-        response = await client.get(f"/api/products/{sample_product.sku}")
+    response = await client.get(f"/api/products/{sample_product.sku}")
 
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert data["sku"] == sample_product.sku
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert data["sku"] == sample_product.sku
 
 
-@pytest.mark.asyncio
-async def test_get_product_not_found(client):
+async def test_get_product_not_found(client, mock_cosmos_service):
     """Test getting a non-existent product."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_product_by_sku = AsyncMock(return_value=None)
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.get_product_by_sku = AsyncStub(None)
 
-        response = await client.get("/api/products/NONEXISTENT")
+    response = await client.get("/api/products/NONEXISTENT")
 
-        assert response.status_code == 404
+    assert response.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_create_product(client, sample_product_dict):
+async def test_create_product(client, sample_product_dict, mock_cosmos_service):
     """Test creating a new product."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        new_product = Product(**sample_product_dict)
-        mock_cosmos_service.upsert_product = AsyncMock(return_value=new_product)
-        mock_cosmos.return_value = mock_cosmos_service
+    new_product = Product(**sample_product_dict)
+    mock_cosmos_service.upsert_product = AsyncStub(new_product)
 
-        response = await client.post(
-            "/api/products",
-            json=sample_product_dict
-        )
+    response = await client.post(
+        _URL_PRODUCTS,
+        json=dict(sample_product_dict)
+    )
+
+    assert response.status_code == 201
+    data = await read_json(response)
+    assert data["sku"] == sample_product_dict["sku"]
+
+
+async def test_product_datetimes_use_http_date(client, sample_product_dict, mock_cosmos_service):
+    """Test datetimes in JSON responses keep Quart's HTTP-date format."""
+    product = Product(**{
+        **sample_product_dict,
+        "created_at": datetime(2025, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+    })
+    mock_cosmos_service.get_product_by_sku = AsyncStub(product)
+
+    response = await client.get(f"/api/products/{product.sku}")
+
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert data["created_at"] == "Thu, 02 Jan 2025 03:04:05 GMT"
+
+
+async def test_create_product_round_trips_non_ascii(client, sample_product_dict, mock_cosmos_service):
+    """Test non-ASCII text survives request decoding and response encoding."""
+    name = "Neige Éclat 雪"
+    mock_cosmos_service.upsert_product = AsyncMock(side_effect=lambda product: product)
+
+    response = await client.post(
+        _URL_PRODUCTS,
+        content=dumps_json({**sample_product_dict, "product_name": name}),
+        headers=JSON_HEADERS
+    )
 
-        assert response.status_code == 201
-        data = await response.get_json()
-        assert data["sku"] == sample_product_dict["sku"]
+    assert response.status_code == 201
+    data = await read_json(response)
+    assert data["product_name"] == name
+    assert name.encode() in response.content
 
 
-@pytest.mark.asyncio
 async def test_create_product_invalid_data(client):
     """Test creating a product with invalid data."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos.return_value = AsyncMock()
-
-        response = await client.post(
-            "/api/products",
-            json={"invalid": "data"}  # Missing required fields
-        )
+    response = await client.post(
+        _URL_PRODUCTS,
+        json={"invalid": "data"}  # Missing required fields
+    )
 
-        assert response.status_code == 400
+    assert response.status_code == 400
 
 
-@pytest.mark.asyncio
-async def test_list_conversations(client, authenticated_headers):
+async def test_list_conversations(client, authenticated_headers, mock_cosmos_service):
     """Test listing user conversations."""
     sample_conv = {
         "id": "conv-123",
@@ -646,105 +729,58 @@ async def test_list_conversations(client, authenticated_headers):
         "messages": []
     }
 
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_user_conversations = AsyncMock(
-            return_value=[sample_conv]
-        )
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.get_user_conversations = AsyncStub(
+        [sample_conv]
+    )
 
-        response = await client.get("/api/conversations", headers=authenticated_headers)
+    response = await client.get(_URL_CONVERSATIONS, headers=authenticated_headers)
 
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert "conversations" in data
-        assert len(data["conversations"]) == 1
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert "conversations" in data
+    assert len(data["conversations"]) == 1
 
 
-@pytest.mark.asyncio
-async def test_list_conversations_anonymous(client):
+async def test_list_conversations_anonymous(client, mock_cosmos_service):
     """Test listing conversations as anonymous user."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_user_conversations = AsyncMock(return_value=[])
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.get_user_conversations = AsyncStub([])
 
-        response = await client.get("/api/conversations")
+    response = await client.get(_URL_CONVERSATIONS)
 
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert "conversations" in data
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert "conversations" in data
 
 
-@pytest.mark.asyncio
-async def test_proxy_generated_image(client):
+async def test_proxy_generated_image(client, mock_blob_service, image_blob_factory):
     """Test proxying a generated image."""
     mock_blob_data = b"fake-image-data"
+    image_blob_factory(mock_blob_service, data=mock_blob_data)
 
-    with patch("app.get_blob_service") as mock_blob:
-        mock_blob_service = AsyncMock()
-        mock_blob_client = AsyncMock()
-        mock_blob_client.download_blob = AsyncMock()
-        mock_blob_client.download_blob.return_value.readall = AsyncMock(
-            return_value=mock_blob_data
-        )
-
-        mock_container = AsyncMock()
-        mock_container.get_blob_client = MagicMock(return_value=mock_blob_client)
-        mock_blob_service._generated_images_container = mock_container
-        mock_blob_service.initialize = AsyncMock()
-
-        mock_blob.return_value = mock_blob_service
+    response = await client.get("/api/images/conv-123/test.jpg")
 
-        response = await client.get("/api/images/conv-123/test.jpg")
-
-        assert response.status_code == 200
-        data = await response.get_data()
-        assert data == mock_blob_data
+    assert response.status_code == 200
+    assert response.content == mock_blob_data
 
 
-@pytest.mark.asyncio
-async def test_proxy_product_image(client):
+async def test_proxy_product_image(client, mock_blob_service, image_blob_factory):
     """Test proxying a product image."""
-    mock_blob_data = b"fake-product-image"
-
-    with patch("app.get_blob_service") as mock_blob:
-        mock_blob_service = AsyncMock()
-        mock_blob_client = AsyncMock()
-        mock_blob_client.download_blob = AsyncMock()
-        mock_blob_client.download_blob.return_value.readall = AsyncMock(
-            return_value=mock_blob_data
-        )
-
-        mock_container = AsyncMock()
-        mock_container.get_blob_client = MagicMock(return_value=mock_blob_client)
-        mock_blob_service._product_images_container = mock_container
-        mock_blob_service.initialize = AsyncMock()
-
-        mock_blob.return_value = mock_blob_service
+    image_blob_factory(mock_blob_service, data=b"fake-product-image")
 
-        response = await client.get("/api/product-images/product.jpg")
+    response = await client.get("/api/product-images/product.jpg")
 
-        assert response.status_code == 200
+    assert response.status_code == 200
 
 
-@pytest.mark.asyncio
-async def test_start_generation(client, sample_creative_brief_dict):
+async def test_start_generation(client, sample_creative_brief_dict, mock_cosmos_service, mock_orchestrator):
     """Test starting async generation task."""
-    with patch("app.get_orchestrator") as mock_orch, \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.asyncio.create_task"):
-
-        mock_orchestrator = AsyncMock()
-        mock_orch.return_value = mock_orchestrator
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+    with patch("app.asyncio.create_task"):
+        mock_cosmos_service.add_message_to_conversation = AsyncStub()
 
         response = await client.post(
-            "/api/generate/start",
+            _URL_GENERATE_START,
             json={
-                "brief": sample_creative_brief_dict,
+                "brief": dict(sample_creative_brief_dict),
                 "products": [],
                 "generate_images": False
             }
@@ -752,16 +788,15 @@ async def test_start_generation(client, sample_creative_brief_dict):
 
         # Returns 200 with task_id
         assert response.status_code == 200
-        data = await response.get_json()
+        data = await read_json(response)
         assert "task_id" in data
         assert data["status"] == "pending"
 
 
-@pytest.mark.asyncio
 async def test_start_generation_invalid_brief_format(client):
     """Test starting generation with invalid brief format."""
     response = await client.post(
-        "/api/generate/start",
+        _URL_GENERATE_START,
         json={
             "brief": {"invalid_field": "value"},  # Missing required fields
             "products": []
@@ -770,90 +805,72 @@ async def test_start_generation_invalid_brief_format(client):
 
     # Invalid brief format returns 400
     assert response.status_code == 400
-    data = await response.get_json()
+    data = await read_json(response)
     assert "error" in data
 
 
-@pytest.mark.asyncio
 async def test_get_generation_status_not_found(client):
     """Test getting status for non-existent task."""
-    response = await client.get("/api/generate/status/non-existent-task")
+    response = await client.get(_URL_STATUS + "non-existent-task")
 
     assert response.status_code == 404
-    data = await response.get_json()
+    data = await read_json(response)
     assert "error" in data
 
 
-@pytest.mark.asyncio
-async def test_get_generation_status_found(client):
+async def test_get_generation_status_found(client, gen_task):
     """Test getting status for existing task."""
-    import app
-    app._generation_tasks["test-task-id"] = {
+    gen_task("test-task-id", {
         "status": "running",
         "conversation_id": "conv-123",
         "created_at": "2024-01-01T00:00:00Z",
         "started_at": "2024-01-01T00:00:01Z",
         "result": None,
         "error": None
-    }
+    })
 
-    response = await client.get("/api/generate/status/test-task-id")
+    response = await client.get(_URL_STATUS + "test-task-id")
 
     assert response.status_code == 200
-    data = await response.get_json()
+    data = await read_json(response)
     assert data["status"] == "running"
     assert data["task_id"] == "test-task-id"
 
-    # Cleanup
-    del app._generation_tasks["test-task-id"]
 
-
-@pytest.mark.asyncio
-async def test_get_generation_status_completed(client):
+async def test_get_generation_status_completed(client, gen_task):
     """Test getting status for completed task."""
-    import app
-    app._generation_tasks["completed-task"] = {
+    gen_task("completed-task", {
         "status": "completed",
         "conversation_id": "conv-123",
         "created_at": "2024-01-01T00:00:00Z",
         "completed_at": "2024-01-01T00:01:00Z",
         "result": {"headline": "Generated headline"},
         "error": None
-    }
+    })
 
-    response = await client.get("/api/generate/status/completed-task")
+    response = await client.get(_URL_STATUS + "completed-task")
 
     assert response.status_code == 200
-    data = await response.get_json()
+    data = await read_json(response)
     assert data["status"] == "completed"
     assert "result" in data
 
-    # Cleanup
-    del app._generation_tasks["completed-task"]
 
-
-@pytest.mark.asyncio
-async def test_regenerate_content_success(client, sample_creative_brief_dict):
+async def test_regenerate_content_success(client, sample_creative_brief_dict, mock_cosmos_service, mock_orchestrator):
     """Test successful content regeneration via /api/chat."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.regenerate_image = AsyncMock(return_value={
+    mock_orchestrator.regenerate_image = AsyncStub({
         "image_url": "https://test.blob/image.jpg",
         "image_prompt": "New image prompt"
     })
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value={
+    with patch("app.get_routing_service") as mock_routing:
+        mock_cosmos_service.get_conversation = AsyncStub({
             "id": "test-conv",
-            "brief": sample_creative_brief_dict,
+            "brief": dict(sample_creative_brief_dict),
             "generated_content": {"image_url": "old.jpg"}
         })
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos_service.save_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+        mock_cosmos_service.add_message_to_conversation = AsyncStub()
+        mock_cosmos_service.save_conversation = AsyncStub()
 
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
@@ -866,7 +883,7 @@ async def test_regenerate_content_success(client, sample_creative_brief_dict):
         mock_routing.return_value = mock_routing_service
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={
                 "message": "Show a kitchen instead",
                 "conversation_id": "test-conv",
@@ -875,41 +892,36 @@ async def test_regenerate_content_success(client, sample_creative_brief_dict):
         )
 
         assert response.status_code == 200
-        data = await response.get_json()
+        data = await read_json(response)
         # Response should indicate regeneration started
         assert data["action_type"] in ["regeneration_started", "image_modified", "content_generated", "error"]
 
 
-@pytest.mark.asyncio
-async def test_regenerate_content_missing_modification_request(client, sample_creative_brief_dict):
+async def test_regenerate_content_missing_modification_request(dispatch_request, sample_creative_brief_dict):
     """Test regeneration rejects missing message with 400."""
-    response = await client.post(
-        "/api/chat",
+    response = await dispatch_request(
+        _URL_CHAT,
+        "POST",
         json={
             "conversation_id": "test-conv"
         }
     )
 
     assert response.status_code == 400
-    data = await response.get_json()
+    data = await read_json(response)
     assert data["action_type"] == "error"
 
 
-@pytest.mark.asyncio
-async def test_upload_product_image_product_not_found(client):
+async def test_upload_product_image_product_not_found(client, mock_cosmos_service):
     """Test uploading image for non-existent product returns 404."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_product_by_sku = AsyncMock(return_value=None)
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.get_product_by_sku = AsyncStub(None)
 
-        response = await client.post("/api/products/NONEXISTENT/image")
+    response = await client.post("/api/products/NONEXISTENT/image")
 
-        assert response.status_code == 404
+    assert response.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_get_conversation_success(client, authenticated_headers):
+async def test_get_conversation_success(client, authenticated_headers, mock_cosmos_service):
     """Test getting a specific conversation."""
     sample_conv = {
         "id": "conv-123",
@@ -921,121 +933,74 @@ async def test_get_conversation_success(client, authenticated_headers):
         ]
     }
 
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=sample_conv)
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.get_conversation = AsyncStub(sample_conv)
 
-        response = await client.get("/api/conversations/conv-123", headers=authenticated_headers)
+    response = await client.get("/api/conversations/conv-123", headers=authenticated_headers)
 
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert data["id"] == "conv-123"
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert data["id"] == "conv-123"
 
 
-@pytest.mark.asyncio
-async def test_get_conversation_not_found(client, authenticated_headers):
+async def test_get_conversation_not_found(client, authenticated_headers, mock_cosmos_service):
     """Test getting a non-existent conversation."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.get_conversation = AsyncStub(None)
 
-        response = await client.get("/api/conversations/invalid-conv", headers=authenticated_headers)
+    response = await client.get("/api/conversations/invalid-conv", headers=authenticated_headers)
 
-        assert response.status_code == 404
+    assert response.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_delete_conversation_success(client, authenticated_headers):
+async def test_delete_conversation_success(client, authenticated_headers, mock_cosmos_service):
     """Test deleting a conversation."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.delete_conversation = AsyncMock(return_value=True)
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.delete_conversation = AsyncStub(True)
 
-        response = await client.delete("/api/conversations/conv-123", headers=authenticated_headers)
+    response = await client.delete("/api/conversations/conv-123", headers=authenticated_headers)
 
-        assert response.status_code == 200
+    assert response.status_code == 200
 
 
-@pytest.mark.asyncio
-async def test_delete_conversation_not_found(client, authenticated_headers):
+async def test_delete_conversation_not_found(client, authenticated_headers, mock_cosmos_service):
     """Test deleting a non-existent conversation."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.delete_conversation = AsyncMock(return_value=False)
-        mock_cosmos.return_value = mock_cosmos_service
-
-        response = await client.delete("/api/conversations/invalid-conv", headers=authenticated_headers)
-
-        # May return 404 or 200 depending on implementation
-        assert response.status_code in [200, 404]
+    mock_cosmos_service.delete_conversation = AsyncStub(False)
 
+    response = await client.delete("/api/conversations/invalid-conv", headers=authenticated_headers)
 
-@pytest.mark.asyncio
-async def test_product_search_endpoint_exists(client):
-    """Test that product search functionality is available."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.search_products = AsyncMock(return_value=[])
-        mock_cosmos.return_value = mock_cosmos_service
+    # May return 404 or 200 depending on implementation
+    assert response.status_code in [200, 404]
 
-        # Test with search parameter
-        response = await client.get("/api/products?search=white")
 
-        # Either search is supported via query param or as separate endpoint
-        assert response.status_code in [200, 404]
-
-
-@pytest.mark.asyncio
-async def test_update_product_via_post(client, sample_product, sample_product_dict):
+async def test_update_product_via_post(client, sample_product, sample_product_dict, mock_cosmos_service):
     """Test updating a product via POST (likely supported method)."""
-    updated_dict = sample_product_dict.copy()
+    updated_dict = dict(sample_product_dict)
     updated_dict["product_name"] = "Updated Product Name"
 
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        updated_product = Product(**updated_dict)
-        mock_cosmos_service.upsert_product = AsyncMock(return_value=updated_product)
-        mock_cosmos.return_value = mock_cosmos_service
-
-        response = await client.post(
-            "/api/products",
-            json=updated_dict
-        )
-
-        # POST to /api/products creates/updates product
-        assert response.status_code in [200, 201]
-
-
-@pytest.mark.asyncio
-async def test_delete_product_endpoint(client, sample_product):
-    """Test deleting a product if endpoint exists."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.delete_product = AsyncMock(return_value=True)
-        mock_cosmos.return_value = mock_cosmos_service
+    updated_product = Product(**updated_dict)
+    mock_cosmos_service.upsert_product = AsyncStub(updated_product)
 
-        response = await client.delete(f"/api/products/{sample_product.sku}")
+    response = await client.post(
+        _URL_PRODUCTS,
+        json=updated_dict
+    )
 
-        # May return 200, 204 on success or 404/405 if endpoint doesn't exist
-        assert response.status_code in [200, 204, 404, 405]
+    # POST to /api/products creates/updates product
+    assert response.status_code in [200, 201]
 
 
-@pytest.mark.asyncio
 async def test_invalid_json_request(client):
     """Test handling of invalid JSON in request body."""
     response = await client.post(
-        "/api/chat",
-        data="invalid json",
-        headers={"Content-Type": "application/json"}
+        _URL_CHAT,
+        content="invalid json",
+        headers=JSON_HEADERS
     )
 
+    # Quart's own Bad Request page, not one of the endpoint's JSON errors
     assert response.status_code == 400
+    assert b"Bad Request" in response.content
+    assert b"action_type" not in response.content
 
 
-@pytest.mark.asyncio
 async def test_method_not_allowed(client):
     """Test method not allowed error."""
     response = await client.patch("/api/health")
@@ -1043,11 +1008,10 @@ async def test_method_not_allowed(client):
     assert response.status_code == 405
 
 
-@pytest.mark.asyncio
 async def test_cors_headers(client):
     """Test CORS headers in response."""
     response = await client.options(
-        "/api/chat",
+        _URL_CHAT,
         headers={
             "Origin": "http://localhost:3000",
             "Access-Control-Request-Method": "POST"
@@ -1057,395 +1021,251 @@ async def test_cors_headers(client):
     assert response.status_code in [200, 204]
 
 
-@pytest.mark.asyncio
-async def test_version_info_in_health(client):
+async def test_version_info_in_health(dispatch_request):
     """Test version info is available in health response."""
-    response = await client.get("/health")
+    response = await dispatch_request("/health")
 
     assert response.status_code == 200
-    data = await response.get_json()
+    data = await read_json(response)
     # Version may be in health endpoint
     assert "status" in data
 
 
-@pytest.mark.asyncio
-async def test_index_returns_html(client):
-    """Test that root path returns HTML."""
-    response = await client.get("/")
-
-    # Should return frontend index.html or redirect
-    assert response.status_code in [200, 302, 404]
-
-
-@pytest.mark.asyncio
-async def test_rate_limit_handling(client):
+async def test_rate_limit_handling(client, mock_orchestrator):
     """Test that rate limit scenarios are handled gracefully."""
-    mock_orchestrator = AsyncMock()
-
-    from openai import RateLimitError
-
     async def mock_process_message(*_args, **_kwargs):
         raise RateLimitError("Rate limit exceeded", response=MagicMock(status_code=429), body={})
 
     mock_orchestrator.process_message = mock_process_message
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos:
-
-        mock_cosmos.return_value = AsyncMock()
-
-        response = await client.post(
-            "/api/chat",
-            json={"message": "Hello", "user_id": "test"}
-        )
+    response = await client.post(
+        _URL_CHAT,
+        content=_CHAT_HELLO_BODY,
+        headers=JSON_HEADERS
+    )
 
-        # Should handle rate limit gracefully
-        assert response.status_code in [200, 429, 500, 503]
+    # Should handle rate limit gracefully
+    assert response.status_code in [200, 429, 500, 503]
 
 
-@pytest.mark.asyncio
-async def test_request_timeout_handling(client):
+async def test_request_timeout_handling(client, mock_orchestrator):
     """Test timeout handling in requests."""
-    mock_orchestrator = AsyncMock()
-
-    import asyncio  # noqa: F811
-
     async def mock_process_message(*_args, **_kwargs):
         raise asyncio.TimeoutError("Request timed out")
 
     mock_orchestrator.process_message = mock_process_message
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos:
-
-        mock_cosmos.return_value = AsyncMock()
-
-        response = await client.post(
-            "/api/chat",
-            json={"message": "Hello", "user_id": "test"}
-        )
+    response = await client.post(
+        _URL_CHAT,
+        content=_CHAT_HELLO_BODY,
+        headers=JSON_HEADERS
+    )
 
-        # Should handle timeout gracefully
-        assert response.status_code in [200, 500, 504]
+    # Should handle timeout gracefully
+    assert response.status_code in [200, 500, 504]
 
 
-@pytest.mark.asyncio
-async def test_run_generation_task_success():
+async def test_run_generation_task_success(app_module, mock_cosmos_service, mock_blob_service, mock_orchestrator, gen_task):
     """Test successful background generation task execution."""
-    import app
-
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.generate_content = AsyncMock(return_value={
+    mock_orchestrator.generate_content = AsyncStub({
         "text_content": "Generated content",
         "image_url": None,
         "violations": []
     })
 
-    mock_cosmos_service = AsyncMock()
-    mock_cosmos_service.add_message_to_conversation = AsyncMock()
-    mock_cosmos_service.save_generated_content = AsyncMock()
-
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service", return_value=mock_cosmos_service), \
-         patch("app.get_blob_service") as mock_blob:
-
-        mock_blob.return_value = AsyncMock()
-
-        brief = CreativeBrief(
-            overview="Test campaign",
-            objectives="Increase sales",
-            target_audience="Adults",
-            key_message="Quality",
-            tone_and_style="Professional",
-            deliverable="Post",
-            timelines="Q2",
-            visual_guidelines="Clean",
-            cta="Buy now"
-        )
-
-        task_id = "test-task-1"
-        app._generation_tasks[task_id] = {
-            "status": "pending",
-            "conversation_id": "conv-123",
-            "created_at": "2024-01-01T00:00:00Z",
-            "result": None,
-            "error": None
-        }
+    mock_cosmos_service.add_message_to_conversation = AsyncStub()
+    mock_cosmos_service.save_generated_content = AsyncStub()
+
+    brief = CreativeBrief(
+        overview="Test campaign",
+        objectives="Increase sales",
+        target_audience="Adults",
+        key_message="Quality",
+        tone_and_style="Professional",
+        deliverable="Post",
+        timelines="Q2",
+        visual_guidelines="Clean",
+        cta="Buy now"
+    )
 
-        await app._run_generation_task(
-            task_id=task_id,
-            brief=brief,
-            products_data=[],
-            generate_images=False,
-            conversation_id="conv-123",
-            user_id="test-user"
-        )
+    task_id = "test-task-1"
+    gen_task(task_id, {
+        "status": "pending",
+        "conversation_id": "conv-123",
+        "created_at": "2024-01-01T00:00:00Z",
+        "result": None,
+        "error": None
+    })
 
-        assert app._generation_tasks[task_id]["status"] == "completed"
-        assert app._generation_tasks[task_id]["result"]["text_content"] == "Generated content"
+    await app_module._run_generation_task(
+        task_id=task_id,
+        brief=brief,
+        products_data=[],
+        generate_images=False,
+        conversation_id="conv-123",
+        user_id="test-user"
+    )
 
-        del app._generation_tasks[task_id]
+    assert app_module._generation_tasks[task_id]["status"] == "completed"
+    assert app_module._generation_tasks[task_id]["result"]["text_content"] == "Generated content"
 
 
-@pytest.mark.asyncio
-async def test_run_generation_task_with_image_blob_url():
+async def test_run_generation_task_with_image_blob_url(app_module, mock_cosmos_service, mock_orchestrator, gen_task):
     """Test generation task with image blob URL from orchestrator."""
-    import app
-
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.generate_content = AsyncMock(return_value={
+    mock_orchestrator.generate_content = AsyncStub({
         "text_content": "Content with image",
         "image_blob_url": "https://storage.blob/generated/conv-123/image.png",
         "violations": []
     })
 
-    mock_cosmos_service = AsyncMock()
-    mock_cosmos_service.add_message_to_conversation = AsyncMock()
-    mock_cosmos_service.save_generated_content = AsyncMock()
-
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service", return_value=mock_cosmos_service):
-
-        brief = CreativeBrief(
-            overview="Test",
-            objectives="Goals",
-            target_audience="Adults",
-            key_message="Message",
-            tone_and_style="Pro",
-            deliverable="Post",
-            timelines="Q2",
-            visual_guidelines="Clean",
-            cta="Buy"
-        )
+    mock_cosmos_service.add_message_to_conversation = AsyncStub()
+    mock_cosmos_service.save_generated_content = AsyncStub()
 
-        task_id = "test-task-img"
-        app._generation_tasks[task_id] = {
-            "status": "pending",
-            "conversation_id": "conv-123",
-            "created_at": "2024-01-01T00:00:00Z",
-            "result": None,
-            "error": None
-        }
+    brief = CreativeBrief(**_BRIEF)
 
-        await app._run_generation_task(
-            task_id=task_id,
-            brief=brief,
-            products_data=[],
-            generate_images=True,
-            conversation_id="conv-123",
-            user_id="test-user"
-        )
+    task_id = "test-task-img"
+    gen_task(task_id, {
+        "status": "pending",
+        "conversation_id": "conv-123",
+        "created_at": "2024-01-01T00:00:00Z",
+        "result": None,
+        "error": None
+    })
 
-        result = app._generation_tasks[task_id]["result"]
-        assert "image_url" in result
-        assert "/api/images/" in result["image_url"]
+    await app_module._run_generation_task(
+        task_id=task_id,
+        brief=brief,
+        products_data=[],
+        generate_images=True,
+        conversation_id="conv-123",
+        user_id="test-user"
+    )
 
-        del app._generation_tasks[task_id]
+    result = app_module._generation_tasks[task_id]["result"]
+    assert "image_url" in result
+    assert "/api/images/" in result["image_url"]
 
 
-@pytest.mark.asyncio
-async def test_run_generation_task_with_base64_fallback():
+async def test_run_generation_task_with_base64_fallback(app_module, mock_cosmos_service, mock_blob_service, mock_orchestrator, gen_task):
     """Test generation task falling back to blob save for base64 image."""
-    import app
-
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.generate_content = AsyncMock(return_value={
+    mock_orchestrator.generate_content = AsyncStub({
         "text_content": "Content with base64",
         "image_base64": "base64encodeddata",
         "violations": []
     })
 
-    mock_cosmos_service = AsyncMock()
-    mock_cosmos_service.add_message_to_conversation = AsyncMock()
-    mock_cosmos_service.save_generated_content = AsyncMock()
+    mock_cosmos_service.add_message_to_conversation = AsyncStub()
+    mock_cosmos_service.save_generated_content = AsyncStub()
 
-    mock_blob_service = AsyncMock()
-    mock_blob_service.save_generated_image = AsyncMock(
-        return_value="https://storage.blob/generated/conv-123/saved-image.png"
+    mock_blob_service.save_generated_image = AsyncStub(
+        "https://storage.blob/generated/conv-123/saved-image.png"
     )
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service", return_value=mock_cosmos_service), \
-         patch("app.get_blob_service", return_value=mock_blob_service):
-
-        brief = CreativeBrief(
-            overview="Test",
-            objectives="Goals",
-            target_audience="Adults",
-            key_message="Message",
-            tone_and_style="Pro",
-            deliverable="Post",
-            timelines="Q2",
-            visual_guidelines="Clean",
-            cta="Buy"
-        )
-
-        task_id = "test-task-base64"
-        app._generation_tasks[task_id] = {
-            "status": "pending",
-            "conversation_id": "conv-123",
-            "created_at": "2024-01-01T00:00:00Z",
-            "result": None,
-            "error": None
-        }
+    brief = CreativeBrief(**_BRIEF)
 
-        await app._run_generation_task(
-            task_id=task_id,
-            brief=brief,
-            products_data=[],
-            generate_images=True,
-            conversation_id="conv-123",
-            user_id="test-user"
-        )
+    task_id = "test-task-base64"
+    gen_task(task_id, {
+        "status": "pending",
+        "conversation_id": "conv-123",
+        "created_at": "2024-01-01T00:00:00Z",
+        "result": None,
+        "error": None
+    })
 
-        result = app._generation_tasks[task_id]["result"]
-        assert "image_url" in result
-        assert "base64" not in result
+    await app_module._run_generation_task(
+        task_id=task_id,
+        brief=brief,
+        products_data=[],
+        generate_images=True,
+        conversation_id="conv-123",
+        user_id="test-user"
+    )
 
-        del app._generation_tasks[task_id]
+    result = app_module._generation_tasks[task_id]["result"]
+    assert "image_url" in result
+    assert "base64" not in result
 
 
-@pytest.mark.asyncio
-async def test_run_generation_task_failure():
+async def test_run_generation_task_failure(app_module, mock_orchestrator, gen_task):
     """Test generation task handles failures gracefully."""
-    import app
-
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.generate_content = AsyncMock(
-        side_effect=Exception("Generation failed")
+    mock_orchestrator.generate_content = AsyncStub(
+        exc=Exception("Generation failed")
     )
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator):
-        brief = CreativeBrief(
-            overview="Test",
-            objectives="Goals",
-            target_audience="Adults",
-            key_message="Message",
-            tone_and_style="Pro",
-            deliverable="Post",
-            timelines="Q2",
-            visual_guidelines="Clean",
-            cta="Buy"
-        )
-
-        task_id = "test-task-fail"
-        app._generation_tasks[task_id] = {
-            "status": "pending",
-            "conversation_id": "conv-123",
-            "created_at": "2024-01-01T00:00:00Z",
-            "result": None,
-            "error": None
-        }
-
-        await app._run_generation_task(
-            task_id=task_id,
-            brief=brief,
-            products_data=[],
-            generate_images=False,
-            conversation_id="conv-123",
-            user_id="test-user"
-        )
-
-        assert app._generation_tasks[task_id]["status"] == "failed"
-        assert "Generation failed" in app._generation_tasks[task_id]["error"]
-
-        del app._generation_tasks[task_id]
-
-
-@pytest.mark.asyncio
-async def test_list_products_with_category_filter(client, sample_product):
-    """Test listing products filtered by category."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_products_by_category = AsyncMock(
-            return_value=[sample_product]
-        )
-        mock_cosmos.return_value = mock_cosmos_service
-
-        response = await client.get("/api/products?category=Interior%20Paint")
-
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert "products" in data
-
+    brief = CreativeBrief(**_BRIEF)
 
-@pytest.mark.asyncio
-async def test_list_products_with_search_filter(client, sample_product):
-    """Test listing products with search filter."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.search_products = AsyncMock(return_value=[sample_product])
-        mock_cosmos.return_value = mock_cosmos_service
+    task_id = "test-task-fail"
+    gen_task(task_id, {
+        "status": "pending",
+        "conversation_id": "conv-123",
+        "created_at": "2024-01-01T00:00:00Z",
+        "result": None,
+        "error": None
+    })
 
-        response = await client.get("/api/products?search=white")
+    await app_module._run_generation_task(
+        task_id=task_id,
+        brief=brief,
+        products_data=[],
+        generate_images=False,
+        conversation_id="conv-123",
+        user_id="test-user"
+    )
 
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert "products" in data
+    assert app_module._generation_tasks[task_id]["status"] == "failed"
+    assert "Generation failed" in app_module._generation_tasks[task_id]["error"]
 
 
-@pytest.mark.asyncio
-async def test_list_products_with_limit(client, sample_product):
-    """Test listing products with limit parameter."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_all_products = AsyncMock(return_value=[sample_product])
-        mock_cosmos.return_value = mock_cosmos_service
+@pytest.mark.parametrize("query,cosmos_method", [
+    ("category=Interior%20Paint", "get_products_by_category"),
+    ("search=white", "search_products"),
+    ("limit=5", "get_all_products"),
+])
+async def test_list_products_with_query(client, sample_product, query, cosmos_method, mock_cosmos_service):
+    """Test listing products with category, search, and limit query params."""
+    setattr(mock_cosmos_service, cosmos_method, AsyncMock(return_value=[sample_product]))
 
-        response = await client.get("/api/products?limit=5")
+    response = await client.get(f"/api/products?{query}")
 
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert "products" in data
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert "products" in data
+    getattr(mock_cosmos_service, cosmos_method).assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_upload_product_image_success(client, sample_product):
+async def test_upload_product_image_success(client, sample_product, mock_cosmos_service, mock_blob_service):
     """Test successful product image upload."""
     from io import BytesIO
 
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_blob_service") as mock_blob:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_product_by_sku = AsyncMock(return_value=sample_product)
-        mock_cosmos_service.upsert_product = AsyncMock(return_value=sample_product)
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.get_product_by_sku = AsyncStub(sample_product)
+    mock_cosmos_service.upsert_product = AsyncStub(sample_product)
 
-        mock_blob_service = AsyncMock()
-        mock_blob_service.upload_product_image = AsyncMock(
-            return_value=("https://storage.blob/product.png", "A white paint can")
-        )
-        mock_blob.return_value = mock_blob_service
+    mock_blob_service.upload_product_image = AsyncStub(
+        ("https://storage.blob/product.png", "A white paint can")
+    )
 
-        # Create fake image data
-        data = {"image": (BytesIO(b"fake image data"), "test.jpg")}
+    # Create fake image data
+    files = {"image": ("test.jpg", BytesIO(b"fake image data"), "image/jpeg")}
 
-        response = await client.post(
-            f"/api/products/{sample_product.sku}/image",
-            data=data,
-            headers={"Content-Type": "multipart/form-data"}
-        )
+    response = await client.post(
+        f"/api/products/{sample_product.sku}/image",
+        files=files
+    )
 
-        # May fail due to multipart handling, but verify endpoint exists
-        assert response.status_code in [200, 400, 415]
+    # May fail due to multipart handling, but verify endpoint exists
+    assert response.status_code in [200, 400, 415]
 
 
-@pytest.mark.asyncio
-async def test_upload_product_image_no_file(client, sample_product):
+async def test_upload_product_image_no_file(client, sample_product, mock_cosmos_service):
     """Test product image upload without file."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_product_by_sku = AsyncMock(return_value=sample_product)
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.get_product_by_sku = AsyncStub(sample_product)
 
-        response = await client.post(f"/api/products/{sample_product.sku}/image")
+    response = await client.post(f"/api/products/{sample_product.sku}/image")
 
-        assert response.status_code == 400
+    assert response.status_code == 400
 
 
-@pytest.mark.asyncio
-async def test_get_conversation_detail(client, authenticated_headers):
+async def test_get_conversation_detail(client, authenticated_headers, mock_cosmos_service):
     """Test getting conversation detail."""
     conv_detail = {
         "id": "conv-detail-123",
@@ -1458,96 +1278,51 @@ async def test_get_conversation_detail(client, authenticated_headers):
         "brief": {"overview": "Test brief"}
     }
 
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=conv_detail)
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.get_conversation = AsyncStub(conv_detail)
 
-        response = await client.get("/api/conversations/conv-detail-123", headers=authenticated_headers)
+    response = await client.get("/api/conversations/conv-detail-123", headers=authenticated_headers)
 
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert data["id"] == "conv-detail-123"
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert data["id"] == "conv-detail-123"
 
 
-@pytest.mark.asyncio
-async def test_proxy_image_not_found(client):
+async def test_proxy_image_not_found(client, mock_blob_service, image_blob_factory):
     """Test image proxy when image doesn't exist."""
-    with patch("app.get_blob_service") as mock_blob:
-        mock_blob_service = AsyncMock()
-        mock_blob_service.initialize = AsyncMock()
-
-        mock_container = AsyncMock()
-        mock_blob_client = AsyncMock()
-        mock_blob_client.download_blob = AsyncMock(
-            side_effect=Exception("Blob not found")
-        )
-        mock_container.get_blob_client = MagicMock(return_value=mock_blob_client)
-        mock_blob_service._generated_images_container = mock_container
-
-        mock_blob.return_value = mock_blob_service
+    image_blob_factory(mock_blob_service, download_error=Exception("Blob not found"))
 
-        response = await client.get("/api/images/conv-404/missing.jpg")
+    response = await client.get("/api/images/conv-404/missing.jpg")
 
-        assert response.status_code == 404
+    assert response.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_proxy_product_image_with_cache(client):
+async def test_proxy_product_image_with_cache(client, mock_blob_service, image_blob_factory):
     """Test product image proxy with cache headers."""
-    mock_blob_data = b"cached-image-data"
-
-    with patch("app.get_blob_service") as mock_blob:
-        mock_blob_service = AsyncMock()
-        mock_blob_service.initialize = AsyncMock()
-
-        mock_blob_client = AsyncMock()
-        mock_download = AsyncMock()
-        mock_download.readall = AsyncMock(return_value=mock_blob_data)
-        mock_blob_client.download_blob = AsyncMock(return_value=mock_download)
-
-        from datetime import datetime, timezone
-        mock_properties = MagicMock()
-        mock_properties.etag = '"test-etag"'
-        mock_properties.last_modified = datetime.now(timezone.utc)
-        mock_blob_client.get_blob_properties = AsyncMock(return_value=mock_properties)
-
-        mock_container = AsyncMock()
-        mock_container.get_blob_client = MagicMock(return_value=mock_blob_client)
-        mock_blob_service._product_images_container = mock_container
-
-        mock_blob.return_value = mock_blob_service
+    mock_properties = MagicMock()
+    mock_properties.etag = '"test-etag"'
+    mock_properties.last_modified = _TEST_NOW
+    image_blob_factory(
+        mock_blob_service, data=b"cached-image-data", properties=mock_properties
+    )
 
-        response = await client.get("/api/product-images/cached-product.png")
+    response = await client.get("/api/product-images/cached-product.png")
 
-        assert response.status_code == 200
-        # Check for cache headers (case-insensitive)
-        headers_dict = {k.lower(): v for k, v in dict(response.headers).items()}
-        assert "cache-control" in headers_dict
+    assert response.status_code == 200
+    # Check for cache headers (case-insensitive)
+    headers_dict = {k.lower(): v for k, v in dict(response.headers).items()}
+    assert "cache-control" in headers_dict
 
 
-@pytest.mark.asyncio
-async def test_generate_content_stream_with_products(client, sample_creative_brief_dict, sample_product):
+async def test_generate_content_stream_with_products(client, sample_creative_brief_dict, sample_product, mock_cosmos_service, mock_blob_service, mock_orchestrator):
     """Test generation with products via /api/generate/start."""
-    with patch("app.get_orchestrator") as mock_orch, \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_blob_service") as mock_blob, \
-         patch("app.asyncio.create_task"):
-
-        mock_orchestrator = AsyncMock()
-        mock_orch.return_value = mock_orchestrator
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos_service.save_generated_content = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
-
-        mock_blob.return_value = AsyncMock()
+    with patch("app.asyncio.create_task"):
+        mock_cosmos_service.add_message_to_conversation = AsyncStub()
+        mock_cosmos_service.save_generated_content = AsyncStub()
 
         response = await client.post(
-            "/api/generate/start",
+            _URL_GENERATE_START,
             json={
-                "brief": sample_creative_brief_dict,
+                "brief": dict(sample_creative_brief_dict),
                 "products": [sample_product.model_dump()],
                 "generate_images": False,
                 "user_id": "test-user"
@@ -1555,31 +1330,24 @@ async def test_generate_content_stream_with_products(client, sample_creative_bri
         )
 
         assert response.status_code == 200
-        data = await response.get_json()
+        data = await read_json(response)
         assert "task_id" in data
 
 
-@pytest.mark.asyncio
-async def test_regenerate_content_stream(client, sample_creative_brief_dict):
+async def test_regenerate_content_stream(client, sample_creative_brief_dict, mock_cosmos_service, mock_orchestrator):
     """Test content regeneration via /api/chat with image modification."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.regenerate_image = AsyncMock(return_value={
+    mock_orchestrator.regenerate_image = AsyncStub({
         "image_url": "https://storage.blob/modified-image.png",
         "text_content": "Modified content"
     })
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value={
-            "brief": sample_creative_brief_dict,
+    with patch("app.get_routing_service") as mock_routing:
+        mock_cosmos_service.get_conversation = AsyncStub({
+            "brief": dict(sample_creative_brief_dict),
             "generated_content": {"image_url": "old.jpg"}
         })
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos_service.save_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+        mock_cosmos_service.add_message_to_conversation = AsyncStub()
+        mock_cosmos_service.save_conversation = AsyncStub()
 
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
@@ -1592,7 +1360,7 @@ async def test_regenerate_content_stream(client, sample_creative_brief_dict):
         mock_routing.return_value = mock_routing_service
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={
                 "message": "Make it more colorful",
                 "has_generated_content": True
@@ -1600,67 +1368,55 @@ async def test_regenerate_content_stream(client, sample_creative_brief_dict):
         )
 
         assert response.status_code == 200
-        data = await response.get_json()
+        data = await read_json(response)
         assert "action_type" in data
 
 
-@pytest.mark.asyncio
-async def test_chat_sse_format(client):
+async def test_chat_sse_format(client, mock_cosmos_service, mock_orchestrator, patches):
     """Test chat endpoint returns proper JSON format."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.parse_brief = AsyncMock(return_value=(
+    mock_orchestrator.parse_brief = AsyncStub((
         MagicMock(model_dump=lambda: {"overview": "Test"}),
         None,
         False
     ))
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing, \
-         patch("app.get_title_service") as mock_title:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos_service.save_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
-
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.PARSE_BRIEF,
-            confidence=0.9
-        ))
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
-        mock_routing.return_value = mock_routing_service
+    mock_routing = patches("app.get_routing_service")
+    mock_title = patches("app.get_title_service")
+    mock_cosmos_service.get_conversation = AsyncStub(None)
+    mock_cosmos_service.add_message_to_conversation = AsyncStub()
+    mock_cosmos_service.save_conversation = AsyncStub()
+
+    from services.routing_service import Intent, RoutingResult, ConversationState
+    mock_routing_service = MagicMock()
+    mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
+        intent=Intent.PARSE_BRIEF,
+        confidence=0.9
+    ))
+    mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
+    mock_routing.return_value = mock_routing_service
 
-        mock_title_service = MagicMock()
-        mock_title_service.generate_title = AsyncMock(return_value="Title")
-        mock_title.return_value = mock_title_service
+    mock_title_service = MagicMock()
+    mock_title_service.generate_title = AsyncStub("Title")
+    mock_title.return_value = mock_title_service
 
-        response = await client.post(
-            "/api/chat",
-            json={"message": "Create a campaign", "user_id": "test"}
-        )
+    response = await client.post(
+        _URL_CHAT,
+        json={"message": "Create a campaign", "user_id": "test"}
+    )
 
-        assert response.status_code == 200
-        # Now returns JSON, not SSE
-        assert response.mimetype == "application/json"
+    assert response.status_code == 200
+    # Now returns JSON, not SSE
+    assert response.headers["content-type"] == "application/json"
 
 
-@pytest.mark.asyncio
-async def test_update_brief(client, sample_creative_brief_dict):
+async def test_update_brief(client, sample_creative_brief_dict, mock_cosmos_service):
     """Test updating a brief via /api/chat with confirm_brief action."""
-    updated_brief = sample_creative_brief_dict.copy()
+    updated_brief = dict(sample_creative_brief_dict)
     updated_brief["overview"] = "Updated campaign overview"
 
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.save_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+    with patch("app.get_routing_service") as mock_routing:
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.save_conversation = AsyncStub()
 
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
@@ -1672,7 +1428,7 @@ async def test_update_brief(client, sample_creative_brief_dict):
         mock_routing.return_value = mock_routing_service
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={
                 "action": "confirm_brief",
                 "brief": updated_brief,
@@ -1682,12 +1438,11 @@ async def test_update_brief(client, sample_creative_brief_dict):
         )
 
         assert response.status_code == 200
-        data = await response.get_json()
+        data = await read_json(response)
         assert data["action_type"] == "brief_confirmed"
 
 
-@pytest.mark.asyncio
-async def test_product_image_url_conversion(client, sample_product):
+async def test_product_image_url_conversion(client, sample_product, mock_cosmos_service):
     """Test that product image URLs are converted to proxy URLs."""
     product_with_url = Product(
         product_name=sample_product.product_name,
@@ -1698,23 +1453,19 @@ async def test_product_image_url_conversion(client, sample_product):
         image_url="https://storage.blob.core.windows.net/products/product.png"
     )
 
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_all_products = AsyncMock(return_value=[product_with_url])
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.get_all_products = AsyncStub([product_with_url])
 
-        response = await client.get("/api/products")
+    response = await client.get(_URL_PRODUCTS)
 
-        assert response.status_code == 200
-        data = await response.get_json()
+    assert response.status_code == 200
+    data = await read_json(response)
 
-        # Image URL should be converted to proxy URL
-        if data["products"] and data["products"][0].get("image_url"):
-            assert "/api/product-images/" in data["products"][0]["image_url"]
+    # Image URL should be converted to proxy URL
+    if data["products"] and data["products"][0].get("image_url"):
+        assert "/api/product-images/" in data["products"][0]["image_url"]
 
 
-@pytest.mark.asyncio
-async def test_authenticated_user_partial_headers(app):
+async def test_authenticated_user_partial_headers(app_module, app):
     """Test authentication with partial headers."""
     partial_headers = {
         "X-MS-CLIENT-PRINCIPAL-ID": "partial-user",
@@ -1722,225 +1473,190 @@ async def test_authenticated_user_partial_headers(app):
     }
 
     async with app.test_request_context("/", headers=partial_headers):
-        user = get_authenticated_user()
+        user = app_module.get_authenticated_user()
 
         assert user["user_principal_id"] == "partial-user"
         assert user["is_authenticated"] is True
 
 
-@pytest.mark.asyncio
-async def test_chat_multiple_responses(client):
+async def test_chat_multiple_responses(client, mock_cosmos_service, mock_orchestrator, patches):
     """Test chat endpoint returns JSON response."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.parse_brief = AsyncMock(return_value=(
+    mock_orchestrator.parse_brief = AsyncStub((
         MagicMock(model_dump=lambda: {"overview": "Tell me more details"}),
         None,
         False
     ))
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing, \
-         patch("app.get_title_service") as mock_title:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos_service.save_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
-
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.PARSE_BRIEF,
-            confidence=0.9
-        ))
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
-        mock_routing.return_value = mock_routing_service
+    mock_routing = patches("app.get_routing_service")
+    mock_title = patches("app.get_title_service")
+    mock_cosmos_service.get_conversation = AsyncStub(None)
+    mock_cosmos_service.add_message_to_conversation = AsyncStub()
+    mock_cosmos_service.save_conversation = AsyncStub()
+
+    from services.routing_service import Intent, RoutingResult, ConversationState
+    mock_routing_service = MagicMock()
+    mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
+        intent=Intent.PARSE_BRIEF,
+        confidence=0.9
+    ))
+    mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
+    mock_routing.return_value = mock_routing_service
 
-        mock_title_service = MagicMock()
-        mock_title_service.generate_title = AsyncMock(return_value="Title")
-        mock_title.return_value = mock_title_service
+    mock_title_service = MagicMock()
+    mock_title_service.generate_title = AsyncStub("Title")
+    mock_title.return_value = mock_title_service
 
-        response = await client.post(
-            "/api/chat",
-            json={"message": "Tell me more", "user_id": "test"}
-        )
+    response = await client.post(
+        _URL_CHAT,
+        json={"message": "Tell me more", "user_id": "test"}
+    )
 
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert "action_type" in data
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert "action_type" in data
 
 
-@pytest.mark.asyncio
-async def test_parse_brief_cosmos_save_exception(client):
+async def test_parse_brief_cosmos_save_exception(client, mock_cosmos_service, mock_orchestrator, patches):
     """Test parse_brief handles CosmosDB save failure gracefully via /api/chat."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.parse_brief = AsyncMock(return_value=(
+    mock_orchestrator.parse_brief = AsyncStub((
         MagicMock(model_dump=lambda: {"overview": "Test"}),
         None,
         False
     ))
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing, \
-         patch("app.get_title_service") as mock_title:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.add_message_to_conversation = AsyncMock(
-            side_effect=Exception("Cosmos error")
-        )
-        mock_cosmos_service.save_conversation = AsyncMock(
-            side_effect=Exception("Cosmos error")
-        )
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_routing = patches("app.get_routing_service")
+    mock_title = patches("app.get_title_service")
+    mock_cosmos_service.get_conversation = AsyncStub(None)
+    mock_cosmos_service.add_message_to_conversation = AsyncStub(
+        exc=Exception("Cosmos error")
+    )
+    mock_cosmos_service.save_conversation = AsyncStub(
+        exc=Exception("Cosmos error")
+    )
 
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.PARSE_BRIEF,
-            confidence=0.9
-        ))
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
-        mock_routing.return_value = mock_routing_service
+    from services.routing_service import Intent, RoutingResult, ConversationState
+    mock_routing_service = MagicMock()
+    mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
+        intent=Intent.PARSE_BRIEF,
+        confidence=0.9
+    ))
+    mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
+    mock_routing.return_value = mock_routing_service
 
-        mock_title_service = MagicMock()
-        mock_title_service.generate_title = AsyncMock(return_value="Title")
-        mock_title.return_value = mock_title_service
+    mock_title_service = MagicMock()
+    mock_title_service.generate_title = AsyncStub("Title")
+    mock_title.return_value = mock_title_service
 
-        response = await client.post(
-            "/api/chat",
-            json={
-                "message": "Test campaign for shoes",
-                "conversation_id": "test_conv",
-                "user_id": "user1"
-            }
-        )
+    response = await client.post(
+        _URL_CHAT,
+        json={
+            "message": "Test campaign for shoes",
+            "conversation_id": "test_conv",
+            "user_id": "user1"
+        }
+    )
 
-        # Should still succeed despite cosmos error
-        assert response.status_code in [200, 500]
+    # Should still succeed despite cosmos error
+    assert response.status_code in [200, 500]
 
 
-@pytest.mark.asyncio
-async def test_parse_brief_with_rai_blocked(client):
+async def test_parse_brief_with_rai_blocked(client, mock_cosmos_service, mock_orchestrator, patches):
     """Test parse_brief when RAI blocks the content via /api/chat."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.parse_brief = AsyncMock(return_value=(
+    mock_orchestrator.parse_brief = AsyncStub((
         None,
         "Content blocked for safety",
         True  # rai_blocked
     ))
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing, \
-         patch("app.get_title_service") as mock_title:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_routing = patches("app.get_routing_service")
+    mock_title = patches("app.get_title_service")
+    mock_cosmos_service.get_conversation = AsyncStub(None)
+    mock_cosmos_service.add_message_to_conversation = AsyncStub()
 
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.PARSE_BRIEF,
-            confidence=0.9
-        ))
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
-        mock_routing.return_value = mock_routing_service
+    from services.routing_service import Intent, RoutingResult, ConversationState
+    mock_routing_service = MagicMock()
+    mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
+        intent=Intent.PARSE_BRIEF,
+        confidence=0.9
+    ))
+    mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
+    mock_routing.return_value = mock_routing_service
 
-        mock_title_service = MagicMock()
-        mock_title_service.generate_title = AsyncMock(return_value="Blocked")
-        mock_title.return_value = mock_title_service
+    mock_title_service = MagicMock()
+    mock_title_service.generate_title = AsyncStub("Blocked")
+    mock_title.return_value = mock_title_service
 
-        response = await client.post(
-            "/api/chat",
-            json={
-                "message": "Harmful content",
-                "conversation_id": "test_conv",
-                "user_id": "user1"
-            }
-        )
+    response = await client.post(
+        _URL_CHAT,
+        json={
+            "message": "Harmful content",
+            "conversation_id": "test_conv",
+            "user_id": "user1"
+        }
+    )
 
-        assert response.status_code == 200
-        data = json.loads(await response.get_data())
-        assert data.get("action_type") == "rai_blocked" or data.get("data", {}).get("rai_blocked") is True
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert data.get("action_type") == "rai_blocked" or data.get("data", {}).get("rai_blocked") is True
 
 
-@pytest.mark.asyncio
-async def test_parse_brief_with_clarifying_questions(client):
+async def test_parse_brief_with_clarifying_questions(client, mock_cosmos_service, mock_orchestrator, patches):
     """Test parse_brief returns clarifying questions via /api/chat."""
-    mock_orchestrator = AsyncMock()
     mock_brief = MagicMock()
     mock_brief.model_dump = MagicMock(return_value={"overview": "Partial"})
-    mock_orchestrator.parse_brief = AsyncMock(return_value=(
+    mock_orchestrator.parse_brief = AsyncStub((
         mock_brief,
         "Please clarify the target audience",
         False
     ))
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing, \
-         patch("app.get_title_service") as mock_title:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos_service.save_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
-
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.PARSE_BRIEF,
-            confidence=0.9
-        ))
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
-        mock_routing.return_value = mock_routing_service
+    mock_routing = patches("app.get_routing_service")
+    mock_title = patches("app.get_title_service")
+    mock_cosmos_service.get_conversation = AsyncStub(None)
+    mock_cosmos_service.add_message_to_conversation = AsyncStub()
+    mock_cosmos_service.save_conversation = AsyncStub()
+
+    from services.routing_service import Intent, RoutingResult, ConversationState
+    mock_routing_service = MagicMock()
+    mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
+        intent=Intent.PARSE_BRIEF,
+        confidence=0.9
+    ))
+    mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
+    mock_routing.return_value = mock_routing_service
 
-        mock_title_service = MagicMock()
-        mock_title_service.generate_title = AsyncMock(return_value="Title")
-        mock_title.return_value = mock_title_service
+    mock_title_service = MagicMock()
+    mock_title_service.generate_title = AsyncStub("Title")
+    mock_title.return_value = mock_title_service
 
-        response = await client.post(
-            "/api/chat",
-            json={
-                "message": "Partial brief",
-                "conversation_id": "test_conv",
-                "user_id": "user1"
-            }
-        )
+    response = await client.post(
+        _URL_CHAT,
+        json={
+            "message": "Partial brief",
+            "conversation_id": "test_conv",
+            "user_id": "user1"
+        }
+    )
 
-        assert response.status_code == 200
-        data = json.loads(await response.get_data())
-        assert data.get("action_type") == "clarification_needed"
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert data.get("action_type") == "clarification_needed"
 
 
-@pytest.mark.asyncio
-async def test_select_products_cosmos_save_exception(client, sample_product_dict):
+async def test_select_products_cosmos_save_exception(client, sample_product_dict, mock_cosmos_service, mock_orchestrator):
     """Test select_products handles cosmos error gracefully via /api/chat."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.select_products = AsyncMock(return_value={
-        "products": [sample_product_dict],
+    mock_orchestrator.select_products = AsyncStub({
+        "products": [dict(sample_product_dict)],
         "action": "add",
         "message": "Added product"
     })
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.get_all_products = AsyncMock(return_value=[])
-        mock_cosmos_service.add_message_to_conversation = AsyncMock(
-            side_effect=Exception("Cosmos error")
+    with patch("app.get_routing_service") as mock_routing:
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.get_all_products = AsyncStub([])
+        mock_cosmos_service.add_message_to_conversation = AsyncStub(
+            exc=Exception("Cosmos error")
         )
-        mock_cosmos.return_value = mock_cosmos_service
 
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
@@ -1952,10 +1668,10 @@ async def test_select_products_cosmos_save_exception(client, sample_product_dict
         mock_routing.return_value = mock_routing_service
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={
                 "message": "Add this product",
-                "payload": {"product": sample_product_dict},
+                "payload": {"product": dict(sample_product_dict)},
                 "conversation_id": "test_conv",
                 "user_id": "user1"
             }
@@ -1965,24 +1681,17 @@ async def test_select_products_cosmos_save_exception(client, sample_product_dict
         assert response.status_code in [200, 400, 500]
 
 
-@pytest.mark.asyncio
-async def test_regenerate_image_error_handling(client, sample_creative_brief_dict):
+async def test_regenerate_image_error_handling(client, sample_creative_brief_dict, mock_cosmos_service, mock_orchestrator):
     """Test regenerate handles errors gracefully via /api/chat."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.regenerate_image = AsyncMock(side_effect=Exception("Image generation failed"))
-
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing:
+    mock_orchestrator.regenerate_image = AsyncStub(exc=Exception("Image generation failed"))
 
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value={
+    with patch("app.get_routing_service") as mock_routing:
+        mock_cosmos_service.get_conversation = AsyncStub({
             "id": "test_conv",
-            "brief": sample_creative_brief_dict,
+            "brief": dict(sample_creative_brief_dict),
             "generated_content": {"image_url": "old.jpg"}
         })
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+        mock_cosmos_service.add_message_to_conversation = AsyncStub()
 
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
@@ -1995,7 +1704,7 @@ async def test_regenerate_image_error_handling(client, sample_creative_brief_dic
         mock_routing.return_value = mock_routing_service
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={
                 "message": "Change the background",
                 "conversation_id": "test_conv",
@@ -2008,119 +1717,80 @@ async def test_regenerate_image_error_handling(client, sample_creative_brief_dic
         assert response.status_code in [500, 200, 400]
 
 
-@pytest.mark.asyncio
-async def test_get_image_proxy_not_found(client):
+async def test_get_image_proxy_not_found(client, mock_blob_service, image_blob_factory):
     """Test image proxy returns 404 for non-existent image."""
-    with patch("app.get_blob_service") as mock_blob:
-        mock_blob_service = AsyncMock()
-        mock_container = AsyncMock()
-        mock_blob_client = AsyncMock()
-
-        # Simulate blob not found
-        from azure.core.exceptions import ResourceNotFoundError
-        mock_blob_client.download_blob = AsyncMock(
-            side_effect=ResourceNotFoundError("Not found")
-        )
-        mock_container.get_blob_client = MagicMock(return_value=mock_blob_client)
-        mock_blob_service._generated_images_container = mock_container
-        mock_blob.return_value = mock_blob_service
+    # Simulate blob not found
+    from azure.core.exceptions import ResourceNotFoundError
+    image_blob_factory(mock_blob_service, download_error=ResourceNotFoundError("Not found"))
 
-        response = await client.get("/api/images/conv123/nonexistent.png")
+    response = await client.get("/api/images/conv123/nonexistent.png")
 
-        assert response.status_code in [404, 500]
+    assert response.status_code in [404, 500]
 
 
-@pytest.mark.asyncio
-async def test_conversation_detail_not_found(client):
+async def test_conversation_detail_not_found(client, mock_cosmos_service):
     """Test conversation detail returns 404 when not found."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.get_conversation = AsyncStub(None)
 
-        response = await client.get("/api/conversations/nonexistent_conv?user_id=user1")
+    response = await client.get("/api/conversations/nonexistent_conv?user_id=user1")
 
-        assert response.status_code == 404
+    assert response.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_get_conversation_detail_additional(client):
+async def test_get_conversation_detail_additional(client, mock_cosmos_service):
     """Test getting conversation detail."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value={
-            "id": "conv123",
-            "title": "Test Conversation",
-            "user_id": "user1",
-            "messages": []
-        })
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.get_conversation = AsyncStub({
+        "id": "conv123",
+        "title": "Test Conversation",
+        "user_id": "user1",
+        "messages": []
+    })
 
-        response = await client.get("/api/conversations/conv123?user_id=user1")
+    response = await client.get("/api/conversations/conv123?user_id=user1")
 
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert data["id"] == "conv123"
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert data["id"] == "conv123"
 
 
-@pytest.mark.asyncio
-async def test_delete_conversation(client):
+async def test_delete_conversation(client, mock_cosmos_service, mock_blob_service):
     """Test deleting a conversation."""
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_blob_service") as mock_blob:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.delete_conversation = AsyncMock(return_value=True)
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.delete_conversation = AsyncStub(True)
 
-        mock_blob_service = AsyncMock()
-        mock_blob_service.delete_conversation_images = AsyncMock()
-        mock_blob.return_value = mock_blob_service
+    mock_blob_service.delete_conversation_images = AsyncStub()
 
-        response = await client.delete("/api/conversations/conv123?user_id=user1")
+    response = await client.delete("/api/conversations/conv123?user_id=user1")
 
-        assert response.status_code == 200
+    assert response.status_code == 200
 
 
-@pytest.mark.asyncio
-async def test_generate_content_missing_brief_from_conversation(client):
+async def test_generate_content_missing_brief_from_conversation(client, mock_cosmos_service, mock_orchestrator):
     """Test generate returns error when brief is missing."""
-    with patch("app.get_orchestrator") as mock_orch, \
-         patch("app.get_cosmos_service") as mock_cosmos:
-        mock_orchestrator = AsyncMock()
-        mock_orch.return_value = mock_orchestrator
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value={
-            "id": "conv123",
-            "user_id": "user1",
-            "brief": None  # No brief
-        })
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.get_conversation = AsyncStub({
+        "id": "conv123",
+        "user_id": "user1",
+        "brief": None  # No brief
+    })
 
-        response = await client.post(
-            "/api/generate/start",
-            json={"conversation_id": "conv123"}
-        )
+    response = await client.post(
+        _URL_GENERATE_START,
+        json={"conversation_id": "conv123"}
+    )
 
-        assert response.status_code in [400, 404, 500]
+    assert response.status_code in [400, 404, 500]
 
 
-@pytest.mark.asyncio
-async def test_health_check_endpoint(client):
+async def test_health_check_endpoint(dispatch_request):
     """Test health check endpoint."""
-    response = await client.get("/health")
+    response = await dispatch_request("/health")
 
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
-async def test_regenerate_without_conversation(client):
+async def test_regenerate_without_conversation(client, mock_cosmos_service):
     """Test regenerate via /api/chat returns error without valid conversation."""
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos.return_value = mock_cosmos_service
+    with patch("app.get_routing_service") as mock_routing:
+        mock_cosmos_service.get_conversation = AsyncStub(None)
 
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
@@ -2132,7 +1802,7 @@ async def test_regenerate_without_conversation(client):
         mock_routing.return_value = mock_routing_service
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={
                 "message": "Change colors",
                 "conversation_id": "nonexistent",
@@ -2143,13 +1813,9 @@ async def test_regenerate_without_conversation(client):
         assert response.status_code in [200, 400, 404, 500]
 
 
-@pytest.mark.asyncio
-async def test_select_products_validation_error(client):
+async def test_select_products_validation_error(client, mock_cosmos_service, mock_orchestrator):
     """Test select_products via /api/chat with missing brief."""
-    with patch("app.get_routing_service") as mock_routing, \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_orchestrator") as mock_orch:
-
+    with patch("app.get_routing_service") as mock_routing:
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
         mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
@@ -2159,18 +1825,14 @@ async def test_select_products_validation_error(client):
         mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
         mock_routing.return_value = mock_routing_service
 
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.get_all_products = AsyncMock(return_value=[])
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.get_all_products = AsyncStub([])
+        mock_cosmos_service.add_message_to_conversation = AsyncStub()
 
-        mock_orchestrator = AsyncMock()
-        mock_orchestrator.select_products = AsyncMock(return_value={"products": [], "message": "No products"})
-        mock_orch.return_value = mock_orchestrator
+        mock_orchestrator.select_products = AsyncStub({"products": [], "message": "No products"})
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={
                 "message": "Show me products",
                 "conversation_id": "conv123"
@@ -2188,79 +1850,51 @@ async def test_select_products_validation_error(client):
 # - test_health_check_readiness (no get_search_service)
 
 
-@pytest.mark.asyncio
-async def test_start_generation_success(client):
+async def test_start_generation_success(client, mock_cosmos_service, mock_orchestrator):
     """Test starting generation returns task ID."""
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_orchestrator") as mock_orch:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value={
-            "id": "conv123",
-            "user_id": "user1",
-            "brief": {
-                "overview": "Test",
-                "objectives": "Goals",
-                "target_audience": "Adults",
-                "key_message": "Message",
-                "tone_and_style": "Professional",
-                "deliverable": "Post",
-                "timelines": "Q2",
-                "visual_guidelines": "Clean",
-                "cta": "Buy"
-            },
-            "selected_products": []
-        })
-        mock_cosmos.return_value = mock_cosmos_service
-
-        mock_orchestrator = AsyncMock()
-        mock_orch.return_value = mock_orchestrator
+    mock_cosmos_service.get_conversation = AsyncStub({
+        "id": "conv123",
+        "user_id": "user1",
+        "brief": dict(_BRIEF),
+        "selected_products": []
+    })
 
-        response = await client.post(
-            "/api/generate/start",
-            json={
-                "conversation_id": "conv123",
-                "generate_images": False
-            }
-        )
+    response = await client.post(
+        _URL_GENERATE_START,
+        json={
+            "conversation_id": "conv123",
+            "generate_images": False
+        }
+    )
 
-        assert response.status_code in [200, 400]
+    assert response.status_code in [200, 400]
 
 
-@pytest.mark.asyncio
-async def test_get_generation_status(client):
+async def test_get_generation_status(client, gen_task):
     """Test getting generation status by task ID."""
     # Inject a test task
-    _generation_tasks["test_task_123"] = {
+    gen_task("test_task_123", {
         "status": "completed",
         "result": {"text_content": "Test content"}
-    }
+    })
 
-    response = await client.get("/api/generate/status/test_task_123")
+    response = await client.get(_URL_STATUS + "test_task_123")
 
     assert response.status_code == 200
-    data = await response.get_json()
+    data = await read_json(response)
     assert data["status"] == "completed"
 
-    # Cleanup
-    del _generation_tasks["test_task_123"]
 
-
-@pytest.mark.asyncio
 async def test_get_generation_status_not_found_coverage(client):
     """Test generation status returns 404 for unknown task."""
-    response = await client.get("/api/generate/status/nonexistent_task")
+    response = await client.get(_URL_STATUS + "nonexistent_task")
 
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_product_select_missing_fields(client):
+async def test_product_select_missing_fields(client, mock_cosmos_service, mock_orchestrator):
     """Test product select via /api/chat with missing fields."""
-    with patch("app.get_routing_service") as mock_routing, \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_orchestrator") as mock_orch:
-
+    with patch("app.get_routing_service") as mock_routing:
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
         mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
@@ -2270,18 +1904,14 @@ async def test_product_select_missing_fields(client):
         mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
         mock_routing.return_value = mock_routing_service
 
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.get_all_products = AsyncMock(return_value=[])
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.get_all_products = AsyncStub([])
+        mock_cosmos_service.add_message_to_conversation = AsyncStub()
 
-        mock_orchestrator = AsyncMock()
-        mock_orchestrator.select_products = AsyncMock(return_value={"products": [], "message": "No products"})
-        mock_orch.return_value = mock_orchestrator
+        mock_orchestrator.select_products = AsyncStub({"products": [], "message": "No products"})
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={"message": "Show products"}  # Minimal request - works with routing
         )
 
@@ -2289,26 +1919,18 @@ async def test_product_select_missing_fields(client):
         assert response.status_code in [200, 400, 500]
 
 
-@pytest.mark.asyncio
-async def test_product_select_with_current_products(client):
+async def test_product_select_with_current_products(client, mock_cosmos_service, mock_orchestrator):
     """Test product selection with existing products via /api/chat."""
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_orchestrator") as mock_orch, \
-         patch("app.get_routing_service") as mock_routing:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.get_all_products = AsyncMock(return_value=[])
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
-
-        mock_orchestrator = AsyncMock()
-        mock_orchestrator.select_products = AsyncMock(return_value={
+    with patch("app.get_routing_service") as mock_routing:
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.get_all_products = AsyncStub([])
+        mock_cosmos_service.add_message_to_conversation = AsyncStub()
+
+        mock_orchestrator.select_products = AsyncStub({
             "products": [{"id": "p1"}],
             "action": "add",
             "message": "Added product"
         })
-        mock_orch.return_value = mock_orchestrator
 
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
@@ -2320,7 +1942,7 @@ async def test_product_select_with_current_products(client):
         mock_routing.return_value = mock_routing_service
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={
                 "message": "Add product 1",
                 "payload": {"current_products": [{"id": "existing"}]},
@@ -2332,247 +1954,199 @@ async def test_product_select_with_current_products(client):
         assert response.status_code == 200
 
 
-@pytest.mark.asyncio
-async def test_save_brief_endpoint(client):
-    """Test saving brief to conversation."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.update_conversation_brief = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+@pytest.mark.parametrize("method,path,payload,cosmos_method,cosmos_return,ok", [
+    pytest.param(
+        "post", _URL_CHAT,
+        {"action": "search_products", "payload": {"current_products": []}},
+        None, None, {200, 400, 500},
+        id="select_products_missing_message",
+    ),
+    pytest.param(
+        "get", "/api/products?search=white", None,
+        "search_products", [], {200, 404},
+        id="product_search",
+    ),
+    pytest.param(
+        "delete", "/api/products/CP-0001", None,
+        "delete_product", True, {200, 204, 404, 405},
+        id="delete_product",
+    ),
+    pytest.param(
+        "get", "/", None,
+        None, None, {200, 302, 404},
+        id="index",
+    ),
+    pytest.param(
+        "post", "/api/brief/save", {"conversation_id": "conv123", "brief": dict(_BRIEF)},
+        "update_conversation_brief", None, {200, 404},
+        id="save_brief",
+    ),
+    pytest.param(
+        "get", "/api/content/conv123?user_id=user1", None,
+        "get_generated_content",
+        {"text_content": "Generated marketing text", "image_url": "/api/images/conv123/img.png"},
+        {200, 404},
+        id="get_generated_content",
+    ),
+    pytest.param(
+        "put", "/api/conversations/conv123/brief", {"brief": dict(_BRIEF)},
+        "update_conversation_brief", {"id": "conv123", "brief": {"overview": "Updated"}},
+        {200, 404, 405},
+        id="conversation_update_brief",
+    ),
+    pytest.param(
+        "post", "/api/regenerate/stream",
+        {"conversation_id": "nonexistent", "modification_request": "Change colors"},
+        "get_conversation", None, {400, 404, 500},
+        id="regenerate_stream_no_conversation",
+    ),
+    pytest.param(
+        "post", "/api/generate/stream", {"conversation_id": "test_conv", "user_id": "user1"},
+        "get_conversation", {"id": "test_conv", "user_id": "user1"}, {200, 400, 404},
+        id="generate_stream_no_brief",
+    ),
+    pytest.param(
+        "get", _URL_STATUS + "nonexistent", None,
+        "get_conversation", None, {200, 404, 500},
+        id="generate_status_not_found",
+    ),
+    pytest.param(
+        "get", "/api/conversations/nonexistent", None,
+        "get_conversation", None, {200, 404, 500},
+        id="get_conversation_not_found",
+    ),
+    pytest.param(
+        "delete", "/api/conversations/test_conv", None,
+        "delete_conversation", True, {200, 204, 404, 405, 500},
+        id="delete_conversation",
+    ),
+])
+async def test_endpoint_smoke(
+    client, mock_cosmos_service, method, path, payload, cosmos_method, cosmos_return, ok
+):
+    """Smoke-test endpoints whose outcome only needs to fall in a tolerated status set."""
+    if cosmos_method:
+        setattr(mock_cosmos_service, cosmos_method, AsyncStub(cosmos_return))
+
+    kwargs = {} if payload is None else {"json": payload}
+    response = await getattr(client, method)(path, **kwargs)
+
+    assert response.status_code in ok
+
+
+async def test_product_image_proxy(client, mock_blob_service, image_blob_factory):
+    """Test product image proxy endpoint."""
+    image_blob_factory(mock_blob_service)
 
-        response = await client.post(
-            "/api/brief/save",
-            json={
-                "conversation_id": "conv123",
-                "brief": {
-                    "overview": "Test",
-                    "objectives": "Goals",
-                    "target_audience": "Adults",
-                    "key_message": "Message",
-                    "tone_and_style": "Professional",
-                    "deliverable": "Post",
-                    "timelines": "Q2",
-                    "visual_guidelines": "Clean",
-                    "cta": "Buy"
-                }
-            }
-        )
+    response = await client.get("/api/product-images/test.png")
 
-        assert response.status_code in [200, 404]
+    # Should return image or 404
+    assert response.status_code in [200, 404, 500]
 
 
-@pytest.mark.asyncio
-async def test_get_generated_content(client):
-    """Test getting generated content for conversation."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_generated_content = AsyncMock(return_value={
-            "text_content": "Generated marketing text",
-            "image_url": "/api/images/conv123/img.png"
-        })
-        mock_cosmos.return_value = mock_cosmos_service
+async def test_parse_brief_rai_cosmos_exception(client, mock_cosmos_service, mock_orchestrator, patches):
+    """Test parse_brief handles cosmos failure during RAI blocked save via /api/chat."""
+    mock_brief = MagicMock()
+    mock_brief.model_dump = MagicMock(return_value={"overview": ""})
+    mock_orchestrator.parse_brief = AsyncStub((
+        mock_brief,
+        "Content blocked for safety reasons",
+        True  # rai_blocked
+    ))
 
-        response = await client.get("/api/content/conv123?user_id=user1")
+    mock_routing = patches("app.get_routing_service")
+    mock_title = patches("app.get_title_service")
+    mock_cosmos_service.get_conversation = AsyncStub(None)
+    mock_cosmos_service.add_message_to_conversation = AsyncStub(
+        exc=Exception("Cosmos save failed")
+    )
 
-        assert response.status_code in [200, 404]
+    from services.routing_service import Intent, RoutingResult, ConversationState
+    mock_routing_service = MagicMock()
+    mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
+        intent=Intent.PARSE_BRIEF,
+        confidence=0.9
+    ))
+    mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
+    mock_routing.return_value = mock_routing_service
 
+    mock_title_service = MagicMock()
+    mock_title_service.generate_title = AsyncStub("Title")
+    mock_title.return_value = mock_title_service
 
-@pytest.mark.asyncio
-async def test_conversation_update_brief(client):
-    """Test updating conversation with new brief."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.update_conversation_brief = AsyncMock(return_value={
-            "id": "conv123",
-            "brief": {"overview": "Updated"}
-        })
-        mock_cosmos.return_value = mock_cosmos_service
+    response = await client.post(
+        _URL_CHAT,
+        json={
+            "message": "Generate harmful content",
+            "conversation_id": "test_conv",
+            "user_id": "user1"
+        }
+    )
 
-        response = await client.put(
-            "/api/conversations/conv123/brief",
-            json={
-                "brief": {
-                    "overview": "Test",
-                    "objectives": "Goals",
-                    "target_audience": "Adults",
-                    "key_message": "Message",
-                    "tone_and_style": "Professional",
-                    "deliverable": "Post",
-                    "timelines": "Q2",
-                    "visual_guidelines": "Clean",
-                    "cta": "Buy"
-                }
-            }
-        )
+    # Should still return rai_blocked response despite cosmos failure
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert data.get("action_type") == "rai_blocked"
 
-        assert response.status_code in [200, 404, 405]
 
+async def test_parse_brief_clarification_cosmos_exception(client, mock_cosmos_service, mock_orchestrator, patches):
+    """Test parse_brief handles cosmos failure during clarification save via /api/chat."""
+    mock_brief = MagicMock()
+    mock_brief.model_dump = MagicMock(return_value={"overview": "Partial"})
+    mock_orchestrator.parse_brief = AsyncStub((
+        mock_brief,
+        "What is your target audience?",
+        False
+    ))
 
-@pytest.mark.asyncio
-async def test_product_image_proxy(client):
-    """Test product image proxy endpoint."""
-    with patch("app.get_blob_service") as mock_blob:
-        mock_blob_service = AsyncMock()
-        mock_container = AsyncMock()
-        mock_blob_client = AsyncMock()
+    mock_routing = patches("app.get_routing_service")
+    mock_title = patches("app.get_title_service")
+    mock_cosmos_service.get_conversation = AsyncStub(None)
+    # First call succeeds (initial message save), second fails (clarification save)
+    mock_cosmos_service.add_message_to_conversation = AsyncMock(
+        side_effect=[None, Exception("Cosmos save clarification failed")]
+    )
+    mock_cosmos_service.save_conversation = AsyncStub()
 
-        # Mock blob download
-        mock_download = AsyncMock()
-        mock_download.readall = AsyncMock(return_value=b"fake image data")
-        mock_blob_client.download_blob = AsyncMock(return_value=mock_download)
-        mock_container.get_blob_client = MagicMock(return_value=mock_blob_client)
-        mock_blob_service._product_images_container = mock_container
-        mock_blob.return_value = mock_blob_service
+    from services.routing_service import Intent, RoutingResult, ConversationState
+    mock_routing_service = MagicMock()
+    mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
+        intent=Intent.PARSE_BRIEF,
+        confidence=0.9
+    ))
+    mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
+    mock_routing.return_value = mock_routing_service
 
-        response = await client.get("/api/product-images/test.png")
+    mock_title_service = MagicMock()
+    mock_title_service.generate_title = AsyncStub("Title")
+    mock_title.return_value = mock_title_service
 
-        # Should return image or 404
-        assert response.status_code in [200, 404, 500]
+    response = await client.post(
+        _URL_CHAT,
+        json={
+            "message": "Create a campaign",
+            "conversation_id": "test_conv",
+            "user_id": "user1"
+        }
+    )
 
+    # Should still return clarification response despite cosmos failure
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert data.get("action_type") == "clarification_needed"
 
-@pytest.mark.asyncio
-async def test_regenerate_stream_no_conversation(client):
-    """Test regenerate stream without conversation."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos.return_value = mock_cosmos_service
 
-        response = await client.post(
-            "/api/regenerate/stream",
-            json={
-                "conversation_id": "nonexistent",
-                "modification_request": "Change colors"
-            }
-        )
-
-        assert response.status_code in [400, 404, 500]
-
-
-@pytest.mark.asyncio
-async def test_parse_brief_rai_cosmos_exception(client):
-    """Test parse_brief handles cosmos failure during RAI blocked save via /api/chat."""
-    mock_orchestrator = AsyncMock()
-    mock_brief = MagicMock()
-    mock_brief.model_dump = MagicMock(return_value={"overview": ""})
-    mock_orchestrator.parse_brief = AsyncMock(return_value=(
-        mock_brief,
-        "Content blocked for safety reasons",
-        True  # rai_blocked
-    ))
-
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing, \
-         patch("app.get_title_service") as mock_title:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.add_message_to_conversation = AsyncMock(
-            side_effect=Exception("Cosmos save failed")
-        )
-        mock_cosmos.return_value = mock_cosmos_service
-
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.PARSE_BRIEF,
-            confidence=0.9
-        ))
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
-        mock_routing.return_value = mock_routing_service
-
-        mock_title_service = MagicMock()
-        mock_title_service.generate_title = AsyncMock(return_value="Title")
-        mock_title.return_value = mock_title_service
-
-        response = await client.post(
-            "/api/chat",
-            json={
-                "message": "Generate harmful content",
-                "conversation_id": "test_conv",
-                "user_id": "user1"
-            }
-        )
-
-        # Should still return rai_blocked response despite cosmos failure
-        assert response.status_code == 200
-        data = json.loads(await response.get_data())
-        assert data.get("action_type") == "rai_blocked"
-
-
-@pytest.mark.asyncio
-async def test_parse_brief_clarification_cosmos_exception(client):
-    """Test parse_brief handles cosmos failure during clarification save via /api/chat."""
-    mock_orchestrator = AsyncMock()
-    mock_brief = MagicMock()
-    mock_brief.model_dump = MagicMock(return_value={"overview": "Partial"})
-    mock_orchestrator.parse_brief = AsyncMock(return_value=(
-        mock_brief,
-        "What is your target audience?",
-        False
-    ))
-
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing, \
-         patch("app.get_title_service") as mock_title:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        # First call succeeds (initial message save), second fails (clarification save)
-        mock_cosmos_service.add_message_to_conversation = AsyncMock(
-            side_effect=[None, Exception("Cosmos save clarification failed")]
-        )
-        mock_cosmos_service.save_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
-
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.PARSE_BRIEF,
-            confidence=0.9
-        ))
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
-        mock_routing.return_value = mock_routing_service
-
-        mock_title_service = MagicMock()
-        mock_title_service.generate_title = AsyncMock(return_value="Title")
-        mock_title.return_value = mock_title_service
-
-        response = await client.post(
-            "/api/chat",
-            json={
-                "message": "Create a campaign",
-                "conversation_id": "test_conv",
-                "user_id": "user1"
-            }
-        )
-
-        # Should still return clarification response despite cosmos failure
-        assert response.status_code == 200
-        data = json.loads(await response.get_data())
-        assert data.get("action_type") == "clarification_needed"
-
-
-@pytest.mark.asyncio
-async def test_select_products_invalid_action(client, sample_product_dict):
+async def test_select_products_invalid_action(client, sample_product_dict, mock_cosmos_service, mock_orchestrator):
     """Test select_products via /api/chat with invalid action."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.select_products = AsyncMock(return_value={
+    mock_orchestrator.select_products = AsyncStub({
         "products": [],
         "message": "Invalid action"
     })
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.get_all_products = AsyncMock(return_value=[])
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+    with patch("app.get_routing_service") as mock_routing:
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.get_all_products = AsyncStub([])
+        mock_cosmos_service.add_message_to_conversation = AsyncStub()
 
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
@@ -2584,10 +2158,10 @@ async def test_select_products_invalid_action(client, sample_product_dict):
         mock_routing.return_value = mock_routing_service
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={
                 "message": "invalid_action",
-                "payload": {"product": sample_product_dict},
+                "payload": {"product": dict(sample_product_dict)},
                 "conversation_id": "test_conv",
                 "user_id": "user1"
             }
@@ -2597,540 +2171,231 @@ async def test_select_products_invalid_action(client, sample_product_dict):
         assert response.status_code in [200, 400, 500]
 
 
-@pytest.mark.asyncio
-async def test_chat_orchestrator_exception(client):
+async def test_chat_orchestrator_exception(client, mock_cosmos_service, mock_orchestrator):
     """Test chat endpoint when orchestrator raises exception."""
-    mock_orchestrator = AsyncMock()
-    mock_orchestrator.process_message = AsyncMock(
-        side_effect=Exception("Orchestrator error")
+    mock_orchestrator.process_message = AsyncStub(
+        exc=Exception("Orchestrator error")
     )
 
-    with patch("app.get_orchestrator", return_value=mock_orchestrator), \
-         patch("app.get_cosmos_service") as mock_cosmos:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
-
-        response = await client.post(
-            "/api/chat",
-            json={
-                "message": "Hello",
-                "conversation_id": "test_conv",
-                "user_id": "user1"
-            }
-        )
-
-        # Should return error response
-        assert response.status_code in [200, 500]
-
+    mock_cosmos_service.add_message_to_conversation = AsyncStub()
 
-@pytest.mark.asyncio
-async def test_confirm_brief_cosmos_exception(client):
-    """Test confirm_brief handles cosmos failure via /api/chat."""
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_routing_service") as mock_routing:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(
-            side_effect=Exception("Cosmos get failed")
-        )
-        mock_cosmos.return_value = mock_cosmos_service
-
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.CONFIRM_BRIEF,
-            confidence=0.9
-        ))
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
-        mock_routing.return_value = mock_routing_service
-
-        response = await client.post(
-            "/api/chat",
-            json={
-                "action": "confirm_brief",
-                "brief": {
-                    "overview": "Test",
-                    "objectives": "Goals",
-                    "target_audience": "Adults",
-                    "key_message": "Buy",
-                    "tone_and_style": "Professional",
-                    "deliverable": "Email",
-                    "timelines": "Q2",
-                    "visual_guidelines": "Clean",
-                    "cta": "Shop"
-                },
-                "conversation_id": "test_conv",
-                "user_id": "user1"
-            }
-        )
-
-        # Should handle cosmos exception
-        assert response.status_code in [200, 500]
-
-
-@pytest.mark.asyncio
-async def test_generate_stream_no_brief(client):
-    """Test generate stream without brief in conversation."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value={
-            "id": "test_conv",
+    response = await client.post(
+        _URL_CHAT,
+        json={
+            "message": "Hello",
+            "conversation_id": "test_conv",
             "user_id": "user1"
-            # No brief field
-        })
-        mock_cosmos.return_value = mock_cosmos_service
-
-        response = await client.post(
-            "/api/generate/stream",
-            json={
-                "conversation_id": "test_conv",
-                "user_id": "user1"
-            }
-        )
-
-        # Should handle missing brief - any non-5xx is acceptable
-        assert response.status_code in [200, 400, 404]
-
-
-@pytest.mark.asyncio
-async def test_generate_status_not_found(client):
-    """Test generate status for nonexistent conversation."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos.return_value = mock_cosmos_service
-
-        response = await client.get("/api/generate/status/nonexistent")
-
-        # Should return 404 or error
-        assert response.status_code in [200, 404, 500]
-
-
-@pytest.mark.asyncio
-async def test_get_conversation_not_found_coverage(client):
-    """Test get conversation when not found."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos.return_value = mock_cosmos_service
-
-        response = await client.get("/api/conversations/nonexistent")
-
-        assert response.status_code in [200, 404, 500]
-
+        }
+    )
 
-@pytest.mark.asyncio
-async def test_update_content_cosmos_exception(client):
-    """Test update content handles cosmos exception."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(
-            side_effect=Exception("Cosmos error")
-        )
-        mock_cosmos.return_value = mock_cosmos_service
+    # Should return error response
+    assert response.status_code in [200, 500]
+
+
+@pytest.mark.parametrize("method,path,payload,cosmos_method,ok", [
+    pytest.param(
+        "post", _URL_CHAT,
+        {"action": "confirm_brief", "brief": dict(_BRIEF), "conversation_id": "test_conv", "user_id": "user1"},
+        "get_conversation", {200, 500},
+        id="confirm_brief",
+    ),
+    pytest.param(
+        "put", "/api/content/test_conv/item1",
+        {"content_type": "text", "content_html": "<p>Updated</p>"},
+        "get_conversation", {200, 404, 500},
+        id="update_content",
+    ),
+    pytest.param(
+        "post", _URL_CONVERSATIONS, {"title": "New Conversation"},
+        "create_conversation", {200, 201, 400, 404, 405, 500},
+        id="create_conversation",
+    ),
+    pytest.param(
+        "put", "/api/conversations/test_conv", {"title": "Updated Title"},
+        "update_conversation", {200, 404, 500},
+        id="update_conversation",
+    ),
+])
+async def test_cosmos_exception(
+    client, mock_cosmos_service, mock_orchestrator, method, path, payload, cosmos_method, ok
+):
+    """Test endpoints degrade gracefully when a CosmosDB call raises."""
+    mock_cosmos_service.get_conversation = AsyncStub(None)
+    setattr(mock_cosmos_service, cosmos_method, AsyncStub(exc=Exception("Cosmos failed")))
+
+    from services.routing_service import Intent, RoutingResult, ConversationState
+    mock_routing_service = MagicMock()
+    mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
+        intent=Intent.CONFIRM_BRIEF,
+        confidence=0.9
+    ))
+    mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
 
-        response = await client.put(
-            "/api/content/test_conv/item1",
-            json={
-                "content_type": "text",
-                "content_html": "<p>Updated</p>"
-            }
-        )
+    with patch("app.get_routing_service", return_value=mock_routing_service):
+        response = await getattr(client, method)(path, json=payload)
 
-        assert response.status_code in [200, 404, 500]
+    assert response.status_code in ok
 
 
-@pytest.mark.asyncio
-async def test_product_image_blob_exception(client):
+async def test_product_image_blob_exception(client, mock_blob_service, image_blob_factory):
     """Test product image proxy handles blob exception."""
-    with patch("app.get_blob_service") as mock_blob:
-        mock_blob_service = AsyncMock()
-        mock_blob_service._product_images_container = MagicMock()
-        mock_blob_client = MagicMock()
-        mock_blob_client.download_blob = AsyncMock(
-            side_effect=Exception("Blob download failed")
-        )
-        mock_blob_service._product_images_container.get_blob_client = MagicMock(
-            return_value=mock_blob_client
-        )
-        mock_blob.return_value = mock_blob_service
-
-        response = await client.get("/api/product-images/test.png")
-
-        # Should handle blob exception
-        assert response.status_code in [404, 500]
-
-
-@pytest.mark.asyncio
-async def test_delete_conversation_success_coverage(client):
-    """Test delete conversation endpoint."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.delete_conversation = AsyncMock(return_value=True)
-        mock_cosmos.return_value = mock_cosmos_service
-
-        response = await client.delete("/api/conversations/test_conv")
-
-        assert response.status_code in [200, 204, 404, 405, 500]
-
-
-@pytest.mark.asyncio
-async def test_create_conversation_cosmos_exception(client):
-    """Test create conversation handles cosmos exception."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.create_conversation = AsyncMock(
-            side_effect=Exception("Cosmos create failed")
-        )
-        # Also mock get_conversation to avoid other issues
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos.return_value = mock_cosmos_service
-
-        response = await client.post(
-            "/api/conversations",
-            json={"title": "New Conversation"}
-        )
-
-        # Should handle exception - could be 500 or endpoint might not exist
-        assert response.status_code in [200, 201, 400, 404, 405, 500]
-
-
-@pytest.mark.asyncio
-async def test_update_conversation_cosmos_exception(client):
-    """Test update conversation handles cosmos exception."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.update_conversation = AsyncMock(
-            side_effect=Exception("Cosmos update failed")
-        )
-        mock_cosmos.return_value = mock_cosmos_service
+    image_blob_factory(
+        mock_blob_service, download_error=Exception("Blob download failed")
+    )
 
-        response = await client.put(
-            "/api/conversations/test_conv",
-            json={"title": "Updated Title"}
-        )
+    response = await client.get("/api/product-images/test.png")
 
-        assert response.status_code in [200, 404, 500]
+    # Should handle blob exception
+    assert response.status_code in [404, 500]
 
 
-@pytest.mark.asyncio
-async def test_regenerate_stream_with_blob_url(client, sample_creative_brief_dict):
-    """Test regenerate via /api/chat when orchestrator returns blob URL."""
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_orchestrator") as mock_get_orch, \
-         patch("app.get_routing_service") as mock_routing:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value={
-            "id": "test_conv",
-            "user_id": "user1",
-            "brief": sample_creative_brief_dict,
-            "generated_content": {"image_url": "old.jpg"}
-        })
-        mock_cosmos_service.append_message = AsyncMock()
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
-
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.regenerate_image = AsyncMock(return_value={
-            "success": True,
-            "content": "Regenerated content",
-            "image_blob_url": "https://storage.blob.core.windows.net/gen/gen_123/image.png"
-        })
-        mock_get_orch.return_value = mock_orchestrator
+class TestRegenerate:
+    """Image regeneration via /api/chat on a conversation with generated content."""
 
+    @pytest.fixture(autouse=True)
+    def _setup(self, monkeypatch, mock_cosmos_service, generated_conv_stub, noop_stub):
         from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
+        mock_cosmos_service.get_conversation = generated_conv_stub
+        mock_cosmos_service.append_message = noop_stub
+        mock_cosmos_service.add_message_to_conversation = noop_stub
+
+        routing_service = MagicMock()
+        routing_service.classify_intent = MagicMock(return_value=RoutingResult(
             intent=Intent.MODIFY_IMAGE,
             confidence=0.9
         ))
         state = ConversationState(has_generated_content=True, has_brief=True, brief_confirmed=True)
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=state)
-        mock_routing.return_value = mock_routing_service
+        routing_service.derive_state_from_conversation = MagicMock(return_value=state)
+        monkeypatch.setattr("app.get_routing_service", lambda: routing_service)
 
-        response = await client.post(
-            "/api/chat",
+    @staticmethod
+    def _post(client, message):
+        return client.post(
+            _URL_CHAT,
             json={
-                "message": "Make it blue",
+                "message": message,
                 "conversation_id": "test_conv",
                 "user_id": "user1",
                 "has_generated_content": True
             }
         )
 
-        assert response.status_code == 200
-
+    async def test_with_blob_url(self, client, mock_orchestrator):
+        """Test regenerate when orchestrator returns blob URL."""
+        mock_orchestrator.regenerate_image = AsyncStub({
+            "success": True,
+            "content": "Regenerated content",
+            "image_blob_url": "https://storage.blob.core.windows.net/gen/gen_123/image.png"
+        })
 
-@pytest.mark.asyncio
-async def test_regenerate_rai_blocked(client, sample_creative_brief_dict):
-    """Test regenerate via /api/chat when RAI blocks the content."""
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_orchestrator") as mock_get_orch, \
-         patch("app.get_routing_service") as mock_routing:
+        response = await self._post(client, "Make it blue")
 
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value={
-            "id": "test_conv",
-            "user_id": "user1",
-            "brief": sample_creative_brief_dict,
-            "generated_content": {"image_url": "old.jpg"}
-        })
-        mock_cosmos_service.append_message = AsyncMock()
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+        assert response.status_code == 200
 
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.regenerate_image = AsyncMock(return_value={
+    async def test_rai_blocked(self, client, mock_orchestrator):
+        """Test regenerate when RAI blocks the content."""
+        mock_orchestrator.regenerate_image = AsyncStub({
             "rai_blocked": True,
             "error": "Content blocked by safety filters"
         })
-        mock_get_orch.return_value = mock_orchestrator
-
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.MODIFY_IMAGE,
-            confidence=0.9
-        ))
-        state = ConversationState(has_generated_content=True, has_brief=True, brief_confirmed=True)
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=state)
-        mock_routing.return_value = mock_routing_service
 
-        response = await client.post(
-            "/api/chat",
-            json={
-                "message": "Harmful content",
-                "conversation_id": "test_conv",
-                "user_id": "user1",
-                "has_generated_content": True
-            }
-        )
+        response = await self._post(client, "Harmful content")
 
         assert response.status_code == 200
 
-
-@pytest.mark.asyncio
-async def test_regenerate_blob_save_fallback(client, sample_creative_brief_dict):
-    """Test regenerate via /api/chat saves image to blob when only base64 is returned."""
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_orchestrator") as mock_get_orch, \
-         patch("app.get_blob_service") as mock_blob, \
-         patch("app.get_routing_service") as mock_routing:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value={
-            "id": "test_conv",
-            "user_id": "user1",
-            "brief": sample_creative_brief_dict,
-            "generated_content": {"image_url": "old.jpg"}
-        })
-        mock_cosmos_service.append_message = AsyncMock()
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
-
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.regenerate_image = AsyncMock(return_value={
+    async def test_blob_save_fallback(self, client, mock_blob_service, mock_orchestrator):
+        """Test regenerate saves image to blob when only base64 is returned."""
+        mock_orchestrator.regenerate_image = AsyncStub({
             "success": True,
             "content": "Regenerated content",
             "image_base64": "iVBORw0KGgoAAAANSUhEUg=="
         })
-        mock_get_orch.return_value = mock_orchestrator
-
-        mock_blob_service = AsyncMock()
-        mock_blob_service.save_generated_image = AsyncMock(
-            return_value="https://storage.blob.core.windows.net/gen/test_conv/img.png"
+        mock_blob_service.save_generated_image = AsyncStub(
+            "https://storage.blob.core.windows.net/gen/test_conv/img.png"
         )
-        mock_blob.return_value = mock_blob_service
 
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.MODIFY_IMAGE,
-            confidence=0.9
-        ))
-        state = ConversationState(has_generated_content=True, has_brief=True, brief_confirmed=True)
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=state)
-        mock_routing.return_value = mock_routing_service
-
-        response = await client.post(
-            "/api/chat",
-            json={
-                "message": "Make it larger",
-                "conversation_id": "test_conv",
-                "user_id": "user1",
-                "has_generated_content": True
-            }
-        )
+        response = await self._post(client, "Make it larger")
 
         assert response.status_code == 200
 
-
-@pytest.mark.asyncio
-async def test_generate_with_blob_url(client, sample_creative_brief_dict):
-    """Test generate via /api/generate/start when orchestrator returns blob URL."""
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_orchestrator") as mock_get_orch, \
-         patch("app.asyncio.create_task"):
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value={
-            "id": "test_conv",
-            "user_id": "user1",
-            "brief": sample_creative_brief_dict
-        })
-        mock_cosmos_service.append_message = AsyncMock()
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos_service.update_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
-
-        mock_orchestrator = MagicMock()
-        mock_orchestrator._should_generate_image = True
-        mock_orchestrator.generate_content = AsyncMock(return_value={
+    async def test_blob_save_error(self, client, mock_blob_service, mock_orchestrator):
+        """Test regenerate handles blob save exception with fallback."""
+        mock_orchestrator.regenerate_image = AsyncStub({
             "success": True,
-            "content": "Generated content",
-            "image_blob_url": "https://storage.blob.core.windows.net/gen/gen_456/image.png"
+            "content": "New content",
+            "image_base64": "base64data=="
         })
-        mock_get_orch.return_value = mock_orchestrator
-
-        response = await client.post(
-            "/api/generate/start",
-            json={
-                "brief": sample_creative_brief_dict,
-                "conversation_id": "test_conv",
-                "user_id": "user1"
-            }
+        mock_blob_service.save_generated_image = AsyncStub(
+            exc=Exception("Blob save failed")
         )
 
+        response = await self._post(client, "Change color")
+
+        # Should handle gracefully
         assert response.status_code == 200
 
 
-@pytest.mark.asyncio
-async def test_generate_blob_save_error(client, sample_creative_brief_dict):
-    """Test generate via /api/generate/start handles blob save errors gracefully."""
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_orchestrator") as mock_get_orch, \
-         patch("app.get_blob_service") as mock_blob, \
-         patch("app.asyncio.create_task"):
+class TestGenerateStart:
+    """Background generation via /api/generate/start for a conversation with a brief."""
 
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value={
-            "id": "test_conv",
-            "user_id": "user1",
-            "brief": sample_creative_brief_dict
-        })
-        mock_cosmos_service.append_message = AsyncMock()
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos_service.update_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
-
-        mock_orchestrator = MagicMock()
-        mock_orchestrator._should_generate_image = True
-        mock_orchestrator.generate_content = AsyncMock(return_value={
+    @pytest.fixture(autouse=True)
+    def _setup(self, monkeypatch, mock_cosmos_service, conv_stub, noop_stub):
+        mock_cosmos_service.get_conversation = conv_stub
+        mock_cosmos_service.append_message = noop_stub
+        mock_cosmos_service.add_message_to_conversation = noop_stub
+        mock_cosmos_service.update_conversation = noop_stub
+        monkeypatch.setattr("app.asyncio.create_task", MagicMock())
+
+    async def test_with_blob_url(self, client, mock_orchestrator):
+        """Test generate when orchestrator returns blob URL."""
+        mock_orchestrator.generate_content = AsyncStub({
             "success": True,
             "content": "Generated content",
-            "image_base64": "iVBORw0KGgoAAAANSUhEUg=="
+            "image_blob_url": "https://storage.blob.core.windows.net/gen/gen_456/image.png"
         })
-        mock_get_orch.return_value = mock_orchestrator
-
-        mock_blob_service = AsyncMock()
-        mock_blob_service.save_generated_image = AsyncMock(
-            side_effect=Exception("Blob storage error")
-        )
-        mock_blob.return_value = mock_blob_service
 
         response = await client.post(
-            "/api/generate/start",
-            json={
-                "brief": sample_creative_brief_dict,
-                "conversation_id": "test_conv",
-                "user_id": "user1"
-            }
+            _URL_GENERATE_START,
+            content=_GENERATE_START_BODY,
+            headers=JSON_HEADERS
         )
 
-        # Should return 200 with task_id
         assert response.status_code == 200
 
-
-@pytest.mark.asyncio
-async def test_regenerate_blob_save_error(client, sample_creative_brief_dict):
-    """Test regenerate via /api/chat handles blob save exception with fallback."""
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_orchestrator") as mock_get_orch, \
-         patch("app.get_blob_service") as mock_blob, \
-         patch("app.get_routing_service") as mock_routing:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value={
-            "id": "test_conv",
-            "user_id": "user1",
-            "brief": sample_creative_brief_dict,
-            "generated_content": {"image_url": "old.jpg"}
-        })
-        mock_cosmos_service.append_message = AsyncMock()
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
-
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.regenerate_image = AsyncMock(return_value={
+    async def test_blob_save_error(self, client, mock_blob_service, mock_orchestrator):
+        """Test generate handles blob save errors gracefully."""
+        mock_orchestrator.generate_content = AsyncStub({
             "success": True,
-            "content": "New content",
-            "image_base64": "base64data=="
+            "content": "Generated content",
+            "image_base64": "iVBORw0KGgoAAAANSUhEUg=="
         })
-        mock_get_orch.return_value = mock_orchestrator
-
-        mock_blob_service = AsyncMock()
-        mock_blob_service.save_generated_image = AsyncMock(
-            side_effect=Exception("Blob save failed")
+        mock_blob_service.save_generated_image = AsyncStub(
+            exc=Exception("Blob storage error")
         )
-        mock_blob.return_value = mock_blob_service
-
-        from services.routing_service import Intent, RoutingResult, ConversationState
-        mock_routing_service = MagicMock()
-        mock_routing_service.classify_intent = MagicMock(return_value=RoutingResult(
-            intent=Intent.MODIFY_IMAGE,
-            confidence=0.9
-        ))
-        state = ConversationState(has_generated_content=True, has_brief=True, brief_confirmed=True)
-        mock_routing_service.derive_state_from_conversation = MagicMock(return_value=state)
-        mock_routing.return_value = mock_routing_service
 
         response = await client.post(
-            "/api/chat",
-            json={
-                "message": "Change color",
-                "conversation_id": "test_conv",
-                "user_id": "user1",
-                "has_generated_content": True
-            }
+            _URL_GENERATE_START,
+            content=_GENERATE_START_BODY,
+            headers=JSON_HEADERS
         )
 
-        # Should handle gracefully
+        # Should return 200 with task_id
         assert response.status_code == 200
 
 
-@pytest.mark.asyncio
-async def test_products_select_cosmos_save_error(client, sample_creative_brief_dict):
+async def test_products_select_cosmos_save_error(client, sample_creative_brief_dict, mock_cosmos_service, mock_orchestrator):
     """Test products select via /api/chat handles cosmos save errors gracefully."""
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_orchestrator") as mock_get_orch, \
-         patch("app.get_routing_service") as mock_routing:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.add_message_to_conversation = AsyncMock(
-            side_effect=Exception("Cosmos save failed")
+    with patch("app.get_routing_service") as mock_routing:
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.add_message_to_conversation = AsyncStub(
+            exc=Exception("Cosmos save failed")
         )
-        mock_cosmos_service.get_all_products = AsyncMock(return_value=[])
-        mock_cosmos.return_value = mock_cosmos_service
+        mock_cosmos_service.get_all_products = AsyncStub([])
 
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.select_products = AsyncMock(return_value={
+        mock_orchestrator.select_products = AsyncStub({
             "products": [],
             "message": "No products selected"
         })
-        mock_get_orch.return_value = mock_orchestrator
 
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
@@ -3142,7 +2407,7 @@ async def test_products_select_cosmos_save_error(client, sample_creative_brief_d
         mock_routing.return_value = mock_routing_service
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={
                 "message": "Show me blue paints",
                 "conversation_id": "test_conv",
@@ -3154,27 +2419,19 @@ async def test_products_select_cosmos_save_error(client, sample_creative_brief_d
         assert response.status_code in [200, 400, 500]
 
 
-@pytest.mark.asyncio
-async def test_products_select_cosmos_get_products_error(client):
+async def test_products_select_cosmos_get_products_error(client, mock_cosmos_service, mock_orchestrator):
     """Test products select via /api/chat handles cosmos get_all_products errors."""
-    with patch("app.get_cosmos_service") as mock_cosmos, \
-         patch("app.get_orchestrator") as mock_get_orch, \
-         patch("app.get_routing_service") as mock_routing:
-
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos_service.add_message_to_conversation = AsyncMock()
-        mock_cosmos_service.get_all_products = AsyncMock(
-            side_effect=Exception("Get products failed")
+    with patch("app.get_routing_service") as mock_routing:
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.add_message_to_conversation = AsyncStub()
+        mock_cosmos_service.get_all_products = AsyncStub(
+            exc=Exception("Get products failed")
         )
-        mock_cosmos.return_value = mock_cosmos_service
 
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.select_products = AsyncMock(return_value={
+        mock_orchestrator.select_products = AsyncStub({
             "products": [],
             "message": "Using empty product list"
         })
-        mock_get_orch.return_value = mock_orchestrator
 
         from services.routing_service import Intent, RoutingResult, ConversationState
         mock_routing_service = MagicMock()
@@ -3186,7 +2443,7 @@ async def test_products_select_cosmos_get_products_error(client):
         mock_routing.return_value = mock_routing_service
 
         response = await client.post(
-            "/api/chat",
+            _URL_CHAT,
             json={
                 "message": "Show me products",
                 "conversation_id": "test_conv",
@@ -3198,232 +2455,124 @@ async def test_products_select_cosmos_get_products_error(client):
         assert response.status_code in [200, 400, 500]
 
 
-@pytest.mark.asyncio
-async def test_proxy_product_image_not_found(client):
+async def test_proxy_product_image_not_found(client, mock_blob_service, image_blob_factory):
     """Test product image proxy returns 404 for missing image."""
-    with patch("app.get_blob_service") as mock_blob:
-        mock_blob_service = AsyncMock()
-        mock_blob_service.initialize = AsyncMock()
-        mock_container = MagicMock()
-        mock_blob_client = AsyncMock()
-        mock_blob_client.get_blob_properties = AsyncMock(
-            side_effect=Exception("Blob not found")
-        )
-        mock_container.get_blob_client.return_value = mock_blob_client
-        mock_blob_service._product_images_container = mock_container
-        mock_blob.return_value = mock_blob_service
+    image_blob_factory(mock_blob_service, properties_error=Exception("Blob not found"))
 
-        response = await client.get("/api/product-images/nonexistent.png")
+    response = await client.get("/api/product-images/nonexistent.png")
 
-        assert response.status_code == 404
+    assert response.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_proxy_generated_image_not_found(client):
+async def test_proxy_generated_image_not_found(client, mock_blob_service, image_blob_factory):
     """Test generated image proxy returns 404 for missing image."""
-    with patch("app.get_blob_service") as mock_blob:
-        mock_blob_service = AsyncMock()
-        mock_blob_service.initialize = AsyncMock()
-        mock_container = MagicMock()
-        mock_blob_client = AsyncMock()
-        mock_blob_client.get_blob_properties = AsyncMock(
-            side_effect=Exception("Blob not found")
-        )
-        mock_container.get_blob_client.return_value = mock_blob_client
-        mock_blob_service._generated_images_container = mock_container
-        mock_blob.return_value = mock_blob_service
+    image_blob_factory(mock_blob_service, properties_error=Exception("Blob not found"))
 
-        response = await client.get("/api/images/conv123/image.png")
+    response = await client.get("/api/images/conv123/image.png")
 
-        # Should return 404 or 200 depending on how async mock behaves
-        assert response.status_code in [200, 404]
+    # Should return 404 or 200 depending on how async mock behaves
+    assert response.status_code in [200, 404]
 
 
-@pytest.mark.asyncio
-async def test_delete_conversation_cosmos_exception(client):
+async def test_delete_conversation_cosmos_exception(client, mock_cosmos_service):
     """Test delete conversation returns 500 when CosmosDB throws exception."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.initialize = AsyncMock()
-        mock_cosmos_service.delete_conversation = AsyncMock(
-            side_effect=Exception("CosmosDB error")
-        )
-        mock_cosmos.return_value = mock_cosmos_service
-
-        with patch("app.get_authenticated_user") as mock_auth:
-            mock_auth.return_value = {"user_principal_id": "test-user", "user_name": "Test User"}
-
-            response = await client.delete("/api/conversations/conv123")
-
-            assert response.status_code == 500
-            data = await response.get_json()
-            assert "error" in data
-
-
-@pytest.mark.asyncio
-async def test_rename_conversation_success(client):
-    """Test rename conversation endpoint success."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.initialize = AsyncMock()
-        mock_cosmos_service.rename_conversation = AsyncMock(return_value=True)
-        mock_cosmos.return_value = mock_cosmos_service
-
-        with patch("app.get_authenticated_user") as mock_auth:
-            mock_auth.return_value = {"user_principal_id": "test-user", "user_name": "Test User"}
-
-            response = await client.put(
-                "/api/conversations/conv123",
-                json={"title": "New Title"}
-            )
-
-            assert response.status_code == 200
-            data = await response.get_json()
-            assert data["success"] is True
-
-
-@pytest.mark.asyncio
-async def test_rename_conversation_not_found(client):
-    """Test rename conversation returns 404 when conversation not found."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.initialize = AsyncMock()
-        mock_cosmos_service.rename_conversation = AsyncMock(return_value=False)
-        mock_cosmos.return_value = mock_cosmos_service
-
-        with patch("app.get_authenticated_user") as mock_auth:
-            mock_auth.return_value = {"user_principal_id": "test-user", "user_name": "Test User"}
-
-            response = await client.put(
-                "/api/conversations/conv123",
-                json={"title": "New Title"}
-            )
-
-            assert response.status_code == 404
-
-
-@pytest.mark.asyncio
-async def test_rename_conversation_empty_title(client):
-    """Test rename conversation returns 400 when title is empty."""
-    with patch("app.get_authenticated_user") as mock_auth:
-        mock_auth.return_value = {"user_principal_id": "test-user", "user_name": "Test User"}
-
-        response = await client.put(
-            "/api/conversations/conv123",
-            json={"title": "   "}
-        )
-
-        assert response.status_code == 400
-
+    mock_cosmos_service.initialize = AsyncStub()
+    mock_cosmos_service.delete_conversation = AsyncStub(
+        exc=Exception("CosmosDB error")
+    )
 
-@pytest.mark.asyncio
-async def test_rename_conversation_cosmos_exception(client):
-    """Test rename conversation returns 500 when CosmosDB throws exception."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.initialize = AsyncMock()
-        mock_cosmos_service.rename_conversation = AsyncMock(
-            side_effect=Exception("CosmosDB error")
-        )
-        mock_cosmos.return_value = mock_cosmos_service
+    response = await client.delete("/api/conversations/conv123", headers=_AUTH_HEADERS)
 
-        with patch("app.get_authenticated_user") as mock_auth:
-            mock_auth.return_value = {"user_principal_id": "test-user", "user_name": "Test User"}
+    assert response.status_code == 500
+    data = await read_json(response)
+    assert "error" in data
 
-            response = await client.put(
-                "/api/conversations/conv123",
-                json={"title": "New Title"}
-            )
 
-            assert response.status_code == 500
+@pytest.mark.parametrize("rename_stub,status", [
+    pytest.param(AsyncStub(True), 200, id="success"),
+    pytest.param(AsyncStub(False), 404, id="not_found"),
+    pytest.param(AsyncStub(exc=Exception("CosmosDB error")), 500, id="cosmos_exception"),
+])
+async def test_rename_conversation(client, mock_cosmos_service, rename_stub, status):
+    """Test rename conversation status codes for success, missing and CosmosDB-error cases."""
+    mock_cosmos_service.initialize = AsyncStub()
+    mock_cosmos_service.rename_conversation = rename_stub
+
+    response = await client.put(
+        "/api/conversations/conv123",
+        content=_RENAME_BODY,
+        headers=_AUTH_JSON_HEADERS
+    )
 
+    assert response.status_code == status
+    if status == 200:
+        data = await read_json(response)
+        assert data["success"] is True
 
-@pytest.mark.asyncio
-async def test_startup_cosmos_error(client):
-    """Test startup handles CosmosDB initialization failure gracefully."""
-    with patch("app.get_orchestrator") as mock_orch:
-        mock_orch.return_value = MagicMock()
 
-        with patch("app.get_cosmos_service") as mock_cosmos:
-            mock_cosmos.side_effect = Exception("CosmosDB unavailable")
+async def test_rename_conversation_empty_title(app, app_module, mock_cosmos_service):
+    """Test rename rejects a blank title before touching CosmosDB.
 
-            with patch("app.get_blob_service") as mock_blob:
-                mock_blob.return_value = AsyncMock()
+    Only payload validation is exercised, so the view runs directly under a
+    request context instead of through the test client.
+    """
+    mock_cosmos_service.rename_conversation = AsyncMock()
 
-                # Should not raise - graceful handling
-                try:
-                    await startup()
-                except Exception:
-                    pass  # Expected since cosmos failed
+    async with app.test_request_context(
+        "/api/conversations/conv123", method="PUT", data=_RENAME_BLANK_BODY, headers=_AUTH_JSON_HEADERS
+    ):
+        response, status = await app_module.update_conversation("conv123")
 
+    assert status == 400
+    data = await response.get_json()
+    assert data["error"] == "Title is required"
+    mock_cosmos_service.rename_conversation.assert_not_called()
 
-@pytest.mark.asyncio
-async def test_startup_blob_error(client):
-    """Test startup handles Blob storage initialization failure gracefully."""
-    with patch("app.get_orchestrator") as mock_orch:
-        mock_orch.return_value = MagicMock()
 
-        with patch("app.get_cosmos_service") as mock_cosmos:
-            mock_cosmos.return_value = AsyncMock()
+@pytest.mark.parametrize("failing,healthy", [
+    pytest.param("get_cosmos_service", "get_blob_service", id="cosmos"),
+    pytest.param("get_blob_service", "get_cosmos_service", id="blob"),
+])
+async def test_startup_service_error(app_module, monkeypatch, mock_orchestrator, failing, healthy):
+    """Test startup logs a failing service and still initializes the other one."""
+    healthy_getter = AsyncMock()
+    monkeypatch.setattr(f"app.{failing}", AsyncMock(side_effect=Exception("Service unavailable")))
+    monkeypatch.setattr(f"app.{healthy}", healthy_getter)
 
-            with patch("app.get_blob_service") as mock_blob:
-                mock_blob.side_effect = Exception("Blob unavailable")
+    # startup() swallows initialization errors, so this must not raise
+    await app_module.startup()
 
-                # Should not raise - graceful handling
-                try:
-                    await startup()
-                except Exception:
-                    pass  # Expected since blob failed
+    healthy_getter.assert_awaited_once()
 
 
-@pytest.mark.asyncio
-async def test_product_image_etag_cache_hit(client):
+async def test_product_image_etag_cache_hit(client, mock_blob_service, image_blob_factory):
     """Test product image returns 304 Not Modified when ETag matches."""
-    with patch("app.get_blob_service") as mock_blob:
-        mock_blob_service = AsyncMock()
-        mock_blob_service.initialize = AsyncMock()
-
-        mock_blob_client = AsyncMock()
-        mock_properties = MagicMock()
-        mock_properties.etag = '"test-etag-123"'
-        mock_properties.last_modified = datetime.now(timezone.utc)
-        mock_blob_client.get_blob_properties = AsyncMock(return_value=mock_properties)
-
-        mock_container = MagicMock()
-        mock_container.get_blob_client.return_value = mock_blob_client
-        mock_blob_service._product_images_container = mock_container
-
-        mock_blob.return_value = mock_blob_service
-
-        # Request with matching ETag
-        response = await client.get(
-            "/api/product-images/test.png",
-            headers={"If-None-Match": '"test-etag-123"'}
-        )
+    mock_properties = MagicMock()
+    mock_properties.etag = '"test-etag-123"'
+    mock_properties.last_modified = _TEST_NOW
+    image_blob_factory(mock_blob_service, properties=mock_properties)
+
+    # Request with matching ETag
+    response = await client.get(
+        "/api/product-images/test.png",
+        headers={"If-None-Match": '"test-etag-123"'}
+    )
 
-        assert response.status_code == 304
+    assert response.status_code == 304
 
 
-@pytest.mark.asyncio
-async def test_shutdown(client):
+async def test_shutdown(app_module, client, mock_cosmos_service, mock_blob_service):
     """Test application shutdown closes services."""
-    with patch("app.get_cosmos_service") as mock_cosmos:
-        mock_cosmos_service = AsyncMock()
-        mock_cosmos_service.close = AsyncMock()
-        mock_cosmos.return_value = mock_cosmos_service
+    mock_cosmos_service.close = AsyncMock()
 
-        with patch("app.get_blob_service") as mock_blob:
-            mock_blob_service = AsyncMock()
-            mock_blob_service.close = AsyncMock()
-            mock_blob.return_value = mock_blob_service
+    mock_blob_service.close = AsyncMock()
 
-            await shutdown()
+    await app_module.shutdown()
 
-            mock_cosmos_service.close.assert_called_once()
-            mock_blob_service.close.assert_called_once()
+    mock_cosmos_service.close.assert_called_once()
+    mock_blob_service.close.assert_called_once()
 
 
-@pytest.mark.asyncio
 async def test_error_handler_404(client):
     """Test 404 error handler."""
     response = await client.get("/api/nonexistent-endpoint")
@@ -3431,69 +2580,31 @@ async def test_error_handler_404(client):
     assert response.status_code == 404
 
 
-@pytest.mark.asyncio
-async def test_get_generation_status_completed_coverage(client):
-    """Test getting status of completed generation task."""
-    task_id = "test-task-completed"
-    _generation_tasks[task_id] = {
-        "status": "completed",
-        "result": {"text_content": "Generated content"},
-        "conversation_id": "conv123",
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "completed_at": datetime.now(timezone.utc).isoformat()
-    }
-
-    try:
-        response = await client.get(f"/api/generate/status/{task_id}")
-
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert data["status"] == "completed"
-        assert "result" in data
-    finally:
-        del _generation_tasks[task_id]
-
-
-@pytest.mark.asyncio
-async def test_get_generation_status_running(client):
-    """Test getting status of running generation task."""
-    task_id = "test-task-running"
-    _generation_tasks[task_id] = {
-        "status": "running",
+@pytest.mark.parametrize("task,expected_key", [
+    pytest.param(
+        {"status": "completed", "result": {"text_content": "Generated content"}, "completed_at": _TEST_NOW_ISO},
+        "result", id="completed",
+    ),
+    pytest.param(
+        {"status": "running", "started_at": _TEST_NOW_ISO},
+        "message", id="running",
+    ),
+    pytest.param(
+        {"status": "failed", "error": "Test error", "completed_at": _TEST_NOW_ISO},
+        "error", id="failed",
+    ),
+])
+async def test_get_generation_status_by_state(client, gen_task, task, expected_key):
+    """Test getting status of a completed, running or failed generation task."""
+    task_id = gen_task(f"test-task-{task['status']}", {
+        **task,
         "conversation_id": "conv123",
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "started_at": datetime.now(timezone.utc).isoformat()
-    }
-
-    try:
-        response = await client.get(f"/api/generate/status/{task_id}")
-
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert data["status"] == "running"
-        assert "message" in data
-    finally:
-        del _generation_tasks[task_id]
-
-
-@pytest.mark.asyncio
-async def test_get_generation_status_failed(client):
-    """Test getting status of failed generation task."""
-    task_id = "test-task-failed"
-    _generation_tasks[task_id] = {
-        "status": "failed",
-        "error": "Test error",
-        "conversation_id": "conv123",
-        "created_at": datetime.now(timezone.utc).isoformat(),
-        "completed_at": datetime.now(timezone.utc).isoformat()
-    }
+        "created_at": _TEST_NOW_ISO
+    })
 
-    try:
-        response = await client.get(f"/api/generate/status/{task_id}")
+    response = await client.get(_URL_STATUS + task_id)
 
-        assert response.status_code == 200
-        data = await response.get_json()
-        assert data["status"] == "failed"
-        assert "error" in data
-    finally:
-        del _generation_tasks[task_id]
+    assert response.status_code == 200
+    data = await read_json(response)
+    assert data["status"] == task["status"]
+    assert expected_key in data
@@ -9,24 +9,58 @@ Tests cover:
 - DELETE /api/conversations → delete all
 """
 
-import json
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
 
-from app import app  # content-gen/src/backend/app.py (on sys.path via conftest)
+from helpers import JSON_HEADERS, AsyncStub, dumps_json
 from services.routing_service import Intent, RoutingResult, ConversationState
 
+# Request bodies are serialized once at import rather than per test.
+_PARSE_BRIEF_BODY = dumps_json({
+    "message": "I need a social media post about paint products",
+    "conversation_id": "conv-1",
+    "user_id": "user-1",
+})
+_PARSE_EXISTING_BODY = dumps_json({
+    "message": "Another brief",
+    "conversation_id": "conv-existing",
+    "user_id": "user-1",
+})
+_PARSE_EMPTY_BODY = dumps_json({"message": "", "conversation_id": "c1"})
+_PARSE_RAI_BODY = dumps_json({
+    "message": "some text",
+    "conversation_id": "conv-rai",
+    "user_id": "user-1",
+})
+_PARSE_CLARIFY_BODY = dumps_json({
+    "message": "post about paint",
+    "conversation_id": "conv-clarify",
+    "user_id": "user-1",
+})
+_CHAT_NEW_BODY = dumps_json({
+    "message": "I need a social media post about paint products",
+    "conversation_id": "conv-chat-1",
+    "user_id": "user-1",
+})
+_CHAT_FOLLOW_UP_BODY = dumps_json({
+    "message": "Follow up message",
+    "conversation_id": "conv-chat-2",
+    "user_id": "user-1",
+})
+_CHAT_EMPTY_BODY = dumps_json({"message": ""})
+_RENAME_BODY = dumps_json({"title": "My New Title"})
+_RENAME_BLANK_BODY = dumps_json({"title": "  "})
+
 
 # ---------------------------------------------------------------------------
-# Fixtures
+# Fixtures & helpers
 # ---------------------------------------------------------------------------
 
 
-@pytest.fixture
-def client():
-    """Create a Quart test client."""
-    app.config["TESTING"] = True
-    return app.test_client()
+@pytest.fixture(scope="session")
+def client(asgi_client):
+    """Drive this module's endpoint tests through the shared httpx ASGI client."""
+    return asgi_client
 
 
 def _auth_headers(user_id="test-user-123", user_name="Test User"):
@@ -34,10 +68,14 @@ def _auth_headers(user_id="test-user-123", user_name="Test User"):
     return {
         "X-Ms-Client-Principal-Id": user_id,
         "X-Ms-Client-Principal-Name": user_name,
-        "Content-Type": "application/json",
+        **JSON_HEADERS,
     }
 
 
+# Callers never mutate the headers, so the default user's set is built once.
+_AUTH_HEADERS = _auth_headers()
+
+
 # ===================================================================
 # POST /api/chat with PARSE_BRIEF intent — title generation
 # ===================================================================
@@ -45,22 +83,18 @@ def _auth_headers(user_id="test-user-123", user_name="Test User"):
 
 class TestParseBriefTitleGeneration:
 
-    @pytest.mark.asyncio
-    async def test_returns_generated_title(self, client):
-        mock_cosmos = AsyncMock()
-        mock_cosmos.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos.add_message_to_conversation = AsyncMock(return_value={})
-        mock_cosmos.save_conversation = AsyncMock()
+    async def test_returns_generated_title(self, client, monkeypatch, mock_cosmos_service, mock_title_service, mock_orchestrator):
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.add_message_to_conversation = AsyncStub({})
+        mock_cosmos_service.save_conversation = AsyncStub()
 
-        mock_title_svc = MagicMock()
-        mock_title_svc.generate_title = AsyncMock(return_value="Paint Campaign Post")
+        mock_title_service.generate_title = AsyncStub("Paint Campaign Post")
 
         mock_brief = MagicMock()
         mock_brief.model_dump.return_value = {"overview": "test"}
 
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.parse_brief = AsyncMock(
-            return_value=(mock_brief, None, False)
+        mock_orchestrator.parse_brief = AsyncStub(
+            (mock_brief, None, False)
         )
 
         mock_routing_service = MagicMock()
@@ -70,45 +104,32 @@ class TestParseBriefTitleGeneration:
         ))
         mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
 
-        with (
-            patch("app.get_cosmos_service", AsyncMock(return_value=mock_cosmos)),
-            patch("app.get_title_service", return_value=mock_title_svc),
-            patch("app.get_orchestrator", return_value=mock_orchestrator),
-            patch("app.get_routing_service", return_value=mock_routing_service),
-        ):
-            resp = await client.post(
-                "/api/chat",
-                data=json.dumps({
-                    "message": "I need a social media post about paint products",
-                    "conversation_id": "conv-1",
-                    "user_id": "user-1",
-                }),
-                headers={"Content-Type": "application/json"},
-            )
+        monkeypatch.setattr("app.get_routing_service", lambda: mock_routing_service)
+        resp = await client.post(
+            "/api/chat",
+            content=_PARSE_BRIEF_BODY,
+            headers=JSON_HEADERS,
+        )
 
         assert resp.status_code == 200
-        body = await resp.get_json()
+        body = resp.json()
         assert body["data"]["generated_title"] == "Paint Campaign Post"
         assert body["action_type"] == "brief_parsed"  # Requires confirmation
 
-    @pytest.mark.asyncio
-    async def test_skips_title_when_existing(self, client):
-        mock_cosmos = AsyncMock()
-        mock_cosmos.get_conversation = AsyncMock(return_value={
+    async def test_skips_title_when_existing(self, client, monkeypatch, mock_cosmos_service, mock_title_service, mock_orchestrator):
+        mock_cosmos_service.get_conversation = AsyncStub({
             "metadata": {"generated_title": "Existing Title"},
         })
-        mock_cosmos.add_message_to_conversation = AsyncMock(return_value={})
-        mock_cosmos.save_conversation = AsyncMock()
+        mock_cosmos_service.add_message_to_conversation = AsyncStub({})
+        mock_cosmos_service.save_conversation = AsyncStub()
 
-        mock_title_svc = MagicMock()
-        mock_title_svc.generate_title = AsyncMock(return_value="Should Not Use")
+        mock_title_service.generate_title = AsyncMock(return_value="Should Not Use")
 
         mock_brief = MagicMock()
         mock_brief.model_dump.return_value = {"overview": "test"}
 
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.parse_brief = AsyncMock(
-            return_value=(mock_brief, None, False)
+        mock_orchestrator.parse_brief = AsyncStub(
+            (mock_brief, None, False)
         )
 
         mock_routing_service = MagicMock()
@@ -118,38 +139,26 @@ class TestParseBriefTitleGeneration:
         ))
         mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
 
-        with (
-            patch("app.get_cosmos_service", AsyncMock(return_value=mock_cosmos)),
-            patch("app.get_title_service", return_value=mock_title_svc),
-            patch("app.get_orchestrator", return_value=mock_orchestrator),
-            patch("app.get_routing_service", return_value=mock_routing_service),
-        ):
-            resp = await client.post(
-                "/api/chat",
-                data=json.dumps({
-                    "message": "Another brief",
-                    "conversation_id": "conv-existing",
-                    "user_id": "user-1",
-                }),
-                headers={"Content-Type": "application/json"},
-            )
+        monkeypatch.setattr("app.get_routing_service", lambda: mock_routing_service)
+        resp = await client.post(
+            "/api/chat",
+            content=_PARSE_EXISTING_BODY,
+            headers=JSON_HEADERS,
+        )
 
         assert resp.status_code == 200
-        body = await resp.get_json()
+        body = resp.json()
         assert body["data"].get("generated_title") is None
-        mock_title_svc.generate_title.assert_not_called()
+        mock_title_service.generate_title.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_empty_text_returns_400(self, client):
+    async def test_empty_text_returns_400(self, client, monkeypatch, mock_cosmos_service, mock_title_service, mock_orchestrator):
         """Test that empty message with PARSE_BRIEF routes but may still succeed (no validation)."""
-        mock_cosmos = AsyncMock()
-        mock_cosmos.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos.add_message_to_conversation = AsyncMock(return_value={})
-        mock_cosmos.save_conversation = AsyncMock()
-
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.parse_brief = AsyncMock(
-            return_value=(None, "Please provide a brief description", False)
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.add_message_to_conversation = AsyncStub({})
+        mock_cosmos_service.save_conversation = AsyncStub()
+
+        mock_orchestrator.parse_brief = AsyncStub(
+            (None, "Please provide a brief description", False)
         )
 
         mock_routing_service = MagicMock()
@@ -159,35 +168,25 @@ class TestParseBriefTitleGeneration:
         ))
         mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
 
-        mock_title_svc = MagicMock()
-        mock_title_svc.generate_title = AsyncMock(return_value=None)
+        mock_title_service.generate_title = AsyncStub(None)
 
-        with (
-            patch("app.get_cosmos_service", AsyncMock(return_value=mock_cosmos)),
-            patch("app.get_orchestrator", return_value=mock_orchestrator),
-            patch("app.get_routing_service", return_value=mock_routing_service),
-            patch("app.get_title_service", return_value=mock_title_svc),
-        ):
-            resp = await client.post(
-                "/api/chat",
-                data=json.dumps({"message": "", "conversation_id": "c1"}),
-                headers={"Content-Type": "application/json"},
-            )
+        monkeypatch.setattr("app.get_routing_service", lambda: mock_routing_service)
+        resp = await client.post(
+            "/api/chat",
+            content=_PARSE_EMPTY_BODY,
+            headers=JSON_HEADERS,
+        )
         # API doesn't validate empty message - routes to handler
         assert resp.status_code in [200, 400]
 
-    @pytest.mark.asyncio
-    async def test_rai_blocked_includes_title(self, client):
-        mock_cosmos = AsyncMock()
-        mock_cosmos.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos.add_message_to_conversation = AsyncMock(return_value={})
+    async def test_rai_blocked_includes_title(self, client, monkeypatch, mock_cosmos_service, mock_title_service, mock_orchestrator):
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.add_message_to_conversation = AsyncStub({})
 
-        mock_title_svc = MagicMock()
-        mock_title_svc.generate_title = AsyncMock(return_value="Blocked Content")
+        mock_title_service.generate_title = AsyncStub("Blocked Content")
 
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.parse_brief = AsyncMock(
-            return_value=(None, "Content blocked for safety", True)
+        mock_orchestrator.parse_brief = AsyncStub(
+            (None, "Content blocked for safety", True)
         )
 
         mock_routing_service = MagicMock()
@@ -197,43 +196,30 @@ class TestParseBriefTitleGeneration:
         ))
         mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
 
-        with (
-            patch("app.get_cosmos_service", AsyncMock(return_value=mock_cosmos)),
-            patch("app.get_title_service", return_value=mock_title_svc),
-            patch("app.get_orchestrator", return_value=mock_orchestrator),
-            patch("app.get_routing_service", return_value=mock_routing_service),
-        ):
-            resp = await client.post(
-                "/api/chat",
-                data=json.dumps({
-                    "message": "some text",
-                    "conversation_id": "conv-rai",
-                    "user_id": "user-1",
-                }),
-                headers={"Content-Type": "application/json"},
-            )
+        monkeypatch.setattr("app.get_routing_service", lambda: mock_routing_service)
+        resp = await client.post(
+            "/api/chat",
+            content=_PARSE_RAI_BODY,
+            headers=JSON_HEADERS,
+        )
 
         assert resp.status_code == 200
-        body = await resp.get_json()
+        body = resp.json()
         assert body["action_type"] == "rai_blocked"
         assert body["data"]["generated_title"] == "Blocked Content"
 
-    @pytest.mark.asyncio
-    async def test_clarifying_questions_includes_title(self, client):
-        mock_cosmos = AsyncMock()
-        mock_cosmos.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos.add_message_to_conversation = AsyncMock(return_value={})
-        mock_cosmos.save_conversation = AsyncMock()
+    async def test_clarifying_questions_includes_title(self, client, monkeypatch, mock_cosmos_service, mock_title_service, mock_orchestrator):
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.add_message_to_conversation = AsyncStub({})
+        mock_cosmos_service.save_conversation = AsyncStub()
 
-        mock_title_svc = MagicMock()
-        mock_title_svc.generate_title = AsyncMock(return_value="Paint Post")
+        mock_title_service.generate_title = AsyncStub("Paint Post")
 
         mock_brief = MagicMock()
         mock_brief.model_dump.return_value = {"overview": "test"}
 
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.parse_brief = AsyncMock(
-            return_value=(mock_brief, "What is the target audience?", False)
+        mock_orchestrator.parse_brief = AsyncStub(
+            (mock_brief, "What is the target audience?", False)
         )
 
         mock_routing_service = MagicMock()
@@ -243,24 +229,15 @@ class TestParseBriefTitleGeneration:
         ))
         mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
 
-        with (
-            patch("app.get_cosmos_service", AsyncMock(return_value=mock_cosmos)),
-            patch("app.get_title_service", return_value=mock_title_svc),
-            patch("app.get_orchestrator", return_value=mock_orchestrator),
-            patch("app.get_routing_service", return_value=mock_routing_service),
-        ):
-            resp = await client.post(
-                "/api/chat",
-                data=json.dumps({
-                    "message": "post about paint",
-                    "conversation_id": "conv-clarify",
-                    "user_id": "user-1",
-                }),
-                headers={"Content-Type": "application/json"},
-            )
+        monkeypatch.setattr("app.get_routing_service", lambda: mock_routing_service)
+        resp = await client.post(
+            "/api/chat",
+            content=_PARSE_CLARIFY_BODY,
+            headers=JSON_HEADERS,
+        )
 
         assert resp.status_code == 200
-        body = await resp.get_json()
+        body = resp.json()
         assert body["action_type"] == "clarification_needed"
         assert body["data"]["generated_title"] == "Paint Post"
 
@@ -272,22 +249,18 @@ class TestParseBriefTitleGeneration:
 
 class TestChatTitleGeneration:
 
-    @pytest.mark.asyncio
-    async def test_generates_title_for_new_conversation(self, client):
-        mock_cosmos = AsyncMock()
-        mock_cosmos.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos.add_message_to_conversation = AsyncMock(return_value={})
-        mock_cosmos.save_conversation = AsyncMock()
+    async def test_generates_title_for_new_conversation(self, client, monkeypatch, mock_cosmos_service, mock_title_service, mock_orchestrator):
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.add_message_to_conversation = AsyncStub({})
+        mock_cosmos_service.save_conversation = AsyncStub()
 
-        mock_title_svc = MagicMock()
-        mock_title_svc.generate_title = AsyncMock(return_value="Paint Campaign")
+        mock_title_service.generate_title = AsyncMock(return_value="Paint Campaign")
 
         mock_brief = MagicMock()
         mock_brief.model_dump.return_value = {"overview": "test"}
 
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.parse_brief = AsyncMock(
-            return_value=(mock_brief, None, False)
+        mock_orchestrator.parse_brief = AsyncStub(
+            (mock_brief, None, False)
         )
 
         mock_routing_service = MagicMock()
@@ -297,45 +270,32 @@ class TestChatTitleGeneration:
         ))
         mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
 
-        with (
-            patch("app.get_cosmos_service", AsyncMock(return_value=mock_cosmos)),
-            patch("app.get_title_service", return_value=mock_title_svc),
-            patch("app.get_orchestrator", return_value=mock_orchestrator),
-            patch("app.get_routing_service", return_value=mock_routing_service),
-        ):
-            resp = await client.post(
-                "/api/chat",
-                data=json.dumps({
-                    "message": "I need a social media post about paint products",
-                    "conversation_id": "conv-chat-1",
-                    "user_id": "user-1",
-                }),
-                headers={"Content-Type": "application/json"},
-            )
+        monkeypatch.setattr("app.get_routing_service", lambda: mock_routing_service)
+        resp = await client.post(
+            "/api/chat",
+            content=_CHAT_NEW_BODY,
+            headers=JSON_HEADERS,
+        )
 
         assert resp.status_code == 200
-        mock_title_svc.generate_title.assert_called_once_with(
+        mock_title_service.generate_title.assert_called_once_with(
             "I need a social media post about paint products"
         )
 
-    @pytest.mark.asyncio
-    async def test_skips_title_when_already_exists(self, client):
-        mock_cosmos = AsyncMock()
-        mock_cosmos.get_conversation = AsyncMock(return_value={
+    async def test_skips_title_when_already_exists(self, client, monkeypatch, mock_cosmos_service, mock_title_service, mock_orchestrator):
+        mock_cosmos_service.get_conversation = AsyncStub({
             "metadata": {"generated_title": "Already Named"},
         })
-        mock_cosmos.add_message_to_conversation = AsyncMock(return_value={})
-        mock_cosmos.save_conversation = AsyncMock()
+        mock_cosmos_service.add_message_to_conversation = AsyncStub({})
+        mock_cosmos_service.save_conversation = AsyncStub()
 
-        mock_title_svc = MagicMock()
-        mock_title_svc.generate_title = AsyncMock()
+        mock_title_service.generate_title = AsyncMock()
 
         mock_brief = MagicMock()
         mock_brief.model_dump.return_value = {"overview": "test"}
 
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.parse_brief = AsyncMock(
-            return_value=(mock_brief, None, False)
+        mock_orchestrator.parse_brief = AsyncStub(
+            (mock_brief, None, False)
         )
 
         mock_routing_service = MagicMock()
@@ -345,36 +305,24 @@ class TestChatTitleGeneration:
         ))
         mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
 
-        with (
-            patch("app.get_cosmos_service", AsyncMock(return_value=mock_cosmos)),
-            patch("app.get_title_service", return_value=mock_title_svc),
-            patch("app.get_orchestrator", return_value=mock_orchestrator),
-            patch("app.get_routing_service", return_value=mock_routing_service),
-        ):
-            resp = await client.post(
-                "/api/chat",
-                data=json.dumps({
-                    "message": "Follow up message",
-                    "conversation_id": "conv-chat-2",
-                    "user_id": "user-1",
-                }),
-                headers={"Content-Type": "application/json"},
-            )
+        monkeypatch.setattr("app.get_routing_service", lambda: mock_routing_service)
+        resp = await client.post(
+            "/api/chat",
+            content=_CHAT_FOLLOW_UP_BODY,
+            headers=JSON_HEADERS,
+        )
 
         assert resp.status_code == 200
-        mock_title_svc.generate_title.assert_not_called()
+        mock_title_service.generate_title.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_empty_message_returns_400(self, client):
+    async def test_empty_message_returns_400(self, client, monkeypatch, mock_cosmos_service, mock_title_service, mock_orchestrator):
         """Test empty message - API doesn't validate but routes to handler."""
-        mock_cosmos = AsyncMock()
-        mock_cosmos.get_conversation = AsyncMock(return_value=None)
-        mock_cosmos.add_message_to_conversation = AsyncMock(return_value={})
-        mock_cosmos.save_conversation = AsyncMock()
-
-        mock_orchestrator = MagicMock()
-        mock_orchestrator.parse_brief = AsyncMock(
-            return_value=(None, "Please provide a brief description", False)
+        mock_cosmos_service.get_conversation = AsyncStub(None)
+        mock_cosmos_service.add_message_to_conversation = AsyncStub({})
+        mock_cosmos_service.save_conversation = AsyncStub()
+
+        mock_orchestrator.parse_brief = AsyncStub(
+            (None, "Please provide a brief description", False)
         )
 
         mock_routing_service = MagicMock()
@@ -384,20 +332,14 @@ class TestChatTitleGeneration:
         ))
         mock_routing_service.derive_state_from_conversation = MagicMock(return_value=ConversationState())
 
-        mock_title_svc = MagicMock()
-        mock_title_svc.generate_title = AsyncMock(return_value=None)
+        mock_title_service.generate_title = AsyncStub(None)
 
-        with (
-            patch("app.get_cosmos_service", AsyncMock(return_value=mock_cosmos)),
-            patch("app.get_orchestrator", return_value=mock_orchestrator),
-            patch("app.get_routing_service", return_value=mock_routing_service),
-            patch("app.get_title_service", return_value=mock_title_svc),
-        ):
-            resp = await client.post(
-                "/api/chat",
-                data=json.dumps({"message": ""}),
-                headers={"Content-Type": "application/json"},
-            )
+        monkeypatch.setattr("app.get_routing_service", lambda: mock_routing_service)
+        resp = await client.post(
+            "/api/chat",
+            content=_CHAT_EMPTY_BODY,
+            headers=JSON_HEADERS,
+        )
         # API doesn't validate empty message - routes to handler which may succeed
         assert resp.status_code in [200, 400]
 
@@ -409,101 +351,82 @@ class TestChatTitleGeneration:
 
 class TestConversationCRUD:
 
-    @pytest.mark.asyncio
-    async def test_list_conversations(self, client):
-        mock_cosmos = AsyncMock()
-        mock_cosmos.get_user_conversations = AsyncMock(return_value=[
+    async def test_list_conversations(self, client, mock_cosmos_service):
+        mock_cosmos_service.get_user_conversations = AsyncStub([
             {"id": "c1", "title": "Paint Campaign",
              "lastMessage": "hello", "timestamp": "2025-01-01", "messageCount": 2},
         ])
 
-        with patch("app.get_cosmos_service", AsyncMock(return_value=mock_cosmos)):
-            resp = await client.get("/api/conversations", headers=_auth_headers())
+        resp = await client.get("/api/conversations", headers=_AUTH_HEADERS)
 
         assert resp.status_code == 200
-        body = await resp.get_json()
+        body = resp.json()
         assert body["count"] == 1
         assert body["conversations"][0]["title"] == "Paint Campaign"
 
-    @pytest.mark.asyncio
-    async def test_rename_conversation(self, client):
-        mock_cosmos = AsyncMock()
-        mock_cosmos.rename_conversation = AsyncMock(return_value={"id": "c1"})
+    @pytest.mark.parametrize("rename_return,conversation_id,status", [
+        pytest.param({"id": "c1"}, "c1", 200, id="renamed"),
+        pytest.param(None, "nonexistent", 404, id="nonexistent"),
+    ])
+    async def test_rename_conversation(self, client, mock_cosmos_service, rename_return, conversation_id, status):
+        mock_cosmos_service.rename_conversation = AsyncStub(rename_return)
 
-        with patch("app.get_cosmos_service", AsyncMock(return_value=mock_cosmos)):
-            resp = await client.put(
-                "/api/conversations/c1",
-                data=json.dumps({"title": "My New Title"}),
-                headers=_auth_headers(),
-            )
-
-        assert resp.status_code == 200
-        body = await resp.get_json()
-        assert body["success"] is True
-        assert body["title"] == "My New Title"
-
-    @pytest.mark.asyncio
-    async def test_rename_empty_title_returns_400(self, client):
         resp = await client.put(
-            "/api/conversations/c1",
-            data=json.dumps({"title": "  "}),
-            headers=_auth_headers(),
+            f"/api/conversations/{conversation_id}",
+            content=_RENAME_BODY,
+            headers=_AUTH_HEADERS,
         )
-        assert resp.status_code == 400
 
-    @pytest.mark.asyncio
-    async def test_rename_nonexistent_returns_404(self, client):
-        mock_cosmos = AsyncMock()
-        mock_cosmos.rename_conversation = AsyncMock(return_value=None)
+        assert resp.status_code == status
+        if status == 200:
+            data = resp.json()
+            assert data["success"] is True
+            assert data["title"] == "My New Title"
 
-        with patch("app.get_cosmos_service", AsyncMock(return_value=mock_cosmos)):
-            resp = await client.put(
-                "/api/conversations/nonexistent",
-                data=json.dumps({"title": "Some Title"}),
-                headers=_auth_headers(),
-            )
+    async def test_rename_conversation_empty_title(self, app, app_module, mock_cosmos_service):
+        # Payload validation only: call the view directly, skipping the ASGI client
+        mock_cosmos_service.rename_conversation = AsyncMock()
 
-        assert resp.status_code == 404
+        async with app.test_request_context(
+            "/api/conversations/c1", method="PUT", data=_RENAME_BLANK_BODY, headers=_AUTH_HEADERS,
+        ):
+            resp, status = await app_module.update_conversation("c1")
 
-    @pytest.mark.asyncio
-    async def test_delete_single_conversation(self, client):
-        mock_cosmos = AsyncMock()
-        mock_cosmos.delete_conversation = AsyncMock(return_value=True)
+        assert status == 400
+        data = await resp.get_json()
+        assert data["error"] == "Title is required"
+        mock_cosmos_service.rename_conversation.assert_not_called()
 
-        with patch("app.get_cosmos_service", AsyncMock(return_value=mock_cosmos)):
-            resp = await client.delete(
-                "/api/conversations/c1", headers=_auth_headers(),
-            )
+    async def test_delete_single_conversation(self, client, mock_cosmos_service):
+        mock_cosmos_service.delete_conversation = AsyncStub(True)
+
+        resp = await client.delete(
+            "/api/conversations/c1", headers=_AUTH_HEADERS,
+        )
 
         assert resp.status_code == 200
-        body = await resp.get_json()
+        body = resp.json()
         assert body["success"] is True
 
-    @pytest.mark.asyncio
-    async def test_delete_all_conversations(self, client):
-        mock_cosmos = AsyncMock()
-        mock_cosmos.delete_all_conversations = AsyncMock(return_value=5)
+    async def test_delete_all_conversations(self, client, mock_cosmos_service):
+        mock_cosmos_service.delete_all_conversations = AsyncStub(5)
 
-        with patch("app.get_cosmos_service", AsyncMock(return_value=mock_cosmos)):
-            resp = await client.delete(
-                "/api/conversations", headers=_auth_headers(),
-            )
+        resp = await client.delete(
+            "/api/conversations", headers=_AUTH_HEADERS,
+        )
 
         assert resp.status_code == 200
-        body = await resp.get_json()
+        body = resp.json()
         assert body["success"] is True
         assert body["deleted_count"] == 5
 
-    @pytest.mark.asyncio
-    async def test_delete_all_error_returns_500(self, client):
-        mock_cosmos = AsyncMock()
-        mock_cosmos.delete_all_conversations = AsyncMock(
-            side_effect=Exception("DB error")
+    async def test_delete_all_error_returns_500(self, client, mock_cosmos_service):
+        mock_cosmos_service.delete_all_conversations = AsyncStub(
+            exc=Exception("DB error")
         )
 
-        with patch("app.get_cosmos_service", AsyncMock(return_value=mock_cosmos)):
-            resp = await client.delete(
-                "/api/conversations", headers=_auth_headers(),
-            )
+        resp = await client.delete(
+            "/api/conversations", headers=_AUTH_HEADERS,
+        )
 
         assert resp.status_code == 500
@@ -9,6 +9,11 @@ Tests cover:
 - delete_all_conversations: bulk delete
 """
 
+import asyncio
+import json
+from pathlib import Path
+from types import MappingProxyType
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -20,16 +25,26 @@ from services.cosmos_service import CosmosDBService
 # ---------------------------------------------------------------------------
 
 
+def _readonly(doc):
+    """Wrap a document (and its metadata) in ``MappingProxyType`` snapshots."""
+    if doc is None:
+        return None
+    if isinstance(doc.get("metadata"), dict):
+        doc = {**doc, "metadata": MappingProxyType(doc["metadata"])}
+    return MappingProxyType(doc)
+
+
 def _make_service(existing_conversation=None):
     """
     Return a CosmosDBService with Cosmos container mocked out.
-    ``get_conversation`` returns *existing_conversation*.
+    ``get_conversation`` returns a read-only view of *existing_conversation*,
+    so any in-place mutation by the service fails the test.
     """
     svc = CosmosDBService()
     svc._client = MagicMock()                     # mark as initialised
     svc._conversations_container = AsyncMock()
     svc._conversations_container.upsert_item = AsyncMock(side_effect=lambda item: item)
-    svc.get_conversation = AsyncMock(return_value=existing_conversation)
+    svc.get_conversation = AsyncMock(return_value=_readonly(existing_conversation))
     svc.initialize = AsyncMock()
     return svc
 
@@ -124,6 +139,33 @@ class TestAddMessageToConversation:
             message={"role": "user", "content": "hello"},
         )
         assert result["userId"] == "u1"
+        assert result["type"] == "conversation"
+
+    @pytest.mark.asyncio
+    async def test_new_conversation_has_type(self):
+        svc = _make_service(existing_conversation=None)
+        result = await svc.add_message_to_conversation(
+            conversation_id="conv-7", user_id="u1",
+            message={"role": "user", "content": "hello"},
+        )
+        assert result["type"] == "conversation"
+
+    @pytest.mark.asyncio
+    async def test_existing_is_point_read(self):
+        existing = {
+            "id": "conv-8", "userId": "u1", "type": "conversation",
+            "messages": [], "metadata": {},
+        }
+        svc = _make_service()
+        del svc.get_conversation                  # use the real lookup
+        svc._conversations_container.read_item = AsyncMock(return_value=existing)
+        svc._conversations_container.query_items = MagicMock()
+        await svc.add_message_to_conversation(
+            conversation_id="conv-8", user_id="u1",
+            message={"role": "user", "content": "hello"},
+        )
+        svc._conversations_container.read_item.assert_awaited_once_with(item="conv-8", partition_key="u1")
+        svc._conversations_container.query_items.assert_not_called()
 
 
 # ===================================================================
@@ -178,82 +220,126 @@ class TestSaveConversationMetadataMerge:
 class TestGetUserConversationsTitleResolution:
 
     @staticmethod
-    def _make_query_service(items):
+    def _project(doc):
+        """Shape a stored document the way the summary projection query returns it."""
+        messages = doc.get("messages") or []
+        metadata = doc.get("metadata") or {}
+        return {
+            "id": doc["id"],
+            "updated_at": doc.get("updated_at"),
+            "custom_title": metadata.get("custom_title"),
+            "generated_title": metadata.get("generated_title"),
+            "overview": (doc.get("brief") or {}).get("overview"),
+            "message_count": len(messages),
+            "last_messages": messages[-1:],
+            "first_user_contents": [m["content"] for m in messages if m.get("role") == "user"][:1],
+        }
+
+    @pytest.fixture
+    def query_svc(self):
+        """Factory that points one service's conversation query at *items*."""
         svc = CosmosDBService()
         svc._client = MagicMock()
         svc.initialize = AsyncMock()
+        svc._conversations_container = MagicMock()
+        svc.queries = []
 
-        async def _async_iter(*args, **kwargs):
-            for item in items:
-                yield item
+        def _set(items):
+            async def _async_iter(*args, **kwargs):
+                svc.queries.append(kwargs["query"])
+                for item in items:
+                    yield self._project(item)
 
-        svc._conversations_container = MagicMock()
-        svc._conversations_container.query_items = _async_iter
-        return svc
+            svc._conversations_container.query_items = _async_iter
+            return svc
+
+        return _set
 
     @pytest.mark.asyncio
-    async def test_custom_title_wins(self):
-        items = [{
+    async def test_query_projects_summary_fields_only(self, query_svc):
+        svc = query_svc([])
+        await svc.get_user_conversations("u1")
+        select = svc.queries[0].split("FROM c\n")[0]
+        assert ", c.messages" not in select
+        assert ", c.brief," not in select
+        assert "c.metadata," not in select
+        assert "ARRAY_LENGTH(c.messages) AS message_count" in select
+
+    @pytest.mark.asyncio
+    async def test_query_orders_by_recency(self, query_svc):
+        svc = query_svc([])
+        await svc.get_user_conversations("u1")
+        assert svc.queries[0].split()[-4:] == ["ORDER", "BY", "c.updated_at", "DESC"]
+
+    def test_conversations_index_serves_order_by(self):
+        # ORDER BY a single path is served by the range index on /*; a composite index
+        # would only help a query that orders by the same paths, which this one cannot
+        # because it also matches legacy user_id-only documents
+        template = Path(__file__).resolve().parents[2] / "infra" / "main.json"
+        name = "[variables('cosmosDBConversationsContainer')]"
+
+        def find(node):
+            if isinstance(node, dict):
+                if node.get("name") == name and "indexingPolicy" in node:
+                    return node["indexingPolicy"]
+                node = list(node.values())
+            if isinstance(node, list):
+                for child in node:
+                    found = find(child)
+                    if found is not None:
+                        return found
+            return None
+
+        policy = find(json.loads(template.read_text(encoding="utf-8")))
+        assert {"path": "/*"} in policy["includedPaths"]
+        assert all(p["path"] != "/updated_at/?" for p in policy["excludedPaths"])
+        assert "compositeIndexes" not in policy
+
+    @pytest.mark.parametrize("doc,expected", [
+        pytest.param({
             "id": "c1",
             "metadata": {"custom_title": "User Renamed", "generated_title": "AI Title"},
             "brief": {"overview": "Brief overview here"},
             "messages": [{"role": "user", "content": "Hello world"}],
             "updated_at": "2025-01-01",
-        }]
-        svc = self._make_query_service(items)
-        result = await svc.get_user_conversations("u1")
-        assert result[0]["title"] == "User Renamed"
-
-    @pytest.mark.asyncio
-    async def test_generated_title_wins_over_brief_and_message(self):
-        items = [{
+        }, "User Renamed", id="custom_title_wins"),
+        pytest.param({
             "id": "c2",
             "metadata": {"generated_title": "Paint Campaign"},
             "brief": {"overview": "Summer Sale 2024 overview text"},
             "messages": [{"role": "user", "content": "social media post"}],
             "updated_at": "2025-01-01",
-        }]
-        svc = self._make_query_service(items)
-        result = await svc.get_user_conversations("u1")
-        assert result[0]["title"] == "Paint Campaign"
-
-    @pytest.mark.asyncio
-    async def test_brief_overview_fallback_four_words(self):
-        items = [{
+        }, "Paint Campaign", id="generated_title_wins_over_brief_and_message"),
+        pytest.param({
             "id": "c3", "metadata": {},
             "brief": {"overview": "Summer Sale 2024 Campaign overview text"},
             "messages": [], "updated_at": "2025-01-01",
-        }]
-        svc = self._make_query_service(items)
-        result = await svc.get_user_conversations("u1")
-        assert result[0]["title"] == "Summer Sale 2024 Campaign"
-
-    @pytest.mark.asyncio
-    async def test_first_user_message_fallback_four_words(self):
-        items = [{
+        }, "Summer Sale 2024 Campaign", id="brief_overview_fallback_four_words"),
+        pytest.param({
             "id": "c4", "metadata": {}, "brief": None,
             "messages": [
                 {"role": "assistant", "content": "Welcome!"},
                 {"role": "user", "content": "I need to create a social media post about paint"},
             ],
             "updated_at": "2025-01-01",
-        }]
-        svc = self._make_query_service(items)
-        result = await svc.get_user_conversations("u1")
-        assert result[0]["title"] == "I need to create"
-
-    @pytest.mark.asyncio
-    async def test_empty_conversation_default(self):
-        items = [{
+        }, "I need to create", id="first_user_message_fallback_four_words"),
+        pytest.param({
             "id": "c5", "metadata": {}, "brief": None,
             "messages": [], "updated_at": "2025-01-01",
-        }]
-        svc = self._make_query_service(items)
+        }, "New Conversation", id="empty_conversation_default"),
+        pytest.param({
+            "id": "c7", "metadata": None, "brief": None,
+            "messages": [], "updated_at": "2025-01-01",
+        }, "New Conversation", id="none_metadata_default"),
+    ])
+    @pytest.mark.asyncio
+    async def test_title_resolution(self, query_svc, doc, expected):
+        svc = query_svc([doc])
         result = await svc.get_user_conversations("u1")
-        assert result[0]["title"] == "New Conversation"
+        assert result[0]["title"] == expected
 
     @pytest.mark.asyncio
-    async def test_message_count_and_last_message(self):
+    async def test_message_count_and_last_message(self, query_svc):
         items = [{
             "id": "c6", "metadata": {"generated_title": "Test"}, "brief": None,
             "messages": [
@@ -262,21 +348,11 @@ class TestGetUserConversationsTitleResolution:
             ],
             "updated_at": "2025-06-01",
         }]
-        svc = self._make_query_service(items)
+        svc = query_svc(items)
         result = await svc.get_user_conversations("u1")
         assert result[0]["messageCount"] == 2
         assert result[0]["lastMessage"] == "How can I help?"
 
-    @pytest.mark.asyncio
-    async def test_none_metadata_default(self):
-        items = [{
-            "id": "c7", "metadata": None, "brief": None,
-            "messages": [], "updated_at": "2025-01-01",
-        }]
-        svc = self._make_query_service(items)
-        result = await svc.get_user_conversations("u1")
-        assert result[0]["title"] == "New Conversation"
-
 
 # ===================================================================
 # rename_conversation
@@ -311,30 +387,131 @@ class TestRenameConversation:
 
 class TestDeleteAllConversations:
 
-    @pytest.mark.asyncio
-    async def test_deletes_all_returns_count(self):
-        convs = [{"id": "c1", "title": "a"}, {"id": "c2", "title": "b"}, {"id": "c3", "title": "c"}]
+    @staticmethod
+    def _make_delete_service(items):
         svc = _make_service(existing_conversation=None)
-        svc.get_user_conversations = AsyncMock(return_value=convs)
+
+        async def _async_iter(*args, **kwargs):
+            for item in items:
+                yield item
+
+        svc._conversations_container.query_items = _async_iter
+        svc._conversations_container.execute_item_batch = AsyncMock(return_value=[])
+        return svc
+
+    @pytest.mark.asyncio
+    async def test_deletes_all_in_one_batch_returns_count(self):
+        items = [{"id": "c1", "userId": "u1"}, {"id": "c2", "userId": "u1"}, {"id": "c3", "userId": "u1"}]
+        svc = self._make_delete_service(items)
+        count = await svc.delete_all_conversations("u1")
+        assert count == 3
+        svc._conversations_container.execute_item_batch.assert_awaited_once_with(
+            batch_operations=[("delete", ("c1",)), ("delete", ("c2",)), ("delete", ("c3",))],
+            partition_key="u1",
+        )
+
+    @pytest.mark.asyncio
+    async def test_one_batch_per_partition_key(self):
+        items = [{"id": "c1", "userId": "u1"}, {"id": "c2", "userId": "u2"}, {"id": "c3", "userId": "u1"}]
+        svc = self._make_delete_service(items)
+        count = await svc.delete_all_conversations("u1")
+        assert count == 3
+        calls = svc._conversations_container.execute_item_batch.await_args_list
+        assert {c.kwargs["partition_key"]: len(c.kwargs["batch_operations"]) for c in calls} == {
+            "u1": 2, "u2": 1,
+        }
+
+    @pytest.mark.asyncio
+    async def test_legacy_documents_use_delete_conversation(self):
+        # Old documents only carry user_id and are not in the userId partition
+        items = [{"id": "c1", "userId": "u1"}, {"id": "c2", "user_id": "u1"}, {"id": "c3", "user_id": "u1"}]
+        svc = self._make_delete_service(items)
         svc.delete_conversation = AsyncMock(return_value=True)
         count = await svc.delete_all_conversations("u1")
         assert count == 3
-        assert svc.delete_conversation.call_count == 3
+        svc._conversations_container.execute_item_batch.assert_awaited_once_with(
+            batch_operations=[("delete", ("c1",))], partition_key="u1",
+        )
+        assert sorted(c.args for c in svc.delete_conversation.await_args_list) == [
+            ("c2", "u1"), ("c3", "u1"),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_splits_batches_at_operation_limit(self):
+        items = [{"id": f"c{i}", "userId": "u1"} for i in range(250)]
+        svc = self._make_delete_service(items)
+        count = await svc.delete_all_conversations("u1")
+        assert count == 250
+        sizes = [
+            len(c.kwargs["batch_operations"])
+            for c in svc._conversations_container.execute_item_batch.await_args_list
+        ]
+        assert sizes == [100, 100, 50]
+
+    @pytest.mark.asyncio
+    async def test_bounds_concurrent_batches(self):
+        items = [{"id": f"c{i}", "userId": f"u{i}"} for i in range(40)]
+        svc = self._make_delete_service(items)
+        in_flight = peak = 0
+
+        async def _execute(batch_operations, partition_key):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return []
+
+        svc._conversations_container.execute_item_batch = AsyncMock(side_effect=_execute)
+        count = await svc.delete_all_conversations("u1")
+        assert count == 40
+        assert peak == 16
+
+    @pytest.mark.asyncio
+    async def test_rolled_back_batch_retries_items_and_counts_not_found(self):
+        from azure.cosmos.exceptions import CosmosBatchOperationError, CosmosResourceNotFoundError
+
+        # c3 was deleted elsewhere after the query, so the u2 batch is rolled back
+        items = [
+            {"id": "c1", "userId": "u1"}, {"id": "c2", "userId": "u2"},
+            {"id": "c3", "userId": "u2"}, {"id": "c4", "user_id": "u1"},
+        ]
+        svc = self._make_delete_service(items)
+        svc.delete_conversation = AsyncMock(return_value=True)
+
+        async def _execute(batch_operations, partition_key):
+            if partition_key == "u2":
+                raise CosmosBatchOperationError(error_index=1, headers={}, status_code=404)
+            return []
+
+        async def _delete_item(item, partition_key):
+            if item == "c3":
+                raise CosmosResourceNotFoundError(status_code=404)
+
+        svc._conversations_container.execute_item_batch = AsyncMock(side_effect=_execute)
+        svc._conversations_container.delete_item = AsyncMock(side_effect=_delete_item)
+        count = await svc.delete_all_conversations("u1")
+        assert count == 4
+        assert [c.kwargs for c in svc._conversations_container.delete_item.await_args_list] == [
+            {"item": "c2", "partition_key": "u2"}, {"item": "c3", "partition_key": "u2"},
+        ]
 
     @pytest.mark.asyncio
     async def test_handles_partial_failures(self):
-        convs = [{"id": "c1", "title": "a"}, {"id": "c2", "title": "b"}]
-        svc = _make_service(existing_conversation=None)
-        svc.get_user_conversations = AsyncMock(return_value=convs)
-        svc.delete_conversation = AsyncMock(side_effect=[True, Exception("fail")])
+        from azure.cosmos.exceptions import CosmosBatchOperationError
+
+        items = [{"id": "c1", "userId": "u1"}, {"id": "c2", "userId": "u2"}, {"id": "c3", "userId": "u2"}]
+        svc = self._make_delete_service(items)
+        svc._conversations_container.execute_item_batch = AsyncMock(
+            side_effect=[[], CosmosBatchOperationError(error_index=0, headers={}, status_code=429)]
+        )
+        svc._conversations_container.delete_item = AsyncMock(side_effect=[None, Exception("fail")])
         count = await svc.delete_all_conversations("u1")
-        assert count == 1
+        assert count == 2
 
     @pytest.mark.asyncio
     async def test_empty_history_returns_zero(self):
-        svc = _make_service(existing_conversation=None)
-        svc.get_user_conversations = AsyncMock(return_value=[])
-        svc.delete_conversation = AsyncMock()
+        svc = self._make_delete_service([])
         count = await svc.delete_all_conversations("u1")
         assert count == 0
-        svc.delete_conversation.assert_not_called()
+        svc._conversations_container.execute_item_batch.assert_not_called()
@@ -5,8 +5,12 @@ Only tests models that have computed properties or custom validators.
 Simple field-only models are tested implicitly through service/API tests.
 """
 
+import pytest
+from pydantic import ValidationError
+
 from models import (ComplianceResult, ComplianceSeverity, ComplianceViolation,
-                    ContentGenerationResponse, GeneratedTextContent)
+                    ContentGenerationResponse, GeneratedTextContent,
+                    needs_modification)
 
 
 class TestComplianceResult:
@@ -109,6 +113,117 @@ class TestComplianceResult:
 
         assert result.has_errors is True
         assert result.has_warnings is True
+        assert result.error_count == 1
+        assert result.warning_count == 1
+
+    def test_counts_not_serialized(self):
+        """Test the severity tallies stay out of the serialized result."""
+        result = ComplianceResult(
+            is_valid=False,
+            violations=[
+                ComplianceViolation(
+                    severity=ComplianceSeverity.ERROR,
+                    message="Error",
+                    suggestion="Fix"
+                )
+            ]
+        )
+
+        assert set(result.model_dump()) == {"is_valid", "violations"}
+
+    def test_violations_validated_from_dicts(self):
+        """Test nested violation dicts are validated into ComplianceViolation."""
+        result = ComplianceResult(
+            is_valid=False,
+            violations=[{"severity": "error", "message": "Error", "suggestion": "Fix"}]
+        )
+
+        assert isinstance(result.violations[0], ComplianceViolation)
+        assert result.violations[0].severity is ComplianceSeverity.ERROR
+        assert result.error_count == 1
+
+    def test_violation_coerces_raw_severity(self):
+        """Test a directly built violation turns a raw severity string into the enum."""
+        violation = ComplianceViolation(
+            severity="error", message="Error", suggestion="Fix"
+        )
+        result = ComplianceResult(is_valid=False, violations=[violation])
+
+        assert violation.severity is ComplianceSeverity.ERROR
+        assert result.error_count == 1
+
+    def test_violation_rejects_unknown_severity(self):
+        """Test an unknown severity string is rejected on direct construction."""
+        with pytest.raises(ValidationError):
+            ComplianceViolation(severity="fatal", message="Error", suggestion="Fix")
+
+    def test_counts_with_model_construct(self):
+        """Test counts are correct when validation is skipped via model_construct."""
+        error = ComplianceViolation(
+            severity=ComplianceSeverity.ERROR, message="Error", suggestion="Fix"
+        )
+        result = ComplianceResult.model_construct(is_valid=False, violations=(error,))
+
+        assert result.error_count == 1
+        assert result.has_errors is True
+        assert needs_modification(result) is True
+
+    def test_counts_follow_new_violations(self):
+        """Test counts are re-tallied when the violations tuple is replaced."""
+        warning = ComplianceViolation(
+            severity=ComplianceSeverity.WARNING, message="Warning", suggestion="Review"
+        )
+        error = ComplianceViolation(
+            severity=ComplianceSeverity.ERROR, message="Error", suggestion="Fix"
+        )
+        result = ComplianceResult(is_valid=True, violations=[warning])
+        assert result.has_errors is False
+
+        updated = result.model_copy(update={"violations": (warning, error)})
+        result.violations = (error, error)
+
+        assert updated.error_count == 1
+        assert updated.warning_count == 1
+        assert result.error_count == 2
+        assert result.has_warnings is False
+
+
+class TestNeedsModification:
+    """Tests for the needs_modification helper."""
+
+    def test_false_without_compliance(self):
+        """Test missing compliance never requires modification."""
+        assert needs_modification(None) is False
+
+    def test_false_with_only_warnings(self):
+        """Test warnings alone do not require modification."""
+        result = ComplianceResult(
+            is_valid=True,
+            violations=[
+                ComplianceViolation(
+                    severity=ComplianceSeverity.WARNING,
+                    message="Warning",
+                    suggestion="Review"
+                )
+            ]
+        )
+
+        assert needs_modification(result) is False
+
+    def test_true_with_errors(self):
+        """Test error-level violations require modification."""
+        result = ComplianceResult(
+            is_valid=False,
+            violations=[
+                ComplianceViolation(
+                    severity=ComplianceSeverity.ERROR,
+                    message="Error",
+                    suggestion="Fix"
+                )
+            ]
+        )
+
+        assert needs_modification(result) is True
 
 
 class TestContentGenerationResponse:
@@ -250,6 +250,18 @@ class TestBrandGuidelinesProperties:
             guidelines = _BrandGuidelinesSettings()
             assert guidelines.required_disclosures == ["Terms apply", "See store for details"]
 
+    def test_parsed_lists_are_cached(self):
+        """Test the comma-separated strings are parsed once per instance."""
+        from settings import _BrandGuidelinesSettings
+
+        with patch.dict(os.environ, {
+            "BRAND_PROHIBITED_WORDS": "cheap, budget",
+            "BRAND_REQUIRED_DISCLOSURES": "Terms apply"
+        }, clear=False):
+            guidelines = _BrandGuidelinesSettings()
+            assert guidelines.prohibited_words is guidelines.prohibited_words
+            assert guidelines.required_disclosures is guidelines.required_disclosures
+
 
 class TestBrandGuidelinesPromptMethods:
     """Tests for brand guidelines prompt generation methods."""
@@ -295,6 +307,16 @@ class TestBrandGuidelinesPromptMethods:
         assert guidelines.primary_color in prompt
         assert guidelines.secondary_color in prompt
 
+    def test_prompts_are_built_once(self):
+        """Test each prompt is assembled once per instance."""
+        from settings import _BrandGuidelinesSettings
+
+        guidelines = _BrandGuidelinesSettings()
+
+        assert guidelines.get_compliance_prompt() is guidelines.get_compliance_prompt()
+        assert guidelines.get_text_generation_prompt() is guidelines.get_text_generation_prompt()
+        assert guidelines.get_image_generation_prompt() is guidelines.get_image_generation_prompt()
+
     def test_get_text_generation_prompt_with_prohibited_words(self):
         """Test prompt includes prohibited words when set."""
         from settings import _BrandGuidelinesSettings
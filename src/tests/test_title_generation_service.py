@@ -3,14 +3,44 @@ Unit tests for the Title Generation Service.
 
 Tests cover:
 - TitleService._fallback_title() static method
-- TitleService.generate_title() with mocked AI agent
+- TitleService.generate_title() with a fake AI agent
 - get_title_service() singleton factory
 """
 
+from types import SimpleNamespace
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
+
+_DEFAULT_TITLE = "New Conversation"
+_MSG_PAINT_LONG = "I need to create a social media post about paint products"
+_MSG_PAINT_RENOVATION = _MSG_PAINT_LONG + " for home renovation"
+_EXPECT_PAINT_FALLBACK = "I need to create"
+_API_ERROR = RuntimeError("API error")
+
+
+@pytest.fixture(scope="session")
+def title_module():
+    """The ``services.title_service`` module, imported on first use.
+
+    Importing lazily keeps the agent framework and Azure SDK imports out of
+    collection, so ``--collect-only`` and ``-k`` runs that skip this module
+    do not pay for them.
+    """
+    import services.title_service as module
+    return module
+
+
+@pytest.fixture(scope="session")
+def title_cls(title_module):
+    """The ``TitleService`` class."""
+    return title_module.TitleService
 
-from services.title_service import TitleService, get_title_service
+
+@pytest.fixture(scope="session")
+def get_title_service_fn(title_module):
+    """The ``get_title_service`` singleton factory."""
+    return title_module.get_title_service
 
 
 # ---------------------------------------------------------------------------
@@ -21,139 +51,129 @@ from services.title_service import TitleService, get_title_service
 class TestFallbackTitle:
     """Tests for the _fallback_title static method."""
 
-    def test_returns_first_four_words(self):
-        title = TitleService._fallback_title(
-            "I need to create a social media post about paint products"
-        )
-        assert title == "I need to create"
+    @pytest.mark.parametrize("message,expected", [
+        pytest.param(_MSG_PAINT_LONG, _EXPECT_PAINT_FALLBACK, id="first_four_words"),
+        pytest.param("Summer sale campaign", "Summer sale campaign", id="short_message"),
+        pytest.param("", _DEFAULT_TITLE, id="empty_string"),
+        pytest.param(None, _DEFAULT_TITLE, id="none"),
+        pytest.param("   ", _DEFAULT_TITLE, id="whitespace_only"),
+        pytest.param(
+            "Generate social media content",
+            "Generate social media content",
+            id="exactly_four_words",
+        ),
+        pytest.param(
+            "  Create a marketing campaign for holiday season  ",
+            "Create a marketing campaign",
+            id="strips_whitespace",
+        ),
+    ])
+    def test_fallback(self, title_cls, message, expected):
+        assert title_cls._fallback_title(message) == expected
 
-    def test_short_message_uses_all_words(self):
-        title = TitleService._fallback_title("Summer sale campaign")
-        assert title == "Summer sale campaign"
 
-    def test_empty_string_returns_default(self):
-        assert TitleService._fallback_title("") == "New Conversation"
+# ---------------------------------------------------------------------------
+# generate_title  (fake AI agent)
+# ---------------------------------------------------------------------------
 
-    def test_none_returns_default(self):
-        assert TitleService._fallback_title(None) == "New Conversation"
 
-    def test_whitespace_only_returns_default(self):
-        assert TitleService._fallback_title("   ") == "New Conversation"
+class FakeAgent:
+    """Stand-in for the title agent with a settable reply and a call counter."""
 
-    def test_exactly_four_words(self):
-        title = TitleService._fallback_title("Generate social media content")
-        assert title == "Generate social media content"
+    def __init__(self):
+        self.reset()
 
-    def test_strips_leading_trailing_whitespace(self):
-        title = TitleService._fallback_title(
-            "  Create a marketing campaign for holiday season  "
-        )
-        assert title == "Create a marketing campaign"
+    def reset(self):
+        self.ret = None
+        self.exc = None
+        self.calls = 0
 
+    async def run(self, *_args, **_kwargs):
+        self.calls += 1
+        if self.exc is not None:
+            raise self.exc
+        return self.ret
 
-# ---------------------------------------------------------------------------
-# generate_title  (AI agent mocked)
-# ---------------------------------------------------------------------------
 
+@pytest.fixture(scope="class")
+def title_service(title_cls):
+    """Create a TitleService with a fake agent, shared by the test class."""
+    svc = title_cls()
+    svc._agent = FakeAgent()
+    svc._initialized = True
+    return svc
 
-class TestGenerateTitle:
-    """Tests for generate_title() with a mocked AI agent."""
 
-    @pytest.fixture
-    def title_service(self):
-        """Create a TitleService with a mocked agent."""
-        svc = TitleService()
-        svc._agent = AsyncMock()
-        svc._initialized = True
-        return svc
-
-    @pytest.mark.asyncio
-    async def test_generates_clean_title(self, title_service):
-        title_service._agent.run = AsyncMock(return_value="Paint Product Campaign")
-        title = await title_service.generate_title(
-            "I need to create a social media post about paint products for home renovation"
-        )
-        assert title == "Paint Product Campaign"
-
-    @pytest.mark.asyncio
-    async def test_removes_quotation_marks(self, title_service):
-        title_service._agent.run = AsyncMock(return_value='"Social Media Post"')
-        title = await title_service.generate_title("Create a social media post")
-        assert title == "Social Media Post"
-
-    @pytest.mark.asyncio
-    async def test_removes_punctuation(self, title_service):
-        title_service._agent.run = AsyncMock(return_value="Paint Products Campaign.")
-        title = await title_service.generate_title("Post about paint products")
-        assert title == "Paint Products Campaign"
-
-    @pytest.mark.asyncio
-    async def test_truncates_to_four_words(self, title_service):
-        title_service._agent.run = AsyncMock(
-            return_value="Social Media Marketing Campaign Strategy Plan"
-        )
-        title = await title_service.generate_title("Create a social media campaign")
-        assert title == "Social Media Marketing Campaign"
-
-    @pytest.mark.asyncio
-    async def test_collapses_extra_whitespace(self, title_service):
-        title_service._agent.run = AsyncMock(return_value="Paint   Product   Campaign")
-        title = await title_service.generate_title("Paint products post")
-        assert title == "Paint Product Campaign"
-
-    @pytest.mark.asyncio
-    async def test_multiline_response_uses_first_line(self, title_service):
-        title_service._agent.run = AsyncMock(
-            return_value="Paint Campaign\nThis is the title for the conversation"
-        )
-        title = await title_service.generate_title("Paint products")
-        assert title == "Paint Campaign"
+class TestGenerateTitle:
+    """Tests for generate_title() with a fake AI agent."""
+
+    @pytest.fixture(autouse=True)
+    def _reset_agent(self, title_service):
+        """Reset the shared fake agent so replies and call counts never leak."""
+        title_service._agent.reset()
+
+    @pytest.mark.parametrize("agent_response,expected", [
+        pytest.param("Paint Product Campaign", "Paint Product Campaign", id="clean"),
+        pytest.param('"Social Media Post"', "Social Media Post", id="quotation_marks"),
+        pytest.param("Paint Products Campaign.", "Paint Products Campaign", id="punctuation"),
+        pytest.param(
+            "Social Media Marketing Campaign Strategy Plan",
+            "Social Media Marketing Campaign",
+            id="truncates_to_four_words",
+        ),
+        pytest.param("Paint   Product   Campaign", "Paint Product Campaign", id="extra_whitespace"),
+        pytest.param(
+            "Paint Campaign\nThis is the title for the conversation",
+            "Paint Campaign",
+            id="multiline_uses_first_line",
+        ),
+        pytest.param("`Social Media Campaign`", "Social Media Campaign", id="backticks"),
+    ])
+    async def test_normalizes_agent_response(self, title_service, agent_response, expected):
+        title_service._agent.ret = agent_response
+        title = await title_service.generate_title(_MSG_PAINT_RENOVATION)
+        assert title == expected
 
-    @pytest.mark.asyncio
     async def test_empty_input_returns_default(self, title_service):
         title = await title_service.generate_title("")
-        assert title == "New Conversation"
-        title_service._agent.run.assert_not_called()
+        assert title == _DEFAULT_TITLE
+        assert title_service._agent.calls == 0
 
-    @pytest.mark.asyncio
     async def test_none_input_returns_default(self, title_service):
         title = await title_service.generate_title(None)
-        assert title == "New Conversation"
-        title_service._agent.run.assert_not_called()
+        assert title == _DEFAULT_TITLE
+        assert title_service._agent.calls == 0
 
-    @pytest.mark.asyncio
     async def test_agent_exception_uses_fallback(self, title_service):
-        title_service._agent.run = AsyncMock(side_effect=Exception("API error"))
+        title_service._agent.exc = _API_ERROR
         title = await title_service.generate_title(
             "Create a social media post about summer sale"
         )
         assert title == "Create a social media"
 
-    @pytest.mark.asyncio
-    async def test_agent_empty_response_uses_fallback(self, title_service):
-        title_service._agent.run = AsyncMock(return_value="")
+    @pytest.mark.parametrize("agent_response", [
+        pytest.param("", id="empty"),
+        pytest.param('"..."', id="punctuation_only"),
+    ])
+    async def test_agent_empty_response_uses_fallback(self, title_service, agent_response):
+        title_service._agent.ret = agent_response
         title = await title_service.generate_title(
             "Generate marketing copy for electronics"
         )
         assert title == "Generate marketing copy for"
 
-    @pytest.mark.asyncio
-    async def test_uninitialized_service_tries_initialize(self):
-        svc = TitleService()
+    async def test_uninitialized_service_tries_initialize(self, title_cls):
+        svc = title_cls()
         svc._initialized = False
         svc._agent = None
 
-        with patch.object(svc, "initialize") as mock_init:
-            title = await svc.generate_title("Some message here today")
-            mock_init.assert_called_once()
-            # Agent still None → fallback
-            assert title == "Some message here today"
+        calls = []
+        svc.initialize = lambda: calls.append(1)
 
-    @pytest.mark.asyncio
-    async def test_removes_backticks(self, title_service):
-        title_service._agent.run = AsyncMock(return_value="`Social Media Campaign`")
-        title = await title_service.generate_title("Social media campaign")
-        assert title == "Social Media Campaign"
+        title = await svc.generate_title("Some message here today")
+        assert len(calls) == 1
+        # Agent still None → fallback
+        assert title == "Some message here today"
 
 
 # ---------------------------------------------------------------------------
@@ -163,21 +183,24 @@ class TestGenerateTitle:
 
 class TestGetTitleServiceSingleton:
 
-    @patch("services.title_service._title_service", None)
-    @patch("services.title_service.TitleService")
-    def test_creates_new_instance_when_none(self, mock_cls):
-        mock_instance = MagicMock()
-        mock_cls.return_value = mock_instance
-        result = get_title_service()
-        mock_cls.assert_called_once()
-        mock_instance.initialize.assert_called_once()
-        assert result is mock_instance
+    def test_singleton_returns_same_instance(
+        self, monkeypatch, title_module, get_title_service_fn
+    ):
+        created = []
+
+        def make_service():
+            created.append(MagicMock(spec=["initialize"]))
+            return created[-1]
+
+        monkeypatch.setattr(title_module, "_title_service", None)
+        monkeypatch.setattr(title_module, "TitleService", make_service)
+
+        first = get_title_service_fn()
+        second = get_title_service_fn()
 
-    @patch("services.title_service._title_service")
-    def test_returns_existing_instance(self, mock_existing):
-        mock_existing.__bool__ = lambda self: True
-        result = get_title_service()
-        assert result is mock_existing
+        assert first is second
+        assert created == [first]
+        first.initialize.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -188,26 +211,32 @@ class TestGetTitleServiceSingleton:
 class TestTitleServiceInitialize:
     """Tests that initialize wires the chat client with correct config."""
 
-    @patch("services.title_service.app_settings")
-    @patch("services.title_service.DefaultAzureCredential")
-    @patch("services.title_service.OpenAIChatCompletionClient")
-    @patch("services.title_service.Agent")
-    def test_initialize_wires_credential_direct_mode(
-        self, mock_agent, mock_client, mock_cred_cls, mock_settings
-    ):
+    @pytest.fixture
+    def init_deps(self, title_module):
+        """Patch the settings, credential, chat client and agent used by initialize()."""
+        with patch.object(title_module, "app_settings") as settings, \
+             patch.object(title_module, "DefaultAzureCredential") as credential_cls, \
+             patch.object(title_module, "OpenAIChatCompletionClient") as client_cls, \
+             patch.object(title_module, "Agent"):
+            yield SimpleNamespace(
+                settings=settings, credential_cls=credential_cls, client_cls=client_cls
+            )
+
+    def test_initialize_wires_credential_direct_mode(self, title_cls, init_deps):
         """Test that initialize passes credential directly to chat client."""
         mock_credential = MagicMock()
-        mock_cred_cls.return_value = mock_credential
+        init_deps.credential_cls.return_value = mock_credential
+        mock_settings = init_deps.settings
 
         mock_settings.ai_foundry.use_foundry = False
         mock_settings.azure_openai.endpoint = "https://test.openai.azure.com"
         mock_settings.azure_openai.gpt_model = "gpt-4o"
         mock_settings.azure_openai.api_version = "2024-02-15"
 
-        svc = TitleService()
+        svc = title_cls()
         svc.initialize()
 
-        mock_client.assert_called_once_with(
+        init_deps.client_cls.assert_called_once_with(
             azure_endpoint="https://test.openai.azure.com",
             model="gpt-4o",
             api_version="2024-02-15",
@@ -215,16 +244,11 @@ class TestTitleServiceInitialize:
         )
         assert svc._initialized is True
 
-    @patch("services.title_service.app_settings")
-    @patch("services.title_service.DefaultAzureCredential")
-    @patch("services.title_service.OpenAIChatCompletionClient")
-    @patch("services.title_service.Agent")
-    def test_initialize_wires_credential_foundry_mode(
-        self, mock_agent, mock_client, mock_cred_cls, mock_settings
-    ):
+    def test_initialize_wires_credential_foundry_mode(self, title_cls, init_deps):
         """Test that initialize uses Foundry endpoint and model."""
         mock_credential = MagicMock()
-        mock_cred_cls.return_value = mock_credential
+        init_deps.credential_cls.return_value = mock_credential
+        mock_settings = init_deps.settings
 
         mock_settings.ai_foundry.use_foundry = True
         mock_settings.azure_openai.endpoint = "https://foundry.openai.azure.com"
@@ -232,10 +256,10 @@ class TestTitleServiceInitialize:
         mock_settings.azure_openai.gpt_model = "gpt-4o"
         mock_settings.azure_openai.api_version = "2024-02-15"
 
-        svc = TitleService()
+        svc = title_cls()
         svc.initialize()
 
-        mock_client.assert_called_once_with(
+        init_deps.client_cls.assert_called_once_with(
             azure_endpoint="https://foundry.openai.azure.com",
             model="gpt-4o-foundry",
             api_version="2024-02-15",
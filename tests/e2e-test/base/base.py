@@ -17,4 +17,8 @@ class BasePage:
     def is_visible(self, locator):
         """Check if the specified locator is visible."""
         locator.is_visible()
+
+    def _click(self, locator, timeout=10000):
+        """Click the specified locator, relying on Playwright's actionability auto-wait."""
+        locator.click(timeout=timeout)
     
\ No newline at end of file
@@ -2,10 +2,10 @@
 import logging
 import os
 import re
-import math
 from io import BytesIO
-from collections import Counter
+from typing import Final
 
+import numpy as np
 from PIL import Image
 from base.base import BasePage
 
@@ -13,62 +13,66 @@ from playwright.sync_api import expect
 
 logger = logging.getLogger(__name__)
 
+# Separator logged around each flow; built once rather than per call
+_BANNER = "=" * 80
+
 
 class HomePage(BasePage):
     """Page object class for Home Page interactions and validations."""
     # ---------- LOCATORS ----------
-    HOME_PAGE_TEXT = "//span[.='Welcome to your Content Generation Accelerator']"
-    HOME_PAGE_SUBTEXT = "//span[.='Here are the options I can assist you with today']"
-    USER_MESSAGE = "//span[contains(text(),'I need to create a social media post about paint p')]"
-    USER_MESSAGE_2 = "//span[contains(text(),'Generate a social')]"
+    HOME_PAGE_TEXT = "xpath=//span[.='Welcome to your Content Generation Accelerator']"
+    HOME_PAGE_SUBTEXT = "xpath=//span[.='Here are the options I can assist you with today']"
+    USER_MESSAGE = "xpath=//span[contains(text(),'I need to create a social media post about paint p')]"
+    USER_MESSAGE_2 = "xpath=//span[contains(text(),'Generate a social')]"
 
     # Input and send locators
-    ASK_QUESTION_TEXTAREA = "//input[@placeholder='Type a message']"
-    SEND_BUTTON = "//button[@aria-label='Send']"
+    ASK_QUESTION_TEXTAREA = "xpath=//input[@placeholder='Type a message']"
     
     # Response and status locators
-    TYPING_INDICATOR = "//div[@class='typing-indicator']"
-    AGENT = "//*[contains(text(),'PlanningAgent')]"
-    CONFIRM_BRIEF_BUTTON = "//button[normalize-space()='Confirm brief']"
-    BRIEF_CONFIRMED_TEXT = "//div[contains(text(),'Brief Confirmed')]"
-    OLIVE_STONE_TEXT = "(//span[normalize-space()='Olive Stone'])[last()]"
-    OBSIDIAN_TEXT = "(//span[normalize-space()='Obsidian Pearl'])[last()]"
-    GENERATE_CONTENT_BUTTON = "//button[normalize-space()='Generate Content']"
-    ANALYZING_BRIEF_TEXT = "//span[contains(text(),'Processing your request')]"
-    GENERATED_CONTENT_TEXT_OLIVE = "//span[contains(.,'✨ Discover the serene elegance of Olive Stone.')]"
-    GENERATED_CONTENT_TEXT_OBSIDIAN = "//span[contains(.,'✨ Discover the serene elegance of Obsidian Pearl.')]"
-    PAINT_LIST = "//span[.='Here is the list of available paints:']"
-    PRODUCT_SELECTED = "//div[contains(text(),'Products Selected')]"
-    IMAGE_GEN = "//img[@alt='Generated marketing image']"
-    PRODUCT_COLOR_SWATCH = "(//div[contains(text(),'Products Selected')]/following::img)[1]"
-    START_NEW_CHAT = "//button[normalize-space()='Start new chat']"
-    CHAT_HISTORY = "(//div[@style='padding: 8px; cursor: pointer; display: flex; align-items: center; justify-content: space-between; gap: 8px; background-color: transparent; border: 1px solid transparent; border-radius: 6px; margin-left: -8px; margin-right: -8px; transition: background-color 0.15s, border-color 0.15s; opacity: 1; pointer-events: auto;'])[1]"
-    MORE_OPTIONS  = "(//button[@style='min-width: 24px; height: 24px; padding: 2px; color: var(--colorNeutralForeground3);'])[2]"
-    MORE_OPTIONS_DELETE  = "(//button[@style='min-width: 24px; height: 24px; padding: 2px; color: var(--colorNeutralForeground3);'])[3]"
-    RENAME_OPTION = "//span[normalize-space()='Rename']"
-    DELETE_CHAT = "//span[normalize-space()='Delete']"
-    DELETE_BUTTON = "//button[normalize-space()='Delete']"
-    RENAME_CONVERSATION_INPUT = "//input[@placeholder='Enter conversation name']"
-    RENAME_BUTTON = "//button[normalize-space()='Rename']"
-    RENAME_VALIDATION  = "//span[contains(text(),'Conversation name cannot be empty or contain only ')]"
-    CANCEL_BUTTON = "//button[normalize-space()='Cancel']"
-    STOP_GENERATION_BUTTON = "//button[normalize-space()='Stop']"
-    STOPPED_GENERATION_TEXT = "//p[normalize-space()='Generation stopped.']"
-    START_OVER_BUTTON = "//button[normalize-space()='Start over']"
-    START_OVER_VALIDATION_TEXT = "//p[contains(text(),'No problem. Please provide your creative brief aga')]"
-    TYPE_MESSAGE = "//input[@placeholder='Type a message']"
-    DOWNLOAD_IMAGE_BUTTON = "//button[@aria-label='Download image with banner']"
-    CLEAR_ALL_CHAT_HISTORY = "//span[.='Clear all chat history']"
-    CLEAR_ALL_BUTTON = "//button[normalize-space()='Clear All']"
-    NO_CONVERSATIONS_TEXT = "//span[.='No conversations yet']"
-    CHAT_HISTORY_MORE_OPTIONS  = "(//button[@style='min-width: 24px; height: 24px; padding: 2px; color: var(--colorNeutralForeground3);'])[1]"
-    HIDE_CHAT_HISTORY_BUTTON = "//button[@aria-label='Hide chat history']"
-    SHOW_CHAT_HISTORY_BUTTON = "//button[@aria-label='Show chat history']"
+    TYPING_INDICATOR = "xpath=//div[@class='typing-indicator']"
+    AGENT = "xpath=//*[contains(text(),'PlanningAgent')]"
+    BRIEF_CONFIRMED_TEXT = "xpath=//div[contains(text(),'Brief Confirmed')]"
+    OLIVE_STONE_TEXT = "xpath=(//span[normalize-space()='Olive Stone'])[last()]"
+    OBSIDIAN_TEXT = "xpath=(//span[normalize-space()='Obsidian Pearl'])[last()]"
+    ANALYZING_BRIEF_TEXT = "xpath=//span[contains(text(),'Processing your request')]"
+    GENERATED_CONTENT_TEXT_OLIVE = "xpath=//span[contains(.,'✨ Discover the serene elegance of Olive Stone.')]"
+    GENERATED_CONTENT_TEXT_OBSIDIAN = "xpath=//span[contains(.,'✨ Discover the serene elegance of Obsidian Pearl.')]"
+    PAINT_LIST = "xpath=//span[.='Here is the list of available paints:']"
+    PRODUCT_SELECTED = "xpath=//div[contains(text(),'Products Selected')]"
+    IMAGE_GEN = "xpath=//img[@alt='Generated marketing image']"
+    PRODUCT_COLOR_SWATCH = "xpath=(//div[contains(text(),'Products Selected')]/following::img)[1]"
+    # Chat history entries carry test ids; the active conversation is marked
+    # with aria-current, so this matches the first inactive entry.
+    CHAT_HISTORY = "[data-testid='chat-history-item']:not([aria-current]) >> nth=0"
+    RENAME_CONVERSATION_INPUT = "xpath=//input[@placeholder='Enter conversation name']"
+    RENAME_VALIDATION = "xpath=//span[contains(text(),'Conversation name cannot be empty or contain only ')]"
+    STOPPED_GENERATION_TEXT = "xpath=//p[normalize-space()='Generation stopped.']"
+    START_OVER_VALIDATION_TEXT = "xpath=//p[contains(text(),'No problem. Please provide your creative brief aga')]"
+    NO_CONVERSATIONS_TEXT = "xpath=//span[.='No conversations yet']"
+
+    # Selectors above that __init__ binds to cached locators
+    LOCATOR_KEYS = (
+        "HOME_PAGE_TEXT",
+        "HOME_PAGE_SUBTEXT",
+        "ASK_QUESTION_TEXTAREA",
+        "TYPING_INDICATOR",
+        "BRIEF_CONFIRMED_TEXT",
+        "ANALYZING_BRIEF_TEXT",
+        "PRODUCT_SELECTED",
+        "IMAGE_GEN",
+        "PRODUCT_COLOR_SWATCH",
+        "CHAT_HISTORY",
+        "RENAME_CONVERSATION_INPUT",
+        "RENAME_VALIDATION",
+        "STOPPED_GENERATION_TEXT",
+        "START_OVER_VALIDATION_TEXT",
+        "NO_CONVERSATIONS_TEXT",
+    )
 
     # --- ERROR DETECTION PHRASES ---
     # Specific phrases indicating errors in AI responses.
     # Intentionally specific to avoid false positives from normal marketing content.
-    ERROR_PHRASES = [
+    ERROR_PHRASES: Final = (
         "an error occurred", "an error has occurred",
         "internal server error", "something went wrong",
         "unable to process your request", "service unavailable",
@@ -83,25 +87,92 @@ class HomePage(BasePage):
         "we encountered an issue", "could not complete your request",
         "unexpected error occurred", "api returned an error",
         "access denied", "resource not found",
-    ]
+    )
+    # All phrases folded into one case-insensitive alternation, longest first
+    # so the most specific phrase wins, scanning the text in a single pass.
+    ERROR_REGEX = re.compile(
+        "|".join(map(re.escape, sorted(ERROR_PHRASES, key=len, reverse=True))),
+        re.IGNORECASE,
+    )
 
     def __init__(self, page):
         """Initialize the HomePage with a Playwright page instance."""
         super().__init__(page)
         self.page = page
 
+        # Resolve each fixed locator once into self._<name>; Playwright still
+        # re-queries the DOM on every action, so these stay valid across navigations.
+        for key in self.LOCATOR_KEYS:
+            setattr(self, "_" + key.lower(), page.locator(getattr(self, key)))
+
+        # Controls are matched by accessible role/name or test id rather than
+        # by XPath over inline styles and positional indices.
+        self._send_button = page.get_by_role("button", name="Send", exact=True)
+        self._confirm_brief_button = page.get_by_role("button", name="Confirm brief")
+        self._generate_content_button = page.get_by_role("button", name="Generate Content")
+        self._start_new_chat = page.get_by_role("button", name="Start new chat")
+        self._rename_option = page.get_by_role("menuitem", name="Rename")
+        self._delete_chat = page.get_by_role("menuitem", name="Delete")
+        self._delete_button = page.get_by_role("button", name="Delete", exact=True)
+        self._rename_button = page.get_by_role("button", name="Rename", exact=True)
+        self._cancel_button = page.get_by_role("button", name="Cancel", exact=True)
+        self._stop_generation_button = page.get_by_role("button", name="Stop generation")
+        self._start_over_button = page.get_by_role("button", name="Start over")
+        self._download_image_button = page.get_by_role("button", name="Download image with banner")
+        self._clear_all_chat_history = page.get_by_role("menuitem", name="Clear all chat history")
+        self._clear_all_button = page.get_by_role("button", name="Clear All", exact=True)
+        self._chat_history_more_options = page.get_by_test_id("chat-history-more")
+        self._hide_chat_history_button = page.get_by_role("button", name="Hide chat history")
+        self._show_chat_history_button = page.get_by_role("button", name="Show chat history")
+        self._more_options = self._chat_history.get_by_test_id("chat-item-more")
+        self._error_text = page.get_by_text(self.ERROR_REGEX)
+        self._named_chats = {}
+
+    @classmethod
+    def detect_error(cls, text):
+        """Return the first error phrase found in ``text``, or None if there is none."""
+        match = cls.ERROR_REGEX.search(text)
+        return match.group(0) if match else None
+
+    @staticmethod
+    def _is_api_response(path):
+        """Build an expect_response predicate for POST requests to the backend ``path``."""
+        def predicate(response):
+            return (
+                response.request.method == "POST"
+                and response.url.split("?", 1)[0].endswith(path)
+            )
+        return predicate
+
+    @staticmethod
+    def _assert_response_ok(response_info, label):
+        """Fail straight away if the gated backend call did not succeed."""
+        response = response_info.value
+        if not response.ok:
+            raise AssertionError(f"❌ {label} returned HTTP {response.status}")
+
+    def _open_chat_menu(self, option):
+        """Hover the CHAT_HISTORY item, open its MORE_OPTIONS menu and click ``option``."""
+        self._chat_history.hover(timeout=10000)
+        self._click(self._more_options, timeout=10000)
+        self._click(option, timeout=10000)
+
+    def _named_chat(self, name):
+        """Return the (cached) locator for the chat history entry titled ``name``."""
+        if name not in self._named_chats:
+            self._named_chats[name] = self.page.locator(f"xpath=//span[normalize-space()='{name}']")
+        return self._named_chats[name]
+
     def validate_home_page(self):
         """Validate that the home page elements are visible."""
         logger.info("Starting home page validation...")
 
         logger.info("Validating HOME_PAGE_TEXT is visible...")
-        expect(self.page.locator(self.HOME_PAGE_TEXT)).to_be_visible(timeout=10000)
-        self.page.wait_for_timeout(4000)
+        expect(self._home_page_text).to_be_visible(timeout=10000)
         logger.info("✓ HOME_PAGE_TEXT is visible")
 
         logger.info("Validating HOME_PAGE_SUBTEXT is visible...")
-        expect(self.page.locator(self.HOME_PAGE_SUBTEXT)).to_be_visible(timeout=10000)
-        self.page.wait_for_timeout(2000)
+        expect(self._home_page_subtext).to_be_visible(timeout=10000)
         logger.info("✓ HOME_PAGE_SUBTEXT is visible")
 
         logger.info("Home page validation completed successfully!")
@@ -113,17 +184,15 @@ class HomePage(BasePage):
         1. Click on START_NEW_CHAT button
         2. Validate home page elements are visible
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("Starting New Conversation")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             # Step 1: Click on START_NEW_CHAT button
             logger.info("Step 1: Clicking on START_NEW_CHAT button...")
-            start_new_chat_btn = self.page.locator(self.START_NEW_CHAT)
-            expect(start_new_chat_btn).to_be_visible(timeout=10000)
-            start_new_chat_btn.click()
-            self.page.wait_for_timeout(3000)
+            start_new_chat_btn = self._start_new_chat
+            self._click(start_new_chat_btn, timeout=10000)
             logger.info("✓ START_NEW_CHAT button clicked")
 
             # Step 2: Validate home page elements are visible
@@ -131,9 +200,9 @@ class HomePage(BasePage):
             self.validate_home_page()
             logger.info("✓ Home page elements validated")
 
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("New Conversation Started Successfully!")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return {
                 'status': 'PASSED',
@@ -144,7 +213,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to start new conversation: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def validate_chat_history(self):
@@ -153,24 +222,24 @@ class HomePage(BasePage):
         Steps:
         1. Validate CHAT_HISTORY element is visible
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("Starting Chat History Validation")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             # Step 1: Validate CHAT_HISTORY element is visible
             logger.info("Step 1: Waiting for CHAT_HISTORY to be visible...")
-            chat_history = self.page.locator(self.CHAT_HISTORY)
+            chat_history = self._chat_history
             expect(chat_history).to_be_visible(timeout=10000)
             logger.info("✓ CHAT_HISTORY is visible")
 
             # Get count of chat history items
             chat_count = chat_history.count()
-            logger.info(f"Chat history items found: {chat_count}")
+            logger.info("Chat history items found: %s", chat_count)
 
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("Chat History Validation Completed Successfully!")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return {
                 'status': 'PASSED',
@@ -182,7 +251,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to validate chat history: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def show_hide_chat_history(self):
@@ -194,31 +263,27 @@ class HomePage(BasePage):
         3. Validate 'Show chat history' button is visible and click it
         4. Validate chat history panel is shown again (CHAT_HISTORY visible)
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("Starting Show/Hide Chat History Validation")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             # Step 1: Click 'Hide chat history' button
             logger.info("Step 1: Clicking 'Hide chat history' button...")
-            hide_button = self.page.locator(self.HIDE_CHAT_HISTORY_BUTTON)
-            expect(hide_button).to_be_visible(timeout=10000)
-            hide_button.click()
-            self.page.wait_for_timeout(2000)
+            hide_button = self._hide_chat_history_button
+            self._click(hide_button, timeout=10000)
             logger.info("✓ 'Hide chat history' button clicked")
 
             # Step 2: Validate chat history panel is hidden
             logger.info("Step 2: Validating chat history panel is hidden...")
-            chat_history = self.page.locator(self.CHAT_HISTORY)
+            chat_history = self._chat_history
             expect(chat_history).not_to_be_visible(timeout=10000)
             logger.info("✓ Chat history panel is hidden")
 
             # Step 3: Click 'Show chat history' button
             logger.info("Step 3: Clicking 'Show chat history' button...")
-            show_button = self.page.locator(self.SHOW_CHAT_HISTORY_BUTTON)
-            expect(show_button).to_be_visible(timeout=10000)
-            show_button.click()
-            self.page.wait_for_timeout(2000)
+            show_button = self._show_chat_history_button
+            self._click(show_button, timeout=10000)
             logger.info("✓ 'Show chat history' button clicked")
 
             # Step 4: Validate chat history panel is visible again
@@ -226,9 +291,9 @@ class HomePage(BasePage):
             expect(chat_history).to_be_visible(timeout=10000)
             logger.info("✓ Chat history panel is visible again")
 
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("Show/Hide Chat History Validation Completed Successfully!")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return {
                 'status': 'PASSED',
@@ -239,81 +304,54 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to validate show/hide chat history: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def rename_chat_history(self, new_name="updated_chat"):
         """
         Rename a chat history item by hovering, clicking more options, and renaming.
         Steps:
-        1. Hover on CHAT_HISTORY item
-        2. Click on MORE_OPTIONS
-        3. Click on RENAME_OPTION
-        4. Clear RENAME_CONVERSATION_INPUT and enter new name
-        5. Click on RENAME_BUTTON
-        6. Validate the chat history name is updated
+        1. Open the CHAT_HISTORY item's MORE_OPTIONS menu and click RENAME_OPTION
+        2. Clear RENAME_CONVERSATION_INPUT and enter new name
+        3. Click on RENAME_BUTTON
+        4. Validate the chat history name is updated
 
         Args:
             new_name: The new name for the chat history item. Defaults to 'updated_chat'.
         """
-        logger.info("=" * 80)
-        logger.info(f"Starting Rename Chat History to '{new_name}'")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
+        logger.info("Starting Rename Chat History to '%s'", new_name)
+        logger.info(_BANNER)
 
         try:
-            # Step 1: Hover on CHAT_HISTORY item
-            logger.info("Step 1: Hovering on CHAT_HISTORY item...")
-            chat_history = self.page.locator(self.CHAT_HISTORY)
-            expect(chat_history).to_be_visible(timeout=10000)
-            chat_history.hover()
-            self.page.wait_for_timeout(2000)
-            logger.info("✓ Hovered on CHAT_HISTORY item")
-
-            # Step 2: Click on MORE_OPTIONS
-            logger.info("Step 2: Clicking on MORE_OPTIONS...")
-            more_options = self.page.locator(self.MORE_OPTIONS)
-            expect(more_options).to_be_visible(timeout=10000)
-            more_options.click()
-            self.page.wait_for_timeout(2000)
-            logger.info("✓ MORE_OPTIONS clicked")
-
-            # Step 3: Click on RENAME_OPTION
-            logger.info("Step 3: Clicking on RENAME_OPTION...")
-            rename_option = self.page.locator(self.RENAME_OPTION)
-            expect(rename_option).to_be_visible(timeout=10000)
-            rename_option.click()
-            self.page.wait_for_timeout(2000)
+            # Step 1: Open the chat item's menu and choose RENAME_OPTION
+            logger.info("Step 1: Opening chat menu and choosing RENAME_OPTION...")
+            self._open_chat_menu(self._rename_option)
             logger.info("✓ RENAME_OPTION clicked")
 
-            # Step 4: Clear RENAME_CONVERSATION_INPUT and enter new name
-            logger.info(f"Step 4: Clearing input and entering '{new_name}'...")
-            rename_input = self.page.locator(self.RENAME_CONVERSATION_INPUT)
-            expect(rename_input).to_be_visible(timeout=10000)
-            rename_input.click()
-            self.page.wait_for_timeout(1000)
-            rename_input.fill("")
-            self.page.wait_for_timeout(1000)
-            rename_input.fill(new_name)
-            self.page.wait_for_timeout(2000)
-            logger.info(f"✓ Input updated to '{new_name}'")
-
-            # Step 5: Click on RENAME_BUTTON
-            logger.info("Step 5: Clicking on RENAME_BUTTON...")
-            rename_button = self.page.locator(self.RENAME_BUTTON)
-            expect(rename_button).to_be_visible(timeout=10000)
-            rename_button.click()
-            self.page.wait_for_timeout(5000)
+            # Step 2: Clear RENAME_CONVERSATION_INPUT and enter new name
+            logger.info("Step 2: Clearing input and entering '%s'...", new_name)
+            # fill() waits for the input and replaces its value in one call
+            rename_input = self._rename_conversation_input
+            rename_input.fill(new_name, timeout=10000)
+            expect(rename_input).to_have_value(new_name)
+            logger.info("✓ Input updated to '%s'", new_name)
+
+            # Step 3: Click on RENAME_BUTTON
+            logger.info("Step 3: Clicking on RENAME_BUTTON...")
+            rename_button = self._rename_button
+            self._click(rename_button, timeout=10000)
             logger.info("✓ RENAME_BUTTON clicked")
 
-            # Step 6: Validate the chat history name is updated
-            logger.info("Step 6: Validating chat history name is updated...")
-            renamed_item = self.page.locator(f"//span[normalize-space()='{new_name}']")
+            # Step 4: Validate the chat history name is updated
+            logger.info("Step 4: Validating chat history name is updated...")
+            renamed_item = self._named_chat(new_name)
             expect(renamed_item).to_be_visible(timeout=10000)
-            logger.info(f"✓ Chat history successfully renamed to '{new_name}'")
+            logger.info("✓ Chat history successfully renamed to '%s'", new_name)
 
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("Rename Chat History Completed Successfully!")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return {
                 'status': 'PASSED',
@@ -325,7 +363,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to rename chat history: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def validate_rename_empty_validation(self):
@@ -333,76 +371,50 @@ class HomePage(BasePage):
         Validate that the rename button is disabled and a validation message is displayed
         when the conversation name input is cleared (empty).
         Steps:
-        1. Hover on CHAT_HISTORY item
-        2. Click on MORE_OPTIONS
-        3. Click on RENAME_OPTION
-        4. Clear RENAME_CONVERSATION_INPUT to make it empty
-        5. Validate RENAME_BUTTON is disabled
-        6. Validate RENAME_VALIDATION message is displayed
-        7. Click on CANCEL_BUTTON
+        1. Open the CHAT_HISTORY item's MORE_OPTIONS menu and click RENAME_OPTION
+        2. Clear RENAME_CONVERSATION_INPUT to make it empty
+        3. Validate RENAME_BUTTON is disabled
+        4. Validate RENAME_VALIDATION message is displayed
+        5. Click on CANCEL_BUTTON
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("Starting Rename Empty Validation Check")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
-            # Step 1: Hover on CHAT_HISTORY item
-            logger.info("Step 1: Hovering on CHAT_HISTORY item...")
-            chat_history = self.page.locator(self.CHAT_HISTORY)
-            expect(chat_history).to_be_visible(timeout=10000)
-            chat_history.hover()
-            self.page.wait_for_timeout(2000)
-            logger.info("✓ Hovered on CHAT_HISTORY item")
-
-            # Step 2: Click on MORE_OPTIONS
-            logger.info("Step 2: Clicking on MORE_OPTIONS...")
-            more_options = self.page.locator(self.MORE_OPTIONS)
-            expect(more_options).to_be_visible(timeout=10000)
-            more_options.click()
-            self.page.wait_for_timeout(2000)
-            logger.info("✓ MORE_OPTIONS clicked")
-
-            # Step 3: Click on RENAME_OPTION
-            logger.info("Step 3: Clicking on RENAME_OPTION...")
-            rename_option = self.page.locator(self.RENAME_OPTION)
-            expect(rename_option).to_be_visible(timeout=10000)
-            rename_option.click()
-            self.page.wait_for_timeout(2000)
+            # Step 1: Open the chat item's menu and choose RENAME_OPTION
+            logger.info("Step 1: Opening chat menu and choosing RENAME_OPTION...")
+            self._open_chat_menu(self._rename_option)
             logger.info("✓ RENAME_OPTION clicked")
 
-            # Step 4: Clear RENAME_CONVERSATION_INPUT to make it empty
-            logger.info("Step 4: Clearing input to empty...")
-            rename_input = self.page.locator(self.RENAME_CONVERSATION_INPUT)
-            expect(rename_input).to_be_visible(timeout=10000)
-            rename_input.click()
-            self.page.wait_for_timeout(1000)
-            rename_input.fill("")
-            self.page.wait_for_timeout(2000)
+            # Step 2: Clear RENAME_CONVERSATION_INPUT to make it empty
+            logger.info("Step 2: Clearing input to empty...")
+            rename_input = self._rename_conversation_input
+            rename_input.fill("", timeout=10000)
+            expect(rename_input).to_have_value("")
             logger.info("✓ Input cleared to empty")
 
-            # Step 5: Validate RENAME_BUTTON is disabled
-            logger.info("Step 5: Validating RENAME_BUTTON is disabled...")
-            rename_button = self.page.locator(self.RENAME_BUTTON)
+            # Step 3: Validate RENAME_BUTTON is disabled
+            logger.info("Step 3: Validating RENAME_BUTTON is disabled...")
+            rename_button = self._rename_button
             expect(rename_button).to_be_disabled(timeout=10000)
             logger.info("✓ RENAME_BUTTON is disabled")
 
-            # Step 6: Validate RENAME_VALIDATION message is displayed
-            logger.info("Step 6: Validating RENAME_VALIDATION message is displayed...")
-            rename_validation = self.page.locator(self.RENAME_VALIDATION)
+            # Step 4: Validate RENAME_VALIDATION message is displayed
+            logger.info("Step 4: Validating RENAME_VALIDATION message is displayed...")
+            rename_validation = self._rename_validation
             expect(rename_validation).to_be_visible(timeout=10000)
             logger.info("✓ RENAME_VALIDATION message is displayed")
 
-            # Step 7: Click on CANCEL_BUTTON
-            logger.info("Step 7: Clicking on CANCEL_BUTTON...")
-            cancel_button = self.page.locator(self.CANCEL_BUTTON)
-            expect(cancel_button).to_be_visible(timeout=10000)
-            cancel_button.click()
-            self.page.wait_for_timeout(2000)
+            # Step 5: Click on CANCEL_BUTTON
+            logger.info("Step 5: Clicking on CANCEL_BUTTON...")
+            cancel_button = self._cancel_button
+            self._click(cancel_button, timeout=10000)
             logger.info("✓ CANCEL_BUTTON clicked")
 
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("Rename Empty Validation Check Completed Successfully!")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return {
                 'status': 'PASSED',
@@ -413,7 +425,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed rename empty validation check: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def delete_chat_history(self):
@@ -421,71 +433,50 @@ class HomePage(BasePage):
         Delete a chat history item by hovering, clicking more options, and deleting.
         Steps:
         1. Get initial chat history count
-        2. Hover on CHAT_HISTORY item
-        3. Click on MORE_OPTIONS
-        4. Click on DELETE_CHAT
-        5. Click on DELETE_BUTTON to confirm
-        6. Validate chat history item is deleted
+        2. Open the CHAT_HISTORY item's MORE_OPTIONS menu and click DELETE_CHAT
+        3. Click on DELETE_BUTTON to confirm
+        4. Validate chat history item is deleted
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("Starting Delete Chat History")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             # Step 1: Get initial chat history count
             logger.info("Step 1: Getting initial chat history count...")
-            chat_history = self.page.locator(self.CHAT_HISTORY)
+            chat_history = self._chat_history
             initial_count = chat_history.count()
-            logger.info(f"Initial chat history count: {initial_count}")
+            logger.info("Initial chat history count: %s", initial_count)
 
             if not initial_count:
                 error_msg = "No chat history items available to delete"
-                logger.error(f"❌ {error_msg}")
+                logger.error("❌ %s", error_msg)
                 raise AssertionError(error_msg)
 
             # Get text of item to be deleted for validation
             item_to_delete_text = chat_history.text_content()
-            logger.info(f"Chat item to delete: '{item_to_delete_text}'")
-
-            # Step 2: Hover on CHAT_HISTORY item
-            logger.info("Step 2: Hovering on CHAT_HISTORY item...")
-            chat_history.hover()
-            self.page.wait_for_timeout(2000)
-            logger.info("✓ Hovered on CHAT_HISTORY item")
-
-            # Step 3: Click on MORE_OPTIONS
-            logger.info("Step 3: Clicking on MORE_OPTIONS...")
-            more_options = self.page.locator(self.MORE_OPTIONS_DELETE)
-            expect(more_options).to_be_visible(timeout=10000)
-            more_options.click()
-            self.page.wait_for_timeout(2000)
-            logger.info("✓ MORE_OPTIONS clicked")
-
-            # Step 4: Click on DELETE_CHAT
-            logger.info("Step 4: Clicking on DELETE_CHAT...")
-            delete_chat = self.page.locator(self.DELETE_CHAT)
-            expect(delete_chat).to_be_visible(timeout=10000)
-            delete_chat.click()
-            self.page.wait_for_timeout(2000)
+            logger.info("Chat item to delete: '%s'", item_to_delete_text)
+
+            # Step 2: Open the chat item's menu and choose DELETE_CHAT
+            logger.info("Step 2: Opening chat menu and choosing DELETE_CHAT...")
+            self._open_chat_menu(self._delete_chat)
             logger.info("✓ DELETE_CHAT clicked")
 
-            # Step 5: Click on DELETE_BUTTON to confirm
-            logger.info("Step 5: Clicking on DELETE_BUTTON to confirm...")
-            delete_button = self.page.locator(self.DELETE_BUTTON)
-            expect(delete_button).to_be_visible(timeout=10000)
-            delete_button.click()
-            self.page.wait_for_timeout(3000)
+            # Step 3: Click on DELETE_BUTTON to confirm
+            logger.info("Step 3: Clicking on DELETE_BUTTON to confirm...")
+            delete_button = self._delete_button
+            self._click(delete_button, timeout=10000)
             logger.info("✓ DELETE_BUTTON clicked")
 
-            # Step 6: Validate chat history item is deleted
-            logger.info("Step 6: Validating chat history item is deleted...")
-            deleted_item = self.page.locator(f"//span[normalize-space()='{item_to_delete_text.strip()[:50]}']")
+            # Step 4: Validate chat history item is deleted
+            logger.info("Step 4: Validating chat history item is deleted...")
+            deleted_item = self._named_chat(item_to_delete_text.strip()[:50])
             expect(deleted_item).to_have_count(0, timeout=10000)
             logger.info("✓ Chat history item successfully deleted")
 
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("Delete Chat History Completed Successfully!")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return {
                 'status': 'PASSED',
@@ -497,7 +488,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to delete chat history: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def send_prompt(self, quick_link=None):
@@ -514,30 +505,26 @@ class HomePage(BasePage):
         if quick_link is None:
             quick_link = self.USER_MESSAGE
 
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("Starting Send Prompt")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             # Step 1: Click on the quick link
             logger.info("Step 1: Clicking on quick link...")
             user_message = self.page.locator(quick_link)
-            expect(user_message).to_be_visible(timeout=10000)
-            user_message.click()
-            self.page.wait_for_timeout(2000)
+            self._click(user_message, timeout=10000)
             logger.info("✓ Quick link clicked")
 
             # Step 2: Click the SEND_BUTTON to send the prompt
             logger.info("Step 2: Clicking on SEND_BUTTON...")
-            send_button = self.page.locator(self.SEND_BUTTON)
-            expect(send_button).to_be_enabled(timeout=10000)
-            send_button.click()
-            self.page.wait_for_timeout(3000)
+            send_button = self._send_button
+            send_button.click(timeout=10000)
             logger.info("✓ SEND_BUTTON clicked")
 
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("Send Prompt Completed Successfully!")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return {
                 'status': 'PASSED',
@@ -548,7 +535,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to send prompt: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def send_prompt_from_quick_link(self, quick_link=None):
@@ -566,42 +553,42 @@ class HomePage(BasePage):
         if quick_link is None:
             quick_link = self.USER_MESSAGE
 
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("Starting Send Prompt from Quick Link")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             # Step 1: Click on the quick link
             logger.info("Step 1: Clicking on quick link...")
             user_message = self.page.locator(quick_link)
-            expect(user_message).to_be_visible(timeout=10000)
-            user_message.click()
-            self.page.wait_for_timeout(2000)
+            self._click(user_message, timeout=10000)
             logger.info("✓ USER_MESSAGE quick link clicked")
 
             # Step 2: Click the SEND_BUTTON to send the prompt
             logger.info("Step 2: Clicking on SEND_BUTTON...")
-            send_button = self.page.locator(self.SEND_BUTTON)
-            expect(send_button).to_be_enabled(timeout=10000)
-            send_button.click()
-            self.page.wait_for_timeout(3000)
-            logger.info("✓ SEND_BUTTON clicked")
-
-            # Step 3: Validate ANALYZING_BRIEF_TEXT is visible
-            logger.info("Step 3: Waiting for ANALYZING_BRIEF_TEXT to be visible...")
-            analyzing_brief = self.page.locator(self.ANALYZING_BRIEF_TEXT)
-            expect(analyzing_brief).to_be_visible(timeout=40000)
-            logger.info("✓ ANALYZING_BRIEF_TEXT is visible")
-
-            # Step 4: Validate CONFIRM_BRIEF_BUTTON is visible within 40 seconds
+            send_button = self._send_button
+            with self.page.expect_response(
+                self._is_api_response("/api/chat"), timeout=60000
+            ) as chat_response:
+                send_button.click(timeout=10000)
+                logger.info("✓ SEND_BUTTON clicked")
+
+                # Step 3: Validate ANALYZING_BRIEF_TEXT is visible while the request is in flight
+                logger.info("Step 3: Waiting for ANALYZING_BRIEF_TEXT to be visible...")
+                analyzing_brief = self._analyzing_brief_text
+                expect(analyzing_brief).to_be_visible(timeout=40000)
+                logger.info("✓ ANALYZING_BRIEF_TEXT is visible")
+            self._assert_response_ok(chat_response, "Brief analysis")
+
+            # Step 4: Validate CONFIRM_BRIEF_BUTTON is rendered from the chat response
             logger.info("Step 4: Waiting for CONFIRM_BRIEF_BUTTON to be visible...")
-            confirm_brief = self.page.locator(self.CONFIRM_BRIEF_BUTTON)
-            expect(confirm_brief).to_be_visible(timeout=40000)
+            confirm_brief = self._confirm_brief_button
+            expect(confirm_brief).to_be_visible(timeout=5000)
             logger.info("✓ CONFIRM_BRIEF_BUTTON is visible")
 
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("Send Prompt from Quick Link Completed Successfully!")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return {
                 'status': 'PASSED',
@@ -612,7 +599,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to send prompt from quick link: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def confirm_brief(self):
@@ -622,28 +609,30 @@ class HomePage(BasePage):
         1. Click on the CONFIRM_BRIEF_BUTTON
         2. Validate that BRIEF_CONFIRMED_TEXT is visible
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("Starting Confirm Brief")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             # Step 1: Click on the CONFIRM_BRIEF_BUTTON
             logger.info("Step 1: Clicking on CONFIRM_BRIEF_BUTTON...")
-            confirm_brief_btn = self.page.locator(self.CONFIRM_BRIEF_BUTTON)
-            expect(confirm_brief_btn).to_be_visible(timeout=10000)
-            confirm_brief_btn.click()
-            self.page.wait_for_timeout(3000)
+            confirm_brief_btn = self._confirm_brief_button
+            with self.page.expect_response(
+                self._is_api_response("/api/chat"), timeout=60000
+            ) as chat_response:
+                self._click(confirm_brief_btn, timeout=10000)
+            self._assert_response_ok(chat_response, "Brief confirmation")
             logger.info("✓ CONFIRM_BRIEF_BUTTON clicked")
 
             # Step 2: Validate that BRIEF_CONFIRMED_TEXT is visible
             logger.info("Step 2: Waiting for BRIEF_CONFIRMED_TEXT to be visible...")
-            brief_confirmed = self.page.locator(self.BRIEF_CONFIRMED_TEXT)
-            expect(brief_confirmed).to_be_visible(timeout=40000)
+            brief_confirmed = self._brief_confirmed_text
+            expect(brief_confirmed).to_be_visible(timeout=5000)
             logger.info("✓ BRIEF_CONFIRMED_TEXT is visible")
 
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("Confirm Brief Completed Successfully!")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return {
                 'status': 'PASSED',
@@ -654,7 +643,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to confirm brief: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def select_color_and_generate_content(self, color_locator=None, generated_content_locator=None, expected_color="olive"):
@@ -679,47 +668,54 @@ class HomePage(BasePage):
         if generated_content_locator is None:
             generated_content_locator = self.GENERATED_CONTENT_TEXT_OLIVE
 
-        logger.info("=" * 80)
-        logger.info(f"Starting Select Color and Generate Content (expected: {expected_color})")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
+        logger.info("Starting Select Color and Generate Content (expected: %s)", expected_color)
+        logger.info(_BANNER)
 
         try:
             # Step 1: Click on color locator to select the color
             logger.info("Step 1: Clicking on color to select...")
             color_element = self.page.locator(color_locator)
-            expect(color_element).to_be_visible(timeout=40000)
-            color_element.click()
-            self.page.wait_for_timeout(3000)
+            self._click(color_element, timeout=40000)
             logger.info("✓ Color selected")
 
             # Step 2: Validate GENERATE_CONTENT_BUTTON is visible
             logger.info("Step 2: Waiting for GENERATE_CONTENT_BUTTON to be visible...")
-            generate_content_btn = self.page.locator(self.GENERATE_CONTENT_BUTTON)
+            generate_content_btn = self._generate_content_button
             expect(generate_content_btn).to_be_visible(timeout=40000)
             logger.info("✓ GENERATE_CONTENT_BUTTON is visible")
 
             # Step 3: Click on GENERATE_CONTENT_BUTTON
             logger.info("Step 3: Clicking on GENERATE_CONTENT_BUTTON...")
-            generate_content_btn.click()
-            self.page.wait_for_timeout(3000)
+            with self.page.expect_response(
+                self._is_api_response("/api/generate/start"), timeout=60000
+            ) as start_response:
+                generate_content_btn.click()
+            self._assert_response_ok(start_response, "Content generation start")
             logger.info("✓ GENERATE_CONTENT_BUTTON clicked")
 
             # Step 4: Validate TYPING_INDICATOR appears
             logger.info("Step 4: Waiting for TYPING_INDICATOR to appear...")
-            typing_indicator = self.page.locator(self.TYPING_INDICATOR)
+            typing_indicator = self._typing_indicator
             expect(typing_indicator).to_be_visible(timeout=40000)
             logger.info("✓ TYPING_INDICATOR is visible")
 
-            # Step 5: Wait for GENERATED_CONTENT_TEXT to be visible
+            # Step 5: Wait for GENERATED_CONTENT_TEXT to be visible, failing as soon
+            # as an error message shows up instead of sitting out the full timeout
             logger.info("Step 5: Waiting for GENERATED_CONTENT_TEXT to be visible...")
             generated_content = self.page.locator(generated_content_locator)
-            expect(generated_content).to_be_visible(timeout=120000)
+            outcome = generated_content.or_(self._error_text).first
+            expect(outcome).to_be_visible(timeout=120000)
+            error_phrase = self.detect_error(outcome.text_content() or "")
+            if error_phrase:
+                raise AssertionError(
+                    f"❌ Error pattern '{error_phrase}' shown while generating content"
+                )
             logger.info("✓ GENERATED_CONTENT_TEXT is visible")
 
             # Step 6: Validate IMAGE_GEN is visible
-            self.page.wait_for_timeout(5000)
             logger.info("Step 6: Waiting for IMAGE_GEN to be visible...")
-            image_gen = self.page.locator(self.IMAGE_GEN)
+            image_gen = self._image_gen
             expect(image_gen).to_be_visible(timeout=40000)
             logger.info("✓ IMAGE_GEN is visible")
 
@@ -727,9 +723,9 @@ class HomePage(BasePage):
             logger.info("Step 7: Comparing generated image color with selected color swatch...")
             self.validate_color_match_with_swatch(image_gen)
 
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("Select Color and Generate Content Completed Successfully!")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return {
                 'status': 'PASSED',
@@ -740,7 +736,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to select color and generate content: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def stop_generation(self):
@@ -751,28 +747,26 @@ class HomePage(BasePage):
         1. Click on STOP_GENERATION_BUTTON
         2. Validate STOPPED_GENERATION_TEXT is visible
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("Starting Stop Generation")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             # Step 1: Click on STOP_GENERATION_BUTTON
             logger.info("Step 1: Clicking on STOP_GENERATION_BUTTON...")
-            stop_button = self.page.locator(self.STOP_GENERATION_BUTTON)
-            expect(stop_button).to_be_visible(timeout=10000)
-            stop_button.click()
-            self.page.wait_for_timeout(3000)
+            stop_button = self._stop_generation_button
+            self._click(stop_button, timeout=10000)
             logger.info("✓ STOP_GENERATION_BUTTON clicked")
 
             # Step 2: Validate STOPPED_GENERATION_TEXT is visible
             logger.info("Step 2: Waiting for STOPPED_GENERATION_TEXT to be visible...")
-            stopped_text = self.page.locator(self.STOPPED_GENERATION_TEXT)
+            stopped_text = self._stopped_generation_text
             expect(stopped_text).to_be_visible(timeout=10000)
             logger.info("✓ STOPPED_GENERATION_TEXT is visible")
 
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("Stop Generation Completed Successfully!")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return {
                 'status': 'PASSED',
@@ -783,7 +777,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to stop generation: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def start_over(self):
@@ -794,28 +788,26 @@ class HomePage(BasePage):
         1. Click on START_OVER_BUTTON
         2. Validate START_OVER_VALIDATION_TEXT is visible
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("Starting Start Over")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             # Step 1: Click on START_OVER_BUTTON
             logger.info("Step 1: Clicking on START_OVER_BUTTON...")
-            start_over_btn = self.page.locator(self.START_OVER_BUTTON)
-            expect(start_over_btn).to_be_visible(timeout=30000)
-            start_over_btn.click()
-            self.page.wait_for_timeout(3000)
+            start_over_btn = self._start_over_button
+            self._click(start_over_btn, timeout=30000)
             logger.info("✓ START_OVER_BUTTON clicked")
 
             # Step 2: Validate START_OVER_VALIDATION_TEXT is visible
             logger.info("Step 2: Waiting for START_OVER_VALIDATION_TEXT to be visible...")
-            start_over_text = self.page.locator(self.START_OVER_VALIDATION_TEXT)
+            start_over_text = self._start_over_validation_text
             expect(start_over_text).to_be_visible(timeout=40000)
             logger.info("✓ START_OVER_VALIDATION_TEXT is visible")
 
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("Start Over Completed Successfully!")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return {
                 'status': 'PASSED',
@@ -826,7 +818,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to start over: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def validate_input_disabled_during_generation(self):
@@ -837,26 +829,26 @@ class HomePage(BasePage):
         1. Validate ASK_QUESTION_TEXTAREA is disabled
         2. Validate SEND_BUTTON is disabled
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("Starting Input Disabled During Generation Validation")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             # Step 1: Validate ASK_QUESTION_TEXTAREA is disabled
             logger.info("Step 1: Validating ASK_QUESTION_TEXTAREA is disabled...")
-            ask_question = self.page.locator(self.ASK_QUESTION_TEXTAREA)
+            ask_question = self._ask_question_textarea
             expect(ask_question).to_be_disabled(timeout=10000)
             logger.info("✓ ASK_QUESTION_TEXTAREA is disabled")
 
             # Step 2: Validate SEND_BUTTON is disabled
             logger.info("Step 2: Validating SEND_BUTTON is disabled...")
-            send_button = self.page.locator(self.SEND_BUTTON)
+            send_button = self._send_button
             expect(send_button).to_be_disabled(timeout=10000)
             logger.info("✓ SEND_BUTTON is disabled")
 
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("Input Disabled During Generation Validation Completed Successfully!")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return {
                 'status': 'PASSED',
@@ -867,7 +859,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to validate input disabled during generation: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def download_image(self):
@@ -878,14 +870,14 @@ class HomePage(BasePage):
         2. Click on DOWNLOAD_IMAGE_BUTTON and wait for the download event
         3. Validate the downloaded file is not empty
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("Starting Download Image")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             # Step 1: Validate DOWNLOAD_IMAGE_BUTTON is visible
             logger.info("Step 1: Validating DOWNLOAD_IMAGE_BUTTON is visible...")
-            download_btn = self.page.locator(self.DOWNLOAD_IMAGE_BUTTON)
+            download_btn = self._download_image_button
             expect(download_btn).to_be_visible(timeout=10000)
             logger.info("✓ DOWNLOAD_IMAGE_BUTTON is visible")
 
@@ -894,20 +886,19 @@ class HomePage(BasePage):
             with self.page.expect_download() as download_info:
                 download_btn.click()
             download = download_info.value
-            self.page.wait_for_timeout(3000)
-            logger.info(f"✓ Download triggered — file: {download.suggested_filename}")
+            logger.info("✓ Download triggered — file: %s", download.suggested_filename)
 
             # Step 3: Validate the downloaded file is not empty
             logger.info("Step 3: Validating downloaded file is not empty...")
             download_path = download.path()
             file_size = os.path.getsize(download_path)
-            logger.info(f"  Downloaded file size: {file_size} bytes")
+            logger.info("  Downloaded file size: %s bytes", file_size)
             assert file_size > 0, "Downloaded file is empty (0 bytes)"
             logger.info("✓ Downloaded file is not empty")
 
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("Download Image Completed Successfully!")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return {
                 'status': 'PASSED',
@@ -920,7 +911,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to download image: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def clear_all_chat_history(self):
@@ -934,44 +925,38 @@ class HomePage(BasePage):
         3. Click on CLEAR_ALL_BUTTON to confirm
         4. Validate NO_CONVERSATIONS_TEXT is visible
         """
-        logger.info("=" * 80)
+        logger.info(_BANNER)
         logger.info("Starting Clear All Chat History")
-        logger.info("=" * 80)
+        logger.info(_BANNER)
 
         try:
             # Step 1: Click on CHAT_HISTORY_MORE_OPTIONS
             logger.info("Step 1: Clicking on CHAT_HISTORY_MORE_OPTIONS...")
-            more_options = self.page.locator(self.CHAT_HISTORY_MORE_OPTIONS)
-            expect(more_options).to_be_visible(timeout=10000)
-            more_options.click()
-            self.page.wait_for_timeout(2000)
+            more_options = self._chat_history_more_options
+            self._click(more_options, timeout=10000)
             logger.info("✓ CHAT_HISTORY_MORE_OPTIONS clicked")
 
             # Step 2: Click on CLEAR_ALL_CHAT_HISTORY option
             logger.info("Step 2: Clicking on CLEAR_ALL_CHAT_HISTORY...")
-            clear_all_option = self.page.locator(self.CLEAR_ALL_CHAT_HISTORY)
-            expect(clear_all_option).to_be_visible(timeout=10000)
-            clear_all_option.click()
-            self.page.wait_for_timeout(2000)
+            clear_all_option = self._clear_all_chat_history
+            self._click(clear_all_option, timeout=10000)
             logger.info("✓ CLEAR_ALL_CHAT_HISTORY clicked")
 
             # Step 3: Click on CLEAR_ALL_BUTTON to confirm
             logger.info("Step 3: Clicking on CLEAR_ALL_BUTTON to confirm...")
-            clear_all_btn = self.page.locator(self.CLEAR_ALL_BUTTON)
-            expect(clear_all_btn).to_be_visible(timeout=10000)
-            clear_all_btn.click()
-            self.page.wait_for_timeout(3000)
+            clear_all_btn = self._clear_all_button
+            self._click(clear_all_btn, timeout=10000)
             logger.info("✓ CLEAR_ALL_BUTTON clicked")
 
             # Step 4: Validate NO_CONVERSATIONS_TEXT is visible
             logger.info("Step 4: Validating NO_CONVERSATIONS_TEXT is visible...")
-            no_conversations = self.page.locator(self.NO_CONVERSATIONS_TEXT)
+            no_conversations = self._no_conversations_text
             expect(no_conversations).to_be_visible(timeout=10000)
             logger.info("✓ NO_CONVERSATIONS_TEXT is visible — all chat history cleared")
 
-            logger.info("=" * 80)
+            logger.info(_BANNER)
             logger.info("Clear All Chat History Completed Successfully!")
-            logger.info("=" * 80)
+            logger.info(_BANNER)
 
             return {
                 'status': 'PASSED',
@@ -982,7 +967,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to clear all chat history: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     # ---------- RESPONSE VALIDATION METHODS ----------
@@ -999,16 +984,14 @@ class HomePage(BasePage):
             AssertionError: If any error pattern is found in the visible text.
         """
         check_label = f" after '{context}'" if context else ""
-        logger.info(f"🔍 Scanning for error patterns in response{check_label}...")
+        logger.info("🔍 Scanning for error patterns in response%s...", check_label)
 
         try:
             page_text = self.page.inner_text("body")
-            page_text_lower = page_text.lower()
 
-            detected_errors = []
-            for phrase in self.ERROR_PHRASES:
-                if phrase.lower() in page_text_lower:
-                    detected_errors.append(phrase)
+            detected_errors = sorted(
+                {m.group(0).lower() for m in self.ERROR_REGEX.finditer(page_text)}
+            )
 
             if detected_errors:
                 # Extract the specific lines containing error text for context
@@ -1017,8 +1000,7 @@ class HomePage(BasePage):
                     line_stripped = line.strip()
                     if not line_stripped or len(line_stripped) < 5:
                         continue
-                    line_lower = line_stripped.lower()
-                    if any(p.lower() in line_lower for p in detected_errors):
+                    if self.ERROR_REGEX.search(line_stripped):
                         error_lines.append(line_stripped[:300])
 
                 error_msg = (
@@ -1030,12 +1012,12 @@ class HomePage(BasePage):
                 logger.error(error_msg)
                 raise AssertionError(error_msg)
 
-            logger.info(f"✓ No error patterns detected in response{check_label}")
+            logger.info("✓ No error patterns detected in response%s", check_label)
 
         except AssertionError:
             raise
         except Exception as e:
-            logger.warning(f"⚠️ Could not complete error scan: {str(e)}")
+            logger.warning("⚠️ Could not complete error scan: %s", e)
 
     def validate_planning_agent_response_quality(self, extra_keywords=None):
         """
@@ -1077,8 +1059,9 @@ class HomePage(BasePage):
                 raise AssertionError(error_msg)
 
             logger.info(
-                f"✓ PlanningAgent response contains {len(found_keywords)} "
-                f"brief-related keywords: {found_keywords}"
+                "✓ PlanningAgent response contains %s "
+                "brief-related keywords: %s",
+                len(found_keywords), found_keywords
             )
 
             # --- Soft assertion: use-case-specific extra keywords ---
@@ -1087,7 +1070,7 @@ class HomePage(BasePage):
                 found_extra = [kw for kw in extra_keywords if kw.lower() in page_text_lower]
                 missing_extra = [kw for kw in extra_keywords if kw.lower() not in page_text_lower]
                 if found_extra:
-                    logger.info(f"✓ [Soft] Use-case keywords found: {found_extra}")
+                    logger.info("✓ [Soft] Use-case keywords found: %s", found_extra)
                 if missing_extra:
                     warn_msg = (
                         f"⚠️ [Soft] Some use-case keywords not found in PlanningAgent response: "
@@ -1107,7 +1090,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to validate PlanningAgent response: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def validate_brief_confirmed_accuracy(self, expected_keywords=None, extra_fields=None):
@@ -1135,7 +1118,7 @@ class HomePage(BasePage):
         logger.info("🔍 Validating Brief Confirmed section accuracy...")
 
         try:
-            brief_confirmed = self.page.locator(self.BRIEF_CONFIRMED_TEXT)
+            brief_confirmed = self._brief_confirmed_text
             expect(brief_confirmed).to_be_visible(timeout=15000)
             logger.info("✓ Brief Confirmed section is visible")
 
@@ -1150,7 +1133,7 @@ class HomePage(BasePage):
             brief_text = page_text[start_idx:end_idx]
             brief_text_lower = brief_text.lower()
 
-            logger.info(f"  Brief section text (first 500 chars): {brief_text[:500]}")
+            logger.info("  Brief section text (first 500 chars): %s", brief_text[:500])
 
             # --- Hard assertion: base required fields ---
             required_fields = ["overview", "target audience", "deliverable"]
@@ -1164,7 +1147,7 @@ class HomePage(BasePage):
                 logger.error(error_msg)
                 raise AssertionError(error_msg)
 
-            logger.info(f"✓ All required fields present: {required_fields}")
+            logger.info("✓ All required fields present: %s", required_fields)
 
             # --- Soft assertion: extra fields (use-case specific) ---
             soft_warnings = []
@@ -1172,7 +1155,7 @@ class HomePage(BasePage):
                 found_extra = [f for f in extra_fields if f.lower() in brief_text_lower]
                 missing_extra = [f for f in extra_fields if f.lower() not in brief_text_lower]
                 if found_extra:
-                    logger.info(f"✓ [Soft] Extra fields found: {found_extra}")
+                    logger.info("✓ [Soft] Extra fields found: %s", found_extra)
                 if missing_extra:
                     warn_msg = (
                         f"⚠️ [Soft] Some extra fields not found in Brief Confirmed: "
@@ -1197,11 +1180,12 @@ class HomePage(BasePage):
                 raise AssertionError(error_msg)
 
             if missing_keywords:
-                logger.warning(f"⚠️ Some expected keywords not found in brief: {missing_keywords}")
+                logger.warning("⚠️ Some expected keywords not found in brief: %s", missing_keywords)
 
             logger.info(
-                f"✓ Brief content matches campaign — found {len(found_keywords)}/"
-                f"{len(expected_keywords)} keywords: {found_keywords}"
+                "✓ Brief content matches campaign — found %s/"
+                "%s keywords: %s",
+                len(found_keywords), len(expected_keywords), found_keywords
             )
 
             return {
@@ -1216,7 +1200,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to validate Brief Confirmed accuracy: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def validate_generated_copy_accuracy(self, product_name, generated_content_locator=None,  # noqa: ARG002
@@ -1238,7 +1222,7 @@ class HomePage(BasePage):
         Raises:
             AssertionError: If the generated copy fails any hard validation check.
         """
-        logger.info(f"🔍 Validating generated marketing copy for '{product_name}'...")
+        logger.info("🔍 Validating generated marketing copy for '%s'...", product_name)
 
         try:
             page_text = self.page.inner_text("body")
@@ -1251,7 +1235,7 @@ class HomePage(BasePage):
                 )
 
             copy_text = page_text[sparkle_idx:sparkle_idx + 1500].strip()
-            logger.info(f"  Generated copy (first 500 chars): {copy_text[:500]}")
+            logger.info("  Generated copy (first 500 chars): %s", copy_text[:500])
 
             # Hard Validation 1: Minimum length
             if len(copy_text) < min_length:
@@ -1260,7 +1244,7 @@ class HomePage(BasePage):
                     f"Expected at least {min_length} characters.\n"
                     f"Copy: '{copy_text}'"
                 )
-            logger.info(f"✓ Copy length OK: {len(copy_text)} chars (min: {min_length})")
+            logger.info("✓ Copy length OK: %s chars (min: %s)", len(copy_text), min_length)
 
             # Hard Validation 2: Product name mentioned
             if product_name.lower() not in copy_text.lower():
@@ -1268,16 +1252,16 @@ class HomePage(BasePage):
                     f"❌ Product name '{product_name}' not found in generated marketing copy.\n"
                     f"Copy: '{copy_text[:500]}'"
                 )
-            logger.info(f"✓ Product name '{product_name}' found in generated copy")
+            logger.info("✓ Product name '%s' found in generated copy", product_name)
 
             # Hard Validation 3: No error text in the copy
             copy_lower = copy_text.lower()
-            for phrase in self.ERROR_PHRASES:
-                if phrase.lower() in copy_lower:
-                    raise AssertionError(
-                        f"❌ Error pattern '{phrase}' detected in generated marketing copy!\n"
-                        f"Copy: '{copy_text[:500]}'"
-                    )
+            phrase = self.detect_error(copy_text)
+            if phrase:
+                raise AssertionError(
+                    f"❌ Error pattern '{phrase}' detected in generated marketing copy!\n"
+                    f"Copy: '{copy_text[:500]}'"
+                )
             logger.info("✓ No error patterns in generated copy")
 
             # --- Soft assertion: thematic/marketing keywords ---
@@ -1287,7 +1271,7 @@ class HomePage(BasePage):
                 missing_kw = [kw for kw in expected_copy_keywords if kw.lower() not in copy_lower]
                 if found_kw:
                     logger.info(
-                        f"✓ [Soft] Marketing/thematic keywords found in copy: {found_kw}"
+                        "✓ [Soft] Marketing/thematic keywords found in copy: %s", found_kw
                     )
                 if missing_kw:
                     warn_msg = (
@@ -1296,7 +1280,7 @@ class HomePage(BasePage):
                     logger.warning(warn_msg)
                     soft_warnings.append(warn_msg)
 
-            logger.info(f"✓ Generated marketing copy validated successfully for '{product_name}'")
+            logger.info("✓ Generated marketing copy validated successfully for '%s'", product_name)
 
             return {
                 'status': 'PASSED',
@@ -1310,7 +1294,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to validate generated copy: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     def validate_products_selected_section(self, expected_product_name,
@@ -1333,10 +1317,10 @@ class HomePage(BasePage):
         Raises:
             AssertionError: If Products Selected section is missing or shows wrong product.
         """
-        logger.info(f"🔍 Validating Products Selected section for '{expected_product_name}'...")
+        logger.info("🔍 Validating Products Selected section for '%s'...", expected_product_name)
 
         try:
-            products_selected = self.page.locator(self.PRODUCT_SELECTED)
+            products_selected = self._product_selected
             expect(products_selected).to_be_visible(timeout=15000)
             logger.info("✓ Products Selected section is visible")
 
@@ -1351,7 +1335,7 @@ class HomePage(BasePage):
             section_text = page_text[start_idx:end_idx]
             section_text_lower = section_text.lower()
 
-            logger.info(f"  Products section text: {section_text[:400]}")
+            logger.info("  Products section text: %s", section_text[:400])
 
             # --- Hard assertion: product name ---
             if expected_product_name.lower() not in section_text_lower:
@@ -1361,7 +1345,7 @@ class HomePage(BasePage):
                 )
 
             logger.info(
-                f"✓ Product '{expected_product_name}' correctly shown in Products Selected"
+                "✓ Product '%s' correctly shown in Products Selected", expected_product_name
             )
 
             # --- Soft assertion: product attributes ---
@@ -1370,7 +1354,7 @@ class HomePage(BasePage):
                 found_attrs = [a for a in expected_attributes if a.lower() in section_text_lower]
                 missing_attrs = [a for a in expected_attributes if a.lower() not in section_text_lower]
                 if found_attrs:
-                    logger.info(f"✓ [Soft] Product attributes found: {found_attrs}")
+                    logger.info("✓ [Soft] Product attributes found: %s", found_attrs)
                 if missing_attrs:
                     warn_msg = (
                         f"⚠️ [Soft] Some product attributes not found: {missing_attrs}"
@@ -1381,14 +1365,14 @@ class HomePage(BasePage):
             # --- Soft assertion: price ---
             if expected_price_pattern:
                 if expected_price_pattern.lower() in section_text_lower:
-                    logger.info(f"✓ [Soft] Price found: {expected_price_pattern}")
+                    logger.info("✓ [Soft] Price found: %s", expected_price_pattern)
                 else:
                     # Also try a generic price regex as fallback
                     price_match = re.search(r'\$\d+\.\d{2}\s*usd', section_text_lower)
                     if price_match:
                         logger.info(
-                            f"✓ [Soft] Price pattern found (different value): "
-                            f"{price_match.group()}"
+                            "✓ [Soft] Price pattern found (different value): %s",
+                            price_match.group()
                         )
                     else:
                         warn_msg = (
@@ -1409,7 +1393,7 @@ class HomePage(BasePage):
             raise
         except Exception as e:
             error_msg = f"Failed to validate Products Selected: {str(e)}"
-            logger.error(f"❌ {error_msg}")
+            logger.error("❌ %s", error_msg)
             raise AssertionError(error_msg) from e
 
     # ---------- COLOR DEFINITIONS ----------
@@ -1433,48 +1417,42 @@ class HomePage(BasePage):
             tuple: (avg_r, avg_g, avg_b) average RGB values, or None on error.
         """
         try:
-            screenshot_bytes = locator.screenshot()
-            image = Image.open(BytesIO(screenshot_bytes)).convert("RGB")
-            image = image.resize((100, 100))
-            raw = image.tobytes()
-            pixels = [(raw[i], raw[i + 1], raw[i + 2]) for i in range(0, len(raw), 3)]
+            pixels = self._get_image_pixels(locator, size=(100, 100))
+            if pixels is None:
+                return None
 
             # Filter out very dark (near-black) and very bright (near-white) pixels
-            filtered_pixels = [
-                p for p in pixels
-                if not (p[0] < 30 and p[1] < 30 and p[2] < 30)
-                and not (p[0] > 225 and p[1] > 225 and p[2] > 225)
-            ]
-            if not filtered_pixels:
+            near_black = (pixels < 30).all(axis=1)
+            near_white = (pixels > 225).all(axis=1)
+            filtered_pixels = pixels[~(near_black | near_white)]
+            if not len(filtered_pixels):
                 filtered_pixels = pixels
 
-            avg_r = sum(p[0] for p in filtered_pixels) // len(filtered_pixels)
-            avg_g = sum(p[1] for p in filtered_pixels) // len(filtered_pixels)
-            avg_b = sum(p[2] for p in filtered_pixels) // len(filtered_pixels)
-
-            return (avg_r, avg_g, avg_b)
+            avg_r, avg_g, avg_b = filtered_pixels.sum(axis=0) // len(filtered_pixels)
+            return (int(avg_r), int(avg_g), int(avg_b))
         except Exception as e:
-            logger.warning(f"⚠️ Could not extract dominant color: {str(e)}")
+            logger.warning("⚠️ Could not extract dominant color: %s", e)
             return None
 
-    def _get_image_pixels(self, locator):
+    def _get_image_pixels(self, locator, size=(150, 150)):
         """
-        Take a screenshot of the element and return the list of RGB pixel tuples.
+        Take a screenshot of the element and return its RGB pixels.
 
         Args:
             locator: Playwright locator for the element.
+            size: (width, height) the screenshot is resized to before sampling.
 
         Returns:
-            list: List of (r, g, b) tuples, or None on error.
+            numpy.ndarray: (N, 3) int32 array of r, g, b values, or None on error.
         """
         try:
             screenshot_bytes = locator.screenshot()
             image = Image.open(BytesIO(screenshot_bytes)).convert("RGB")
-            image = image.resize((150, 150))
-            raw = image.tobytes()
-            return [(raw[i], raw[i + 1], raw[i + 2]) for i in range(0, len(raw), 3)]
+            # Box-reduce first, then a cheap bilinear pass down to the sample size
+            image = image.resize(size, Image.Resampling.BILINEAR, reducing_gap=2.0)
+            return np.asarray(image, dtype=np.int32).reshape(-1, 3)
         except Exception as e:
-            logger.warning(f"⚠️ Could not get image pixels: {str(e)}")
+            logger.warning("⚠️ Could not get image pixels: %s", e)
             return None
 
     def validate_color_match_with_swatch(self, image_locator, pixel_tolerance=80, min_match_percent=15):
@@ -1502,7 +1480,7 @@ class HomePage(BasePage):
 
         try:
             # Step 1: Extract the swatch color
-            swatch_locator = self.page.locator(self.PRODUCT_COLOR_SWATCH)
+            swatch_locator = self._product_color_swatch
             if swatch_locator.count() == 0:
                 logger.warning("⚠️ PRODUCT_COLOR_SWATCH not found — skipping color comparison.")
                 return
@@ -1512,7 +1490,7 @@ class HomePage(BasePage):
             if swatch_color is None:
                 logger.warning("⚠️ Could not extract swatch color — skipping comparison.")
                 return
-            logger.info(f"  Swatch color → RGB({swatch_color[0]}, {swatch_color[1]}, {swatch_color[2]})")
+            logger.info("  Swatch color → RGB(%s, %s, %s)", *swatch_color)
 
             # Step 2: Get all pixels from the generated image
             image_pixels = self._get_image_pixels(image_locator)
@@ -1521,40 +1499,36 @@ class HomePage(BasePage):
                 return
 
             total_pixels = len(image_pixels)
-            logger.info(f"  Total image pixels analyzed: {total_pixels}")
+            logger.info("  Total image pixels analyzed: %s", total_pixels)
 
             # Step 3: Count pixels that are close to the swatch color
-            matching_pixels = 0
-            for pixel in image_pixels:
-                distance = math.sqrt(
-                    (swatch_color[0] - pixel[0]) ** 2
-                    + (swatch_color[1] - pixel[1]) ** 2
-                    + (swatch_color[2] - pixel[2]) ** 2
-                )
-                if distance <= pixel_tolerance:
-                    matching_pixels += 1
+            # (squared Euclidean distance, so no square root per pixel)
+            distance_sq = ((image_pixels - np.array(swatch_color)) ** 2).sum(axis=1)
+            matching_pixels = int((distance_sq <= pixel_tolerance ** 2).sum())
 
             match_percent = (matching_pixels / total_pixels) * 100
-            logger.info(f"  Matching pixels: {matching_pixels}/{total_pixels} ({match_percent:.1f}%)")
-            logger.info(f"  Required minimum: {min_match_percent}%")
+            logger.info("  Matching pixels: %s/%s (%.1f%%)", matching_pixels, total_pixels, match_percent)
+            logger.info("  Required minimum: %s%%", min_match_percent)
 
             if match_percent >= min_match_percent:
                 logger.info(
-                    f"✓ Product color is present in the generated image — "
-                    f"{match_percent:.1f}% of pixels match the swatch color "
-                    f"(min required: {min_match_percent}%)"
+                    "✓ Product color is present in the generated image — "
+                    "%.1f%% of pixels match the swatch color "
+                    "(min required: %s%%)",
+                    match_percent, min_match_percent
                 )
             else:
                 logger.warning(
-                    f"⚠️ Product color is NOT prominently present in the generated image. "
-                    f"Only {match_percent:.1f}% of pixels match the swatch "
-                    f"RGB({swatch_color[0]}, {swatch_color[1]}, {swatch_color[2]}) "
-                    f"(min required: {min_match_percent}%). "
-                    f"This is a soft check — AI-generated images may vary."
+                    "⚠️ Product color is NOT prominently present in the generated image. "
+                    "Only %.1f%% of pixels match the swatch "
+                    "RGB(%s, %s, %s) "
+                    "(min required: %s%%). "
+                    "This is a soft check — AI-generated images may vary.",
+                    match_percent, *swatch_color, min_match_percent
                 )
 
         except Exception as e:
-            logger.warning(f"⚠️ Color swatch comparison failed: {str(e)}")
+            logger.warning("⚠️ Color swatch comparison failed: %s", e)
 
     def validate_image_dominant_color(self, image_locator, expected_color, min_match_percent=15):
         """
@@ -1568,11 +1542,14 @@ class HomePage(BasePage):
             expected_color: Key from COLOR_RANGES (e.g., 'olive', 'green', 'beige', 'brown')
             min_match_percent: Minimum percentage of pixels that must match (default: 15%)
         """
-        logger.info(f"Analyzing image for '{expected_color}' color presence...")
+        logger.info("Analyzing image for '%s' color presence...", expected_color)
 
         try:
             if expected_color not in self.COLOR_RANGES:
-                logger.warning(f"⚠️ Unknown expected color '{expected_color}'. Available: {list(self.COLOR_RANGES.keys())}")
+                logger.warning(
+                    "⚠️ Unknown expected color '%s'. Available: %s",
+                    expected_color, list(self.COLOR_RANGES.keys())
+                )
                 return
 
             color_range = self.COLOR_RANGES[expected_color]
@@ -1589,30 +1566,39 @@ class HomePage(BasePage):
             total_pixels = len(image_pixels)
 
             # Count pixels that fall within the expected color range
-            matching_pixels = 0
-            for r, g, b in image_pixels:
-                if r_min <= r <= r_max and g_min <= g <= g_max and b_min <= b <= b_max:
-                    matching_pixels += 1
+            r, g, b = image_pixels.T
+            in_range = (
+                (r >= r_min) & (r <= r_max)
+                & (g >= g_min) & (g <= g_max)
+                & (b >= b_min) & (b <= b_max)
+            )
+            matching_pixels = int(in_range.sum())
 
             match_percent = (matching_pixels / total_pixels) * 100
-            logger.info(f"  Expected color: '{expected_color}' ({color_range['description']})")
-            logger.info(f"  Range: R({r_min}-{r_max}), G({g_min}-{g_max}), B({b_min}-{b_max})")
-            logger.info(f"  Matching pixels: {matching_pixels}/{total_pixels} ({match_percent:.1f}%)")
-            logger.info(f"  Required minimum: {min_match_percent}%")
+            logger.info("  Expected color: '%s' (%s)", expected_color, color_range['description'])
+            logger.info(
+                "  Range: R(%s-%s), G(%s-%s), B(%s-%s)",
+                r_min, r_max, g_min, g_max, b_min, b_max
+            )
+            logger.info("  Matching pixels: %s/%s (%.1f%%)", matching_pixels, total_pixels, match_percent)
+            logger.info("  Required minimum: %s%%", min_match_percent)
 
             if match_percent >= min_match_percent:
                 logger.info(
-                    f"✓ '{expected_color}' color is present in the generated image — "
-                    f"{match_percent:.1f}% of pixels match (min required: {min_match_percent}%)"
+                    "✓ '%s' color is present in the generated image — "
+                    "%.1f%% of pixels match (min required: %s%%)",
+                    expected_color, match_percent, min_match_percent
                 )
             else:
                 logger.warning(
-                    f"⚠️ '{expected_color}' ({color_range['description']}) is NOT prominently "
-                    f"present in the generated image. Only {match_percent:.1f}% of pixels match "
-                    f"the range R({r_min}-{r_max}), G({g_min}-{g_max}), B({b_min}-{b_max}) "
-                    f"(min required: {min_match_percent}%). "
-                    f"This is a soft check — AI-generated images may vary."
+                    "⚠️ '%s' (%s) is NOT prominently "
+                    "present in the generated image. Only %.1f%% of pixels match "
+                    "the range R(%s-%s), G(%s-%s), B(%s-%s) "
+                    "(min required: %s%%). "
+                    "This is a soft check — AI-generated images may vary.",
+                    expected_color, color_range['description'], match_percent,
+                    r_min, r_max, g_min, g_max, b_min, b_max, min_match_percent
                 )
 
         except Exception as e:
-            logger.warning(f"⚠️ Could not analyze image dominant color: {str(e)}")
+            logger.warning("⚠️ Could not analyze image dominant color: %s", e)
@@ -17,17 +17,39 @@ import pytest
 SCREENSHOTS_DIR = os.path.join(os.path.dirname(__file__), "screenshots")
 os.makedirs(SCREENSHOTS_DIR, exist_ok=True)
 
+# Headed locally so runs can be watched; headless on CI agents
+HEADLESS = bool(os.getenv("CI"))
+CI_BROWSER_ARGS = ["--disable-gpu", "--disable-dev-shm-usage"]
+
+# Turn off CSS transitions/animations so elements settle on the first poll
+DISABLE_ANIMATIONS_SCRIPT = """
+document.addEventListener("DOMContentLoaded", () => {
+  const style = document.createElement("style");
+  style.textContent =
+    "*, *::before, *::after { transition: none !important; animation: none !important; }";
+  document.head.appendChild(style);
+});
+"""
+
 
 @pytest.fixture(scope="session")
 def login_logout():
     # perform login and browser close once in a session
     with sync_playwright() as p:
-        browser = p.chromium.launch(headless=False, args=["--start-maximized"])
+        if HEADLESS:
+            # A headless window can't be maximized, so give it a fixed desktop viewport
+            browser = p.chromium.launch(headless=True, args=CI_BROWSER_ARGS)
+            viewport_options = {"viewport": {"width": 1920, "height": 1080}}
+        else:
+            browser = p.chromium.launch(headless=False, args=["--start-maximized"])
+            viewport_options = {"no_viewport": True}
         # Create context with cleared cache - no storage state is persisted
         context = browser.new_context(
-            no_viewport=True,
+            **viewport_options,
+            reduced_motion="reduce",
             storage_state=None  # Ensures fresh start with no cached data
         )
+        context.add_init_script(DISABLE_ANIMATIONS_SCRIPT)
         context.set_default_timeout(80000)
         page = context.new_page()
         
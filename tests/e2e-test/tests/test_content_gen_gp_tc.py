@@ -25,7 +25,6 @@ def test_validate_gp(login_logout, request):
     """
     page = login_logout
     page.goto(URL)
-    page.wait_for_timeout(3000)
     home = HomePage(page)
     request.node._nodeid = "Golden Path - Content Generation - test golden path works properly"
     start_time = time.time()
@@ -150,7 +149,6 @@ def test_validate_chat_history_panel(login_logout, request):
     """
     page = login_logout
     page.goto(URL)
-    page.wait_for_timeout(3000)
     home = HomePage(page)
     request.node._nodeid = "Content Generation - Chat History Panel displayed"
     start_time = time.time()
@@ -212,7 +210,6 @@ def test_validate_rename_chat_history(login_logout, request):
     """
     page = login_logout
     page.goto(URL)
-    page.wait_for_timeout(3000)
     home = HomePage(page)
     request.node._nodeid = "Content Generation - Chat History - Rename the chat name"
     start_time = time.time()
@@ -256,7 +253,6 @@ def test_validate_delete_chat_history(login_logout, request):
     """
     page = login_logout
     page.goto(URL)
-    page.wait_for_timeout(3000)
     home = HomePage(page)
     request.node._nodeid = "Content Generation - Chat History - Delete the chat"
     start_time = time.time()
@@ -319,7 +315,6 @@ def test_validate_rename_empty_validation(login_logout, request):
     """
     page = login_logout
     page.goto(URL)
-    page.wait_for_timeout(3000)
     home = HomePage(page)
     request.node._nodeid = "Content Generation - Chat History - User should get a validation or the rename button needs to be disabled"
     start_time = time.time()
@@ -361,7 +356,6 @@ def test_validate_stop_generation(login_logout, request):
     """
     page = login_logout
     page.goto(URL)
-    page.wait_for_timeout(3000)
     home = HomePage(page)
     request.node._nodeid = "Content Generation - Response - Stop generation"
     start_time = time.time()
@@ -408,7 +402,6 @@ def test_validate_start_over(login_logout, request):
     """
     page = login_logout
     page.goto(URL)
-    page.wait_for_timeout(3000)
     home = HomePage(page)
     request.node._nodeid = "Content Generation - Response - Start over"
     start_time = time.time()
@@ -458,7 +451,6 @@ def test_validate_start_new_chat(login_logout, request):
     """
     page = login_logout
     page.goto(URL)
-    page.wait_for_timeout(3000)
     home = HomePage(page)
     request.node._nodeid = "Content Generation - Response - Start new chat"
     start_time = time.time()
@@ -522,7 +514,6 @@ def test_validate_input_disabled_during_generation(login_logout, request):
     """
     page = login_logout
     page.goto(URL)
-    page.wait_for_timeout(3000)
     home = HomePage(page)
     request.node._nodeid = "Content Generation - Response - Input disabled during response generation"
     start_time = time.time()
@@ -571,7 +562,6 @@ def test_validate_download_image(login_logout, request):
     """
     page = login_logout
     page.goto(URL)
-    page.wait_for_timeout(3000)
     home = HomePage(page)
     request.node._nodeid = "Content Generation - Response - Download image"
     start_time = time.time()
@@ -632,7 +622,6 @@ def test_validate_show_hide_chat_history(login_logout, request):
     """
     page = login_logout
     page.goto(URL)
-    page.wait_for_timeout(3000)
     home = HomePage(page)
     request.node._nodeid = "Content Generation - Validate show/hide chat history"
     start_time = time.time()
@@ -665,7 +654,6 @@ def test_validate_clear_all_chat_history(login_logout, request):
     """
     page = login_logout
     page.goto(URL)
-    page.wait_for_timeout(3000)
     home = HomePage(page)
     request.node._nodeid = "Content Generation - Validate clear all chat history"
     start_time = time.time()